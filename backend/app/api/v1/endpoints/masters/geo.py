@@ -0,0 +1,116 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, status, Query
+from sqlalchemy.orm import Session
+
+from app.database.db import get_db
+from app.core import auth_service as AuthService
+from app.core.permissions import check_permission
+from app.utils.responses import Response
+from app.schemas.masters.DefaultResponse import DefaultResponse
+from app.schemas.masters.geo import ZipRangeBulkCreate
+from app.services.masters import geo_service as GeoService
+
+router = APIRouter()
+
+# Helper for consistent error handling
+def handle_exception(e: Exception, msg: str, code: int = 500):
+    return Response(
+        message=f"{msg}: {str(e)}",
+        status_code=code,
+        json_data=None
+    )
+
+
+# ---------------- RESOLVE ZIP ----------------
+@router.get(
+    "/resolve",
+    response_model=DefaultResponse,
+    dependencies=[check_permission(2, "/cities", "view")],
+    status_code=status.HTTP_200_OK
+)
+def resolve_zip(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    zip: str = Query(..., description="Zip / PIN code; non-digits are ignored"),
+    db: Session = Depends(get_db)
+):
+    try:
+        result = GeoService.resolve(db, zip)
+        if not result:
+            return handle_exception(Exception(f"No city covers zip code '{zip}'"), "Resolving zip code failed", 404)
+        return Response(
+            json_data=result,
+            message="Zip code resolved successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Resolving zip code failed", getattr(e, "status_code", 500))
+
+
+# ---------------- LIST ZIP RANGES ----------------
+@router.get(
+    "/zip-ranges",
+    response_model=DefaultResponse,
+    dependencies=[check_permission(2, "/cities", "view")],
+    status_code=status.HTTP_200_OK
+)
+def list_zip_ranges(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    city_id: int = Query(...),
+    db: Session = Depends(get_db)
+):
+    try:
+        result = GeoService.get_zip_ranges(db, city_id)
+        return Response(
+            json_data=result,
+            message="Zip ranges fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Fetching zip ranges failed", getattr(e, "status_code", 500))
+
+
+# ---------------- ADD ZIP RANGES ----------------
+@router.post(
+    "/zip-ranges",
+    response_model=DefaultResponse,
+    dependencies=[check_permission(2, "/cities", "edit")],
+    status_code=status.HTTP_201_CREATED
+)
+def add_zip_ranges(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    data: ZipRangeBulkCreate,
+    db: Session = Depends(get_db)
+):
+    try:
+        result = GeoService.add_zip_ranges(db, data.ranges, login_id=current_user.id)
+        return Response(
+            json_data=result,
+            message="Zip ranges added successfully",
+            status_code=status.HTTP_201_CREATED
+        )
+    except Exception as e:
+        return handle_exception(e, "Adding zip ranges failed", getattr(e, "status_code", 500))
+
+
+# ---------------- DELETE ZIP RANGE ----------------
+@router.delete(
+    "/zip-ranges/{range_id}",
+    response_model=DefaultResponse,
+    dependencies=[check_permission(2, "/cities", "edit")],
+    status_code=status.HTTP_200_OK
+)
+def delete_zip_range(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    range_id: int,
+    db: Session = Depends(get_db)
+):
+    try:
+        if not GeoService.delete_zip_range(db, range_id):
+            return handle_exception(Exception("Zip range not found"), "Deleting zip range failed", 404)
+        return Response(
+            json_data={"id": range_id},
+            message="Zip range deleted successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Deleting zip range failed", getattr(e, "status_code", 500))
@@ -0,0 +1,249 @@
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, status, Query, UploadFile, File, Header
+from fastapi import Response as HTTPResponse
+from sqlalchemy.orm import Session
+
+from app.database.db import get_db
+from app.core import auth_service as AuthService
+from app.core.permissions import check_permission
+from app.utils.responses import Response
+from app.utils import etag as ETag
+from app.utils.export_helper.generic_exporter import export_to_csv
+from app.services.masters import master_service as MasterService
+from app.services.masters.master_service import MasterSpec
+
+
+# Helper for consistent error handling
+def handle_exception(e: Exception, msg: str, code: int = 500):
+    return Response(
+        message=f"{msg}: {str(e)}",
+        status_code=code,
+        json_data=None
+    )
+
+
+def build_master_router(spec: MasterSpec) -> APIRouter:
+    """CRUD, CSV import / export and conditional requests for one master, driven by its spec."""
+    router = APIRouter()
+    module_id, path = spec.permission
+    create_schema, update_schema = spec.create_schema, spec.update_schema
+    not_found = f"{spec.label} not found"
+
+    # Masters with a parent take it as a list filter, e.g. /states?country_id=
+    if spec.parent_column:
+        def parent_filter(parent_id: Optional[int] = Query(None, alias=spec.parent_column)) -> Optional[int]:
+            return parent_id
+    else:
+        def parent_filter() -> None:
+            return None
+
+    # ---------------- CREATE ----------------
+    @router.post(
+        "/",
+        response_model=spec.response_model,
+        dependencies=[check_permission(module_id, path, "create")],
+        status_code=status.HTTP_201_CREATED
+    )
+    def create_record(
+        current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+        data: create_schema,
+        response: HTTPResponse,
+        db: Session = Depends(get_db)
+    ):
+        try:
+            result = MasterService.create(db, spec, data, login_id=current_user.id)
+            response.headers["ETag"] = MasterService.record_etag(spec, result)
+            return Response(
+                json_data=result,
+                message=f"{spec.label} created successfully",
+                status_code=status.HTTP_201_CREATED
+            )
+        except Exception as e:
+            return handle_exception(e, f"Creating {spec.label} failed", getattr(e, "status_code", 500))
+
+    # ---------------- UPSERT ----------------
+    @router.post(
+        "/upsert",
+        response_model=spec.response_model,
+        dependencies=[check_permission(module_id, path, "create"), check_permission(module_id, path, "edit")],
+        status_code=status.HTTP_200_OK
+    )
+    def upsert_record(
+        current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+        data: create_schema,
+        response: HTTPResponse,
+        db: Session = Depends(get_db)
+    ):
+        """Create the record with this name, or update the existing one; safe to repeat."""
+        try:
+            result, created = MasterService.upsert(db, spec, data, login_id=current_user.id)
+            response.status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
+            response.headers["ETag"] = MasterService.record_etag(spec, result)
+            return Response(
+                json_data=result,
+                message=f"{spec.label} {'created' if created else 'updated'} successfully",
+                status_code=response.status_code
+            )
+        except Exception as e:
+            return handle_exception(e, f"Upserting {spec.label} failed", getattr(e, "status_code", 500))
+
+    # ---------------- LIST ----------------
+    @router.get(
+        "/",
+        response_model=spec.response_model,
+        dependencies=[check_permission(module_id, path, "view")],
+        status_code=status.HTTP_200_OK,
+        response_model_exclude_unset=True
+    )
+    def list_records(
+        current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+        response: HTTPResponse,
+        db: Session = Depends(get_db),
+        limit: int = Query(10, ge=1, le=100),
+        page: int = Query(1, ge=1),
+        search: Optional[str] = Query(None),
+        fields: Optional[str] = Query(None, description="Comma separated columns to return"),
+        parent_id: Optional[int] = Depends(parent_filter),
+        if_none_match: Optional[str] = Header(None)
+    ):
+        try:
+            offset = (page - 1) * limit
+            result = MasterService.get_page(db, spec, skip=offset, limit=limit, search=search, fields=fields, parent_id=parent_id)
+            etag = ETag.payload_etag(result)
+            if ETag.matches(if_none_match, etag):
+                return ETag.not_modified(etag)
+            response.headers["ETag"] = etag
+            return Response(
+                json_data=result,
+                message=f"{spec.plural} fetched successfully",
+                status_code=status.HTTP_200_OK
+            )
+        except Exception as e:
+            return handle_exception(e, f"Fetching {spec.plural} failed", getattr(e, "status_code", 500))
+
+    # ---------------- EXPORT ----------------
+    if spec.export_schema is not None:
+        @router.get(
+            "/export",
+            response_model=spec.export_schema,
+            dependencies=[check_permission(module_id, path, "export")],
+            status_code=status.HTTP_200_OK
+        )
+        def export_records(
+            current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+            db: Session = Depends(get_db)
+        ):
+            try:
+                rows = MasterService.export_rows(db, spec)
+                return export_to_csv(rows, spec.export_schema, filename=f"{spec.key}.csv")
+            except Exception as e:
+                return handle_exception(e, f"{spec.label} export failed", getattr(e, "status_code", 500))
+
+    # ---------------- IMPORT ----------------
+    @router.post(
+        "/import-csv/",
+        status_code=status.HTTP_200_OK,
+        dependencies=[check_permission(module_id, path, "import")]
+    )
+    def import_records(
+        current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+        file: UploadFile = File(...),
+        db: Session = Depends(get_db)
+    ):
+        try:
+            result = MasterService.import_csv(db, spec, file.file.read(), login_id=current_user.id)
+            return Response(
+                json_data=result,
+                message=f"{result['imported']} records imported successfully.",
+                status_code=status.HTTP_200_OK
+            )
+        except Exception as e:
+            return handle_exception(e, f"Importing {spec.plural} failed", getattr(e, "status_code", 500))
+
+    # ---------------- GET BY ID ----------------
+    @router.get(
+        "/{record_id}",
+        response_model=spec.response_model,
+        dependencies=[check_permission(module_id, path, "view")],
+        status_code=status.HTTP_200_OK
+    )
+    def get_record(
+        current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+        record_id: int,
+        response: HTTPResponse,
+        if_none_match: Optional[str] = Header(None),
+        db: Session = Depends(get_db)
+    ):
+        try:
+            result = MasterService.get_record(db, spec, record_id)
+            if not result:
+                return handle_exception(Exception(not_found), f"Fetching {spec.label} by ID failed", 404)
+            etag = MasterService.record_etag(spec, result)
+            if ETag.matches(if_none_match, etag):
+                return ETag.not_modified(etag)
+            response.headers["ETag"] = etag
+            return Response(
+                json_data=result,
+                message=f"{spec.label} fetched successfully",
+                status_code=status.HTTP_200_OK
+            )
+        except Exception as e:
+            return handle_exception(e, f"Failed to fetch {spec.label}", getattr(e, "status_code", 500))
+
+    # ---------------- UPDATE ----------------
+    @router.put(
+        "/{record_id}",
+        response_model=spec.response_model,
+        dependencies=[check_permission(module_id, path, "edit")],
+        status_code=status.HTTP_200_OK
+    )
+    def update_record(
+        current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+        record_id: int,
+        data: update_schema,
+        response: HTTPResponse,
+        if_match: Optional[str] = Header(None, description="ETag from the last fetch; the update is refused with 412 if the record changed since"),
+        db: Session = Depends(get_db)
+    ):
+        try:
+            updated = MasterService.update_record(db, spec, record_id, data, current_user.id, if_match)
+            if not updated:
+                return handle_exception(Exception(not_found), f"Updating {spec.label} failed", 404)
+            response.headers["ETag"] = MasterService.record_etag(spec, updated)
+            return Response(
+                json_data=updated,
+                message=f"{spec.label} updated successfully",
+                status_code=status.HTTP_200_OK
+            )
+        except Exception as e:
+            ETag.mirror_precondition_failure(response, e)
+            return handle_exception(e, f"{spec.label} update failed", getattr(e, "status_code", 500))
+
+    # ---------------- DELETE ----------------
+    @router.delete(
+        "/{record_id}",
+        response_model=spec.response_model,
+        dependencies=[check_permission(module_id, path, "delete")],
+        status_code=status.HTTP_200_OK
+    )
+    def delete_record(
+        current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+        record_id: int,
+        response: HTTPResponse,
+        if_match: Optional[str] = Header(None, description="ETag from the last fetch; the delete is refused with 412 if the record changed since"),
+        db: Session = Depends(get_db)
+    ):
+        try:
+            deleted = MasterService.delete_record(db, spec, record_id, current_user.id, if_match)
+            if not deleted:
+                return handle_exception(Exception(not_found), f"Deleting {spec.label} failed", 404)
+            return Response(
+                json_data=deleted,
+                message=f"{spec.label} deleted successfully",
+                status_code=status.HTTP_200_OK
+            )
+        except Exception as e:
+            ETag.mirror_precondition_failure(response, e)
+            return handle_exception(e, f"Deleting {spec.label} failed", getattr(e, "status_code", 500))
+
+    return router
@@ -0,0 +1,152 @@
+from typing import Optional, Annotated
+from decimal import Decimal
+from fastapi import APIRouter, Depends, status, Query
+from sqlalchemy.orm import Session
+from app.database.db import get_db
+from app.core import auth_service as AuthService
+from app.schemas.sales.DefaultResponse import SalesResponse
+from app.utils.responses import Response
+from app.services.sales import company_financials_service as FinancialsService
+from app.services.sales import geo_rollup_service as GeoRollupService
+from app.core.permissions import check_permission
+
+router = APIRouter()
+
+#---------- Helper Function for Consistent Error Handling ----------
+def handle_exception(e: Exception, msg: str, code: int = 500):
+    return SalesResponse(
+        message=f"{msg}: {str(e)}",
+        status_code=code,
+        data=None
+    )
+
+#---------- Revenue Bands ----------
+@router.get("/revenue-bands", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def revenue_bands(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    industry_segment_id: Optional[int] = Query(None),
+    account_region_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db)
+):
+    try:
+        result = FinancialsService.get_revenue_bands(db, industry_segment_id, account_region_id)
+        return Response(
+            json_data=result,
+            message="Revenue bands fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching revenue bands", getattr(e, "status_code", 500))
+
+#---------- Top Companies By Turnover ----------
+@router.get("/top-companies", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def top_companies(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    limit: int = Query(10, ge=1, le=100),
+    industry_segment_id: Optional[int] = Query(None),
+    account_region_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db)
+):
+    try:
+        result = FinancialsService.get_top_companies(db, limit, industry_segment_id, account_region_id)
+        return Response(
+            json_data=result,
+            message="Top companies fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching top companies", getattr(e, "status_code", 500))
+
+#---------- Year-on-Year Growth ----------
+@router.get("/growth", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def turnover_growth(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    direction: str = Query("top", description="top = fastest growing, bottom = fastest shrinking"),
+    limit: int = Query(10, ge=1, le=100),
+    min_turnover: Optional[Decimal] = Query(None, ge=0, description="Ignore companies below this latest turnover"),
+    industry_segment_id: Optional[int] = Query(None),
+    account_region_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db)
+):
+    try:
+        result = FinancialsService.get_growth(db, limit, direction, min_turnover, industry_segment_id, account_region_id)
+        return Response(
+            json_data=result,
+            message="Turnover growth fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching turnover growth", getattr(e, "status_code", 500))
+
+#---------- Totals By Segment / Region ----------
+@router.get("/segments", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def segment_totals(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    group_by: str = Query("industry_segment", description="industry_segment or region"),
+    db: Session = Depends(get_db)
+):
+    try:
+        result = FinancialsService.get_segment_totals(db, group_by)
+        return Response(
+            json_data=result,
+            message="Segment totals fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching segment totals", getattr(e, "status_code", 500))
+
+#---------- Rebuild Rollups ----------
+@router.post("/refresh", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+def refresh_rollups(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    db: Session = Depends(get_db)
+):
+    try:
+        refreshed = FinancialsService.refresh_all(db)
+        db.commit()
+        return Response(
+            json_data={"refreshed": refreshed},
+            message="Financial rollups rebuilt successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        db.rollback()
+        return handle_exception(e, "Error rebuilding financial rollups", getattr(e, "status_code", 500))
+
+#---------- Territory Counts ----------
+@router.get("/territories", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def territory_counts(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    level: str = Query("country", description="country, state (needs country_id) or city (needs country_id and state_id)"),
+    address_type_id: Optional[int] = Query(None, description="Only addresses of this type; default any type"),
+    country_id: Optional[int] = Query(None),
+    state_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db)
+):
+    try:
+        result = GeoRollupService.get_territories(db, level, address_type_id, country_id, state_id)
+        return Response(
+            json_data=result,
+            message="Territory counts fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching territory counts", getattr(e, "status_code", 500))
+
+#---------- Rebuild Territory Counts ----------
+@router.post("/territories/rebuild", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+def rebuild_territory_counts(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    db: Session = Depends(get_db)
+):
+    try:
+        rows = GeoRollupService.rebuild(db)
+        db.commit()
+        return Response(
+            json_data={"rows": rows},
+            message="Territory counts rebuilt successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        db.rollback()
+        return handle_exception(e, "Error rebuilding territory counts", getattr(e, "status_code", 500))
@@ -1,5 +1,6 @@
 from typing import List, Optional, Annotated
-from fastapi import APIRouter, Depends, status, Query, UploadFile, File
+from fastapi import APIRouter, Depends, status, Query, UploadFile, File, Header
+from fastapi import Response as HTTPResponse
 from sqlalchemy.orm import Session
 from app.database.db import get_db
 from app.core import auth_service as AuthService
@@ -7,10 +8,20 @@ from app.schemas.sales import company as CompanySchemas
 from app.schemas.sales.DefaultResponse import SalesResponse
 from app.utils.responses import Response
 from app.services.sales import company_service as CompanyService
+from app.services.sales import company_hierarchy_service as CompanyHierarchyService
+from app.services.sales import company_typeahead_service as CompanyTypeaheadService
+from app.services.sales import company_search_service as CompanySearchService
+from app.services.sales import company_dedup_service as CompanyDedupService
+from app.services.sales import company_merge_service as CompanyMergeService
+from app.services.sales import company_scoring_service as CompanyScoringService
+from app.services.sales import company_360_service as Company360Service
+from app.services.sales import bulk_action_service as BulkActionService
+from app.services.sales import company_facet_service as CompanyFacetService
 from app.core.permissions import check_permission
 from app.models.sales.company import Company
 from app.schemas.sales.company import CompanyExportOut
 from app.utils.export_helper.generic_exporter import export_to_csv
+from app.utils import etag as ETag
 
 router = APIRouter()
 
@@ -22,6 +33,32 @@ def handle_exception(e: Exception, msg: str, code: int = 500):
         data=None
     )
 
+#---------- Shared List / Facet Filters (repeat a parameter to OR several values) ----------
+def company_filters(
+    industry_segment_id: Optional[List[int]] = Query(None),
+    account_type_id: Optional[List[int]] = Query(None),
+    account_sub_type_id: Optional[List[int]] = Query(None),
+    business_type_id: Optional[List[int]] = Query(None),
+    account_region_id: Optional[List[int]] = Query(None),
+    is_child: Optional[bool] = Query(None),
+    parent_company_id: Optional[int] = Query(None),
+    country_id: Optional[List[int]] = Query(None, description="Any live address in one of these countries"),
+    state_id: Optional[List[int]] = Query(None),
+    city_id: Optional[List[int]] = Query(None)
+) -> CompanySchemas.CompanyFilters:
+    return CompanySchemas.CompanyFilters(
+        industry_segment_id=industry_segment_id,
+        account_type_id=account_type_id,
+        account_sub_type_id=account_sub_type_id,
+        business_type_id=business_type_id,
+        account_region_id=account_region_id,
+        is_child=is_child,
+        parent_company_id=parent_company_id,
+        country_id=country_id,
+        state_id=state_id,
+        city_id=city_id
+    )
+
 #---------- Create Company ----------
 @router.post("/", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "create")], status_code=status.HTTP_201_CREATED)
 def create_company(
@@ -40,6 +77,92 @@ def create_company(
     except Exception as e:
         return handle_exception(e, "Company creation failed", getattr(e, "status_code", 400))
 
+#---------- Bulk Create Companies ----------
+@router.post("/bulk", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "create")], status_code=status.HTTP_201_CREATED)
+def bulk_create_companies(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    payload: CompanySchemas.CompanyBulkCreate,
+    db: Session = Depends(get_db)
+):
+    try:
+        login_id = current_user.id
+        result = CompanyService.bulk_create_companies(db, payload.companies, login_id)
+        return Response(
+            message=f"{result.created} companies created, {result.failed} failed",
+            status_code=status.HTTP_201_CREATED if not result.failed else status.HTTP_207_MULTI_STATUS,
+            json_data=result
+        )
+    except Exception as e:
+        return handle_exception(e, "Bulk company creation failed", getattr(e, "status_code", 400))
+
+#---------- Bulk Delete Companies ----------
+@router.post("/bulk/delete", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "delete")], status_code=status.HTTP_200_OK)
+def bulk_delete_companies(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    selection: CompanySchemas.CompanyBulkSelection,
+    db: Session = Depends(get_db)
+):
+    try:
+        result = BulkActionService.bulk_delete_companies(db, selection, current_user.id)
+        return Response(
+            json_data=result,
+            message=f"{result['affected']} companies updated",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Bulk company delete failed", getattr(e, "status_code", 400))
+
+#---------- Bulk Restore Companies ----------
+@router.post("/bulk/restore", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "delete")], status_code=status.HTTP_200_OK)
+def bulk_restore_companies(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    selection: CompanySchemas.CompanyBulkSelection,
+    db: Session = Depends(get_db)
+):
+    try:
+        result = BulkActionService.bulk_restore_companies(db, selection, current_user.id)
+        return Response(
+            json_data=result,
+            message=f"{result['affected']} companies updated",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Bulk company restore failed", getattr(e, "status_code", 400))
+
+#---------- Bulk Activate / Deactivate Companies ----------
+@router.post("/bulk/status", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+def bulk_set_company_status(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    selection: CompanySchemas.CompanyBulkStatus,
+    db: Session = Depends(get_db)
+):
+    try:
+        result = BulkActionService.bulk_set_company_status(db, selection, current_user.id)
+        return Response(
+            json_data=result,
+            message=f"{result['affected']} companies updated",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Bulk company status change failed", getattr(e, "status_code", 400))
+
+#---------- Bulk Reassign Region / Account Type ----------
+@router.post("/bulk/reassign", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+def bulk_reassign_companies(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    selection: CompanySchemas.CompanyBulkReassign,
+    db: Session = Depends(get_db)
+):
+    try:
+        result = BulkActionService.bulk_reassign_companies(db, selection, current_user.id)
+        return Response(
+            json_data=result,
+            message=f"{result['affected']} companies updated",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Bulk company reassign failed", getattr(e, "status_code", 400))
+
 #---------- List Companies ----------
 @router.get("/", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
 def list_companies(
@@ -47,11 +170,17 @@ def list_companies(
     db: Session = Depends(get_db),
     limit: int = Query(10, ge=1, le=100),
     page: int = Query(1, ge=1),
-    search: Optional[str] = Query(None)
+    search: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None, description="Comma separated company columns to return, e.g. id,company_name,gst_no"),
+    include: Optional[str] = Query(None, description="Child collections to attach: addresses,turnover_records,profit_records,documents"),
+    sort: Optional[str] = Query(None, description="id, company_name or account_score; prefix with - for descending"),
+    filters: CompanySchemas.CompanyFilters = Depends(company_filters)
 ):
     try:
         offset = (page - 1) * limit
-        result = CompanyService.get_companies(db, skip=offset, limit=limit, search=search)
+        result = CompanyService.get_companies(
+            db, skip=offset, limit=limit, search=search, fields=fields, include=include, sort=sort, filters=filters
+        )
         return Response(
             json_data=result, 
             message="Companies fetched successfully",
@@ -60,6 +189,153 @@ def list_companies(
     except Exception as e:
         return handle_exception(e, "Error fetching companies", getattr(e, "status_code", 500))
 
+#---------- Facet Counts ----------
+@router.get("/facets", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def company_facets(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    filters: CompanySchemas.CompanyFilters = Depends(company_filters),
+    db: Session = Depends(get_db)
+):
+    try:
+        result = CompanyFacetService.get_facets(db, filters)
+        return Response(
+            json_data=result,
+            message="Company facets fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching company facets", getattr(e, "status_code", 500))
+
+#---------- Search Companies ----------
+@router.get("/search", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def search_companies(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    q: str = Query(..., min_length=1, description="Words to match against name, GST, PAN, website, cities and profile"),
+    limit: int = Query(10, ge=1, le=100),
+    page: int = Query(1, ge=1),
+    db: Session = Depends(get_db)
+):
+    try:
+        offset = (page - 1) * limit
+        result = CompanySearchService.search_companies(db, q, skip=offset, limit=limit)
+        return Response(
+            json_data=result,
+            message="Companies fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error searching companies", getattr(e, "status_code", 500))
+
+#---------- Rebuild Search Index ----------
+@router.post("/search/reindex", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+def reindex_company_search(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    db: Session = Depends(get_db)
+):
+    try:
+        indexed = CompanySearchService.reindex_all(db)
+        db.commit()
+        return Response(
+            json_data={"indexed": indexed},
+            message="Company search index rebuilt successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        db.rollback()
+        return handle_exception(e, "Error rebuilding search index", getattr(e, "status_code", 500))
+
+#---------- Recompute Account Scores ----------
+@router.post("/scores/recompute", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+def recompute_account_scores(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    full: bool = Query(False, description="Rescore every company instead of only the stale ones"),
+    db: Session = Depends(get_db)
+):
+    try:
+        scored = CompanyScoringService.recompute_scores(db, full=full)
+        return Response(
+            json_data={"scored": scored},
+            message="Account scores recomputed successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        db.rollback()
+        return handle_exception(e, "Error recomputing account scores", getattr(e, "status_code", 500))
+
+#---------- Check For Duplicate Companies ----------
+@router.post("/dedup/check", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def check_duplicate_companies(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    payload: CompanySchemas.CompanyDedupCheck,
+    db: Session = Depends(get_db)
+):
+    try:
+        result = CompanyDedupService.find_candidates(
+            db, payload.company_name, payload.gst_no, payload.pan_no, payload.website, payload.exclude_id
+        )
+        return Response(
+            json_data=result,
+            message="Duplicate candidates fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error checking duplicates", getattr(e, "status_code", 500))
+
+#---------- Duplicate Company Clusters ----------
+@router.get("/dedup/clusters", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def list_duplicate_clusters(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    key_types: str = Query(",".join(CompanyDedupService.STRONG_KEY_TYPES), description="Comma separated: gst,pan,domain,name,shingle"),
+    max_block_size: int = Query(CompanyDedupService.MAX_BLOCK_SIZE, ge=2, le=1000),
+    db: Session = Depends(get_db)
+):
+    try:
+        types = [t.strip() for t in key_types.split(",") if t.strip()]
+        result = CompanyDedupService.find_clusters(db, types, max_block_size)
+        return Response(
+            json_data=result,
+            message="Duplicate clusters fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching duplicate clusters", getattr(e, "status_code", 500))
+
+#---------- Rebuild Duplicate Keys ----------
+@router.post("/dedup/reindex", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+def reindex_duplicate_keys(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    db: Session = Depends(get_db)
+):
+    try:
+        indexed = CompanyDedupService.reindex_all(db)
+        db.commit()
+        return Response(
+            json_data={"indexed": indexed},
+            message="Duplicate keys rebuilt successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        db.rollback()
+        return handle_exception(e, "Error rebuilding duplicate keys", getattr(e, "status_code", 500))
+
+#---------- Rebuild Company Hierarchy ----------
+@router.post("/hierarchy/rebuild", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+def rebuild_company_hierarchy(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    db: Session = Depends(get_db)
+):
+    try:
+        rows = CompanyHierarchyService.rebuild(db)
+        db.commit()
+        return Response(
+            json_data={"rows": rows},
+            message="Company hierarchy rebuilt successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        db.rollback()
+        return handle_exception(e, "Error rebuilding company hierarchy", getattr(e, "status_code", 500))
+
 #---------- Export Companies ----------
 @router.get("/export",
             response_model=CompanySchemas.CompanyExportOut,
@@ -92,17 +368,45 @@ def get_parent_companies(
     except Exception as e:
         return handle_exception(e, "Error fetching parent companies", getattr(e, "status_code", 500))
 
+#---------- Company Typeahead ----------
+@router.get("/typeahead", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def company_typeahead(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    q: str = Query(..., min_length=1, description="Prefix of the company name or of any word in it"),
+    limit: int = Query(10, ge=1, le=50),
+    exclude_ids: Optional[List[int]] = Query(None),
+    exclude_descendants_of: Optional[int] = Query(None, description="Hide this company and its whole subtree"),
+    db: Session = Depends(get_db)
+):
+    try:
+        result = CompanyTypeaheadService.search_companies(db, q, limit, exclude_ids, exclude_descendants_of)
+        return Response(
+            json_data=result,
+            message="Companies fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching companies", getattr(e, "status_code", 500))
+
 #---------- Fetch Single Company by ID ----------
 @router.get("/{company_id}", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
 def fetch_company(
     current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
     company_id: int,
+    response: HTTPResponse,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
     try:
+        # Revalidation only reads updated_at; children are loaded and serialised on a miss
+        if if_none_match:
+            etag = CompanyService.get_company_etag(db, company_id)
+            if etag and ETag.matches(if_none_match, etag):
+                return ETag.not_modified(etag)
         company = CompanyService.get_company_by_id(db, company_id)
         if not company:
             return handle_exception(Exception("Company not found"), "Error fetching company", 404)
+        response.headers["ETag"] = CompanyService.company_etag(company.id, company.updated_at)
         return Response(
             json_data=company,
             message="Company fetched successfully",
@@ -111,25 +415,131 @@ def fetch_company(
     except Exception as e:
         return handle_exception(e, "Error fetching company", getattr(e, "status_code", 500))
 
+#---------- Company Ancestors ----------
+@router.get("/{company_id}/ancestors", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def fetch_company_ancestors(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    company_id: int,
+    db: Session = Depends(get_db)
+):
+    try:
+        result = CompanyHierarchyService.get_ancestors(db, company_id)
+        if result is None:
+            return handle_exception(Exception("Company not found"), "Error fetching ancestors", 404)
+        return Response(
+            json_data=result,
+            message="Company ancestors fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching ancestors", getattr(e, "status_code", 500))
+
+#---------- Company Descendants ----------
+@router.get("/{company_id}/descendants", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def fetch_company_descendants(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    company_id: int,
+    max_depth: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db)
+):
+    try:
+        result = CompanyHierarchyService.get_descendants(db, company_id, max_depth)
+        if result is None:
+            return handle_exception(Exception("Company not found"), "Error fetching descendants", 404)
+        return Response(
+            json_data=result,
+            message="Company descendants fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching descendants", getattr(e, "status_code", 500))
+
+#---------- Company Subtree Summary ----------
+@router.get("/{company_id}/subtree-summary", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def fetch_company_subtree_summary(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    company_id: int,
+    db: Session = Depends(get_db)
+):
+    try:
+        result = CompanyHierarchyService.get_subtree_summary(db, company_id)
+        if result is None:
+            return handle_exception(Exception("Company not found"), "Error fetching subtree summary", 404)
+        return Response(
+            json_data=result,
+            message="Company subtree summary fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching subtree summary", getattr(e, "status_code", 500))
+
+#---------- Company 360 View ----------
+@router.get("/{company_id}/360", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def fetch_company_360(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    company_id: int,
+    response: HTTPResponse,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    try:
+        result = Company360Service.get_company_360(db, company_id)
+        if result is None:
+            return handle_exception(Exception("Company not found"), "Error fetching company 360", 404)
+        etag = ETag.payload_etag(result)
+        if ETag.matches(if_none_match, etag):
+            return ETag.not_modified(etag)
+        response.headers["ETag"] = etag
+        return Response(
+            json_data=result,
+            message="Company 360 fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching company 360", getattr(e, "status_code", 500))
+
+#---------- Merge Companies ----------
+@router.post("/{company_id}/merge", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+def merge_companies(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    company_id: int,
+    payload: CompanySchemas.CompanyMerge,
+    db: Session = Depends(get_db)
+):
+    try:
+        login_id = current_user.id
+        result = CompanyMergeService.merge_companies(db, company_id, payload.source_ids, login_id)
+        return Response(
+            json_data=result,
+            message="Companies merged successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error merging companies", getattr(e, "status_code", 500))
+
 #---------- Update Company ----------
 @router.put("/{company_id}", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
 def update_company_details(
     current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
     company_id: int,
     company: CompanySchemas.CompanyUpdate,
+    response: HTTPResponse,
+    if_match: Optional[str] = Header(None, description="ETag from the last fetch; the update is refused with 412 if the company changed since"),
     db: Session = Depends(get_db)
 ):
     try:
         login_id = current_user.id
-        updated_company = CompanyService.update_company(db, company_id, company, login_id)
+        updated_company = CompanyService.update_company(db, company_id, company, login_id, if_match)
         if not updated_company:
             return handle_exception(Exception("Company not found"), "Error updating company", 404)
+        response.headers["ETag"] = CompanyService.company_etag(updated_company.id, updated_company.updated_at)
         return Response(
             json_data=updated_company,
             message="Company updated successfully",
             status_code=status.HTTP_200_OK
         )
     except Exception as e:
+        ETag.mirror_precondition_failure(response, e)
         return handle_exception(e, "Error updating company", getattr(e, "status_code", 500))
 
 #---------- Delete Company ----------
@@ -137,10 +547,12 @@ def update_company_details(
 def delete_company_details(
     current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
     company_id: int,
+    response: HTTPResponse,
+    if_match: Optional[str] = Header(None, description="ETag from the last fetch; the delete is refused with 412 if the company changed since"),
     db: Session = Depends(get_db)
 ):
     try:
-        deleted = CompanyService.delete_company(db, company_id)
+        deleted = CompanyService.delete_company(db, company_id, if_match)
         if not deleted:
             return handle_exception(Exception("Company not found"), "Error deleting company", 404)
         return Response(
@@ -149,4 +561,5 @@ def delete_company_details(
             status_code=status.HTTP_200_OK
         )
     except Exception as e:
+        ETag.mirror_precondition_failure(response, e)
         return handle_exception(e, "Error deleting company", getattr(e, "status_code", 500))
\ No newline at end of file
@@ -0,0 +1,194 @@
+from typing import Optional, Annotated
+from fastapi import APIRouter, Depends, Request, status, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+from app.database.db import get_db
+from app.core import auth_service as AuthService
+from app.schemas.sales import company as CompanySchemas
+from app.schemas.sales.DefaultResponse import SalesResponse
+from app.utils.responses import Response
+from app.services.sales import company_document_service as DocumentService
+from app.core.permissions import check_permission
+
+router = APIRouter()
+
+#---------- Helper Function for Consistent Error Handling ----------
+def handle_exception(e: Exception, msg: str, code: int = 500):
+    return SalesResponse(
+        message=f"{msg}: {str(e)}",
+        status_code=code,
+        data=None
+    )
+
+async def _stream_to(request: Request, writer: DocumentService.ChunkWriter) -> None:
+    """Copy the raw request body into the writer chunk by chunk; nothing is buffered in memory."""
+    async for chunk in request.stream():
+        if chunk:
+            await run_in_threadpool(writer.write, chunk)
+
+#---------- Upload Document (single request) ----------
+@router.post("/{company_id}/documents", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_201_CREATED)
+async def upload_company_document(
+    company_id: int,
+    request: Request,
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    file_name: str = Query(..., min_length=1, max_length=255),
+    document_type_id: Optional[int] = Query(None),
+    description: Optional[str] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """Send the file as the raw request body (not multipart); Content-Type is stored with it."""
+    try:
+        await run_in_threadpool(DocumentService.ensure_company_exists, db, company_id)
+        writer = DocumentService.open_upload()
+        try:
+            await _stream_to(request, writer)
+        except Exception:
+            writer.discard()
+            raise
+        result = await run_in_threadpool(
+            DocumentService.store_document, db, company_id, writer, file_name,
+            request.headers.get("content-type"), document_type_id, description, current_user.id
+        )
+        return Response(
+            json_data=result,
+            message="Document uploaded successfully",
+            status_code=status.HTTP_201_CREATED
+        )
+    except Exception as e:
+        return handle_exception(e, "Document upload failed", getattr(e, "status_code", 400))
+
+#---------- Start Resumable Upload ----------
+@router.post("/{company_id}/documents/uploads", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_201_CREATED)
+def start_document_upload(
+    company_id: int,
+    upload: CompanySchemas.CompanyDocumentUploadCreate,
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    db: Session = Depends(get_db)
+):
+    try:
+        result = DocumentService.create_upload(db, company_id, upload, current_user.id)
+        return Response(
+            json_data=result,
+            message="Upload started successfully",
+            status_code=status.HTTP_201_CREATED
+        )
+    except Exception as e:
+        return handle_exception(e, "Error starting upload", getattr(e, "status_code", 400))
+
+#---------- Resumable Upload Status ----------
+@router.get("/{company_id}/documents/uploads/{upload_id}", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+def fetch_document_upload(
+    company_id: int,
+    upload_id: str,
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    db: Session = Depends(get_db)
+):
+    try:
+        upload = DocumentService.get_upload(db, company_id, upload_id)
+        return Response(
+            json_data=CompanySchemas.CompanyDocumentUploadResponse.from_orm(upload),
+            message="Upload fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error fetching upload", getattr(e, "status_code", 500))
+
+#---------- Upload Chunk ----------
+@router.put("/{company_id}/documents/uploads/{upload_id}", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+async def upload_document_chunk(
+    company_id: int,
+    upload_id: str,
+    request: Request,
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    offset: int = Query(..., ge=0, description="Byte position of this chunk; resume from received_size"),
+    db: Session = Depends(get_db)
+):
+    """Send the chunk as the raw request body. Bytes written before a failure still count, so resume from received_size."""
+    try:
+        writer = await run_in_threadpool(DocumentService.open_chunk, db, company_id, upload_id, offset)
+        try:
+            await _stream_to(request, writer)
+        finally:
+            result = await run_in_threadpool(DocumentService.record_chunk, db, company_id, upload_id, writer)
+        return Response(
+            json_data=result,
+            message="Chunk uploaded successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Chunk upload failed", getattr(e, "status_code", 400))
+
+#---------- Complete Resumable Upload ----------
+@router.post("/{company_id}/documents/uploads/{upload_id}/complete", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_201_CREATED)
+def complete_document_upload(
+    company_id: int,
+    upload_id: str,
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    db: Session = Depends(get_db)
+):
+    try:
+        result = DocumentService.complete_upload(db, company_id, upload_id, current_user.id)
+        return Response(
+            json_data=result,
+            message="Document uploaded successfully",
+            status_code=status.HTTP_201_CREATED
+        )
+    except Exception as e:
+        return handle_exception(e, "Error completing upload", getattr(e, "status_code", 400))
+
+#---------- Cancel Resumable Upload ----------
+@router.delete("/{company_id}/documents/uploads/{upload_id}", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+def cancel_document_upload(
+    company_id: int,
+    upload_id: str,
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    db: Session = Depends(get_db)
+):
+    try:
+        DocumentService.cancel_upload(db, company_id, upload_id)
+        return Response(
+            json_data=None,
+            message="Upload cancelled successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error cancelling upload", getattr(e, "status_code", 500))
+
+#---------- Sweep Unreferenced Blobs ----------
+@router.post("/documents/sweep", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/companies", "edit")], status_code=status.HTTP_200_OK)
+def sweep_document_blobs(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    db: Session = Depends(get_db)
+):
+    """Delete stored files no document references any more; run from a scheduler."""
+    try:
+        removed = DocumentService.sweep_blobs(db)
+        return Response(
+            json_data={"removed": removed},
+            message="Document storage swept successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error sweeping document storage", getattr(e, "status_code", 500))
+
+#---------- Download Document ----------
+@router.get("/{company_id}/documents/{document_id}/download", dependencies=[check_permission(2, "/sales/companies", "view")], status_code=status.HTTP_200_OK)
+def download_company_document(
+    company_id: int,
+    document_id: int,
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    db: Session = Depends(get_db)
+):
+    """Served by FileResponse: Range requests, sendfile where the server supports it, and the content hash as ETag."""
+    try:
+        document = DocumentService.get_document_file(db, company_id, document_id)
+        return FileResponse(
+            DocumentService.blob_path(document.content_hash),
+            media_type=document.content_type or "application/octet-stream",
+            filename=document.file_name,
+            headers={"ETag": f'"{document.content_hash}"'}
+        )
+    except Exception as e:
+        return handle_exception(e, "Error downloading document", getattr(e, "status_code", 500))
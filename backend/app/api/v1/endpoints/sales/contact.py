@@ -1,16 +1,25 @@
+import csv
+import json
+from io import StringIO
 from typing import List, Optional, Annotated
-from fastapi import APIRouter, Depends, status, Query, UploadFile, File
+from fastapi import APIRouter, Depends, status, Query, UploadFile, File, Header
+from fastapi import Response as HTTPResponse
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from app.database.db import get_db
+from app.database.db import get_db, SessionLocal
 from app.core import auth_service as AuthService
 from app.schemas.sales import contact as ContactSchemas
 from app.schemas.sales.DefaultResponse import SalesResponse
 from app.utils.responses import Response
 from app.services.sales import contact_service as ContactService
+from app.services.sales import bulk_action_service as BulkActionService
+from app.services.sales import contact_identifier_service as ContactIdentifierService
+from app.services.sales import contact_segment_service as ContactSegmentService
 from app.core.permissions import check_permission
 from app.models.sales.contact import Contact
 from app.schemas.sales.contact import ContactExportOut
 from app.utils.export_helper.generic_exporter import export_to_csv
+from app.utils import etag as ETag
 
 router = APIRouter()
 
@@ -22,16 +31,47 @@ def handle_exception(e: Exception, msg: str, code: int = 500):
         data=None
     )
 
+def ndjson_contacts_by_company(company_id: int, cursor: Optional[int]):
+    # Runs while the response is being sent, after the request session is closed,
+    # so it reads through a session of its own
+    db = SessionLocal()
+    try:
+        for contact in ContactService.iter_contacts_by_company(db, company_id, cursor):
+            yield contact.model_dump_json() + "\n"
+    finally:
+        db.close()
+
+def stream_segment(statement, format: str):
+    # Same as above: the export outlives the request session
+    db = SessionLocal()
+    try:
+        output = StringIO()
+        writer = csv.DictWriter(output, fieldnames=ContactSegmentService.EXPORT_FIELDS)
+        if format == "csv":
+            writer.writeheader()
+            yield output.getvalue()
+        for rows in ContactSegmentService.iter_segment(db, statement):
+            if format == "csv":
+                output.seek(0)
+                output.truncate()
+                writer.writerows(rows)
+                yield output.getvalue()
+            else:
+                yield "".join(json.dumps(row) + "\n" for row in rows)
+    finally:
+        db.close()
+
 #---------- Create Contact ----------
 @router.post("/", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/contacts", "create")], status_code=status.HTTP_201_CREATED)
 def create_contact(
     current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
     contact: ContactSchemas.ContactCreate,
+    allow_duplicates: bool = Query(False, description="Create even if the email or a phone number is already on another contact"),
     db: Session = Depends(get_db)
 ):
     try:
         login_id = current_user.id
-        result = ContactService.create_contact(db, contact, login_id)
+        result = ContactService.create_contact(db, contact, login_id, allow_duplicates)
         return Response(
             message="Contact created successfully",
             status_code=status.HTTP_201_CREATED,
@@ -40,6 +80,76 @@ def create_contact(
     except Exception as e:
         return handle_exception(e, "Contact creation failed", getattr(e, "status_code", 400))
 
+#---------- Bulk Create (Import) Contacts ----------
+@router.post("/bulk", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/contacts", "create")], status_code=status.HTTP_201_CREATED)
+def bulk_create_contacts(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    payload: ContactSchemas.ContactBulkCreate,
+    allow_duplicates: bool = Query(False, description="Import items even if their email or a phone number is already taken"),
+    db: Session = Depends(get_db)
+):
+    try:
+        login_id = current_user.id
+        result = ContactService.bulk_create_contacts(db, payload.contacts, login_id, allow_duplicates)
+        return Response(
+            message=f"{result.created} contacts created, {result.failed} failed",
+            status_code=status.HTTP_201_CREATED if not result.failed else status.HTTP_207_MULTI_STATUS,
+            json_data=result
+        )
+    except Exception as e:
+        return handle_exception(e, "Bulk contact creation failed", getattr(e, "status_code", 400))
+
+#---------- Bulk Delete Contacts ----------
+@router.post("/bulk/delete", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/contacts", "delete")], status_code=status.HTTP_200_OK)
+def bulk_delete_contacts(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    selection: ContactSchemas.ContactBulkSelection,
+    db: Session = Depends(get_db)
+):
+    try:
+        result = BulkActionService.bulk_delete_contacts(db, selection, current_user.id)
+        return Response(
+            json_data=result,
+            message=f"{result['affected']} contacts updated",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Bulk contact delete failed", getattr(e, "status_code", 400))
+
+#---------- Bulk Restore Contacts ----------
+@router.post("/bulk/restore", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/contacts", "delete")], status_code=status.HTTP_200_OK)
+def bulk_restore_contacts(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    selection: ContactSchemas.ContactBulkSelection,
+    db: Session = Depends(get_db)
+):
+    try:
+        result = BulkActionService.bulk_restore_contacts(db, selection, current_user.id)
+        return Response(
+            json_data=result,
+            message=f"{result['affected']} contacts updated",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Bulk contact restore failed", getattr(e, "status_code", 400))
+
+#---------- Bulk Activate / Deactivate Contacts ----------
+@router.post("/bulk/status", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/contacts", "edit")], status_code=status.HTTP_200_OK)
+def bulk_set_contact_status(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    selection: ContactSchemas.ContactBulkStatus,
+    db: Session = Depends(get_db)
+):
+    try:
+        result = BulkActionService.bulk_set_contact_status(db, selection, current_user.id)
+        return Response(
+            json_data=result,
+            message=f"{result['affected']} contacts updated",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Bulk contact status change failed", getattr(e, "status_code", 400))
+
 @router.get("/", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/contacts", "view")], status_code=status.HTTP_200_OK)
 def list_contacts(
     current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
@@ -47,11 +157,13 @@ def list_contacts(
     limit: int = Query(10, ge=1, le=100),
     page: int = Query(1, ge=1),
     search: Optional[str] = Query(None),
-    company_id: Optional[int] = Query(None)
+    company_id: Optional[int] = Query(None),
+    fields: Optional[str] = Query(None, description="Comma separated contact columns to return, e.g. id,first_name,email"),
+    include: Optional[str] = Query(None, description="Child collections to attach: addresses")
 ):
     try:
         offset = (page - 1) * limit
-        result = ContactService.get_contacts(db, skip=offset, limit=limit, search=search, company_id=company_id)
+        result = ContactService.get_contacts(db, skip=offset, limit=limit, search=search, company_id=company_id, fields=fields, include=include)
         return Response(
             json_data=result, 
             message="Contacts fetched successfully",
@@ -76,15 +188,98 @@ def export_contacts(
     except Exception as e:
         return handle_exception(e, "Contact export failed", getattr(e, "status_code", 500))
 
+#---------- Lookup Contact by Phone / Email ----------
+@router.get("/lookup", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/contacts", "view")], status_code=status.HTTP_200_OK)
+def lookup_contacts(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    phone: Optional[str] = Query(None, description="Any format, e.g. +91 98765 43210 or 09876543210"),
+    email: Optional[str] = Query(None, description="Case-insensitive exact match"),
+    db: Session = Depends(get_db)
+):
+    try:
+        result = ContactIdentifierService.lookup(db, phone, email)
+        return Response(
+            json_data=result,
+            message="Contacts fetched successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error looking up contacts", getattr(e, "status_code", 500))
+
+#---------- Rebuild Contact Identifiers ----------
+@router.post("/identifiers/reindex", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/contacts", "edit")], status_code=status.HTTP_200_OK)
+def reindex_contact_identifiers(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    db: Session = Depends(get_db)
+):
+    try:
+        indexed = ContactIdentifierService.reindex_all(db)
+        db.commit()
+        return Response(
+            json_data={"indexed": indexed},
+            message="Contact identifiers rebuilt successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        db.rollback()
+        return handle_exception(e, "Error rebuilding contact identifiers", getattr(e, "status_code", 500))
+
+#---------- Segment Counts ----------
+@router.post("/segments/count", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/contacts", "view")], status_code=status.HTTP_200_OK)
+def count_contact_segment(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    segment: ContactSchemas.ContactSegment,
+    db: Session = Depends(get_db)
+):
+    try:
+        result = ContactSegmentService.count_segment(db, segment)
+        return Response(
+            json_data=result,
+            message="Segment counted successfully",
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return handle_exception(e, "Error counting segment", getattr(e, "status_code", 500))
+
+#---------- Segment Export ----------
+@router.post("/segments/export", dependencies=[check_permission(2, "/sales/contacts", "export")], status_code=status.HTTP_200_OK)
+def export_contact_segment(
+    current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
+    segment: ContactSchemas.ContactSegment,
+    format: str = Query("csv", description="csv or ndjson"),
+):
+    try:
+        if format not in ("csv", "ndjson"):
+            return handle_exception(Exception("format must be 'csv' or 'ndjson'"), "Segment export failed", 400)
+        statement = ContactSegmentService.export_statement(segment)
+        if format == "csv":
+            return StreamingResponse(stream_segment(statement, format), media_type="text/csv", headers={
+                "Content-Disposition": "attachment; filename=contact_segment.csv"
+            })
+        return StreamingResponse(stream_segment(statement, format), media_type="application/x-ndjson")
+    except Exception as e:
+        return handle_exception(e, "Segment export failed", getattr(e, "status_code", 500))
+
 #---------- Get Contacts by Company ----------
 @router.get("/by-company/{company_id}", response_model=SalesResponse, dependencies=[check_permission(2, "/sales/contacts", "view")], status_code=status.HTTP_200_OK)
 def get_contacts_by_company(
     current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
     company_id: int,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; returns {contacts, next_cursor, limit}"),
+    cursor: Optional[int] = Query(None, ge=0, description="next_cursor of the previous page"),
+    format: Optional[str] = Query(None, description="ndjson streams every contact after `cursor`, one JSON object per line"),
     db: Session = Depends(get_db)
 ):
     try:
-        result = ContactService.get_contacts_by_company(db, company_id)
+        if format == "ndjson":
+            return StreamingResponse(ndjson_contacts_by_company(company_id, cursor), media_type="application/x-ndjson")
+        if format is not None:
+            return handle_exception(Exception("format must be 'ndjson'"), "Error fetching contacts", 400)
+        if limit is not None or cursor is not None:
+            result = ContactService.get_contacts_by_company_page(db, company_id, limit or 100, cursor)
+        else:
+            # Unpaginated list, kept for existing callers
+            result = ContactService.get_contacts_by_company(db, company_id)
         return Response(
             json_data=result,
             message="Contacts fetched successfully",
@@ -98,12 +293,20 @@ def get_contacts_by_company(
 def fetch_contact(
     current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
     contact_id: int,
+    response: HTTPResponse,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
     try:
+        # Revalidation only reads updated_at; children are loaded and serialised on a miss
+        if if_none_match:
+            etag = ContactService.get_contact_etag(db, contact_id)
+            if etag and ETag.matches(if_none_match, etag):
+                return ETag.not_modified(etag)
         contact = ContactService.get_contact_by_id(db, contact_id)
         if not contact:
             return handle_exception(Exception("Contact not found"), "Error fetching contact", 404)
+        response.headers["ETag"] = ContactService.contact_etag(contact.id, contact.updated_at)
         return Response(
             json_data=contact,
             message="Contact fetched successfully",
@@ -118,19 +321,23 @@ def update_contact_details(
     current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
     contact_id: int,
     contact: ContactSchemas.ContactUpdate,
+    response: HTTPResponse,
+    if_match: Optional[str] = Header(None, description="ETag from the last fetch; the update is refused with 412 if the contact changed since"),
     db: Session = Depends(get_db)
 ):
     try:
         login_id = current_user.id
-        updated_contact = ContactService.update_contact(db, contact_id, contact, login_id)
+        updated_contact = ContactService.update_contact(db, contact_id, contact, login_id, if_match)
         if not updated_contact:
             return handle_exception(Exception("Contact not found"), "Error updating contact", 404)
+        response.headers["ETag"] = ContactService.contact_etag(updated_contact.id, updated_contact.updated_at)
         return Response(
             json_data=updated_contact,
             message="Contact updated successfully",
             status_code=status.HTTP_200_OK
         )
     except Exception as e:
+        ETag.mirror_precondition_failure(response, e)
         return handle_exception(e, "Error updating contact", getattr(e, "status_code", 500))
 
 #---------- Delete Contact ----------
@@ -138,10 +345,12 @@ def update_contact_details(
 def delete_contact_details(
     current_user: Annotated[AuthService.User, Depends(AuthService.get_current_user)],
     contact_id: int,
+    response: HTTPResponse,
+    if_match: Optional[str] = Header(None, description="ETag from the last fetch; the delete is refused with 412 if the contact changed since"),
     db: Session = Depends(get_db)
 ):
     try:
-        deleted = ContactService.delete_contact(db, contact_id)
+        deleted = ContactService.delete_contact(db, contact_id, if_match)
         if not deleted:
             return handle_exception(Exception("Contact not found"), "Error deleting contact", 404)
         return Response(
@@ -150,4 +359,5 @@ def delete_contact_details(
             status_code=status.HTTP_200_OK
         )
     except Exception as e:
+        ETag.mirror_precondition_failure(response, e)
         return handle_exception(e, "Error deleting contact", getattr(e, "status_code", 500))
\ No newline at end of file
@@ -44,7 +44,7 @@ def create_sub_department(
             status_code=status.HTTP_201_CREATED,
         )
     except Exception as e:
-        return handle_exception(e, "SubDepartment creation failed")
+        return handle_exception(e, "SubDepartment creation failed", getattr(e, "status_code", 500))
 
 # ---------------- List with Pagination & Search ----------------
 @router.get(
@@ -162,7 +162,7 @@ def update_sub_department_details(
             status_code=status.HTTP_200_OK,
         )
     except Exception as e:
-        return handle_exception(e, "Error updating SubDepartment")
+        return handle_exception(e, "Error updating SubDepartment", getattr(e, "status_code", 500))
 
 # ---------------- Delete (Soft) ----------------
 @router.delete(
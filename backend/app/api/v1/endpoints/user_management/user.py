@@ -42,17 +42,18 @@ def register_user(
         return handle_exception(e, "User creation failed", getattr(e, "status_code", 400))
 
 #---------- List Users ----------
-@router.get("/", response_model=UserSchemas.UserResponse, dependencies=[check_permission(1, "/users", "view")], status_code=status.HTTP_200_OK)
+@router.get("/", response_model=UserSchemas.UserResponse, dependencies=[check_permission(1, "/users", "view")], status_code=status.HTTP_200_OK, response_model_exclude_unset=True)
 def list_users(
     current_user: Annotated[UserSchemas.UserResponse, Depends(AuthService.get_current_user)],
     db: Session = Depends(get_db),
     limit: int = Query(10, ge=1, le=100),
     page: int = Query(1, ge=1),
-    search: Optional[str] = Query(None)
+    search: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None, description="Comma separated user columns to return, e.g. id,full_name,email")
 ):
     try:
         offset = (page - 1) * limit
-        result = UserService.get_users(db, skip=offset, limit=limit, search=search)
+        result = UserService.get_users(db, skip=offset, limit=limit, search=search, fields=fields)
         return Response(
             json_data=result, 
             message="Users fetched successfully",
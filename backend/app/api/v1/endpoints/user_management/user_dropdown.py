@@ -1,86 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
+from fastapi import Response as HTTPResponse
 from sqlalchemy.orm import Session
-from typing import List, Dict, Tuple
-from enum import Enum
+from typing import List, Dict, Optional, Any
 from app.database.db import get_db
-from sqlalchemy import asc
-from app.models.user_management import (Role, Department, 
-    SubDepartment,
-    Designation,
-    RolePermission,
-    Permission,
-    Module,
-    User,
-    Menu
-)
-
-from app.models.masters import (
-    Region,
-    BusinessVertical
-)
+from app.services.user_management import dropdown_service as DropdownService
+from app.services.user_management.dropdown_service import DropdownType
+from app.utils import etag as ETag
 
 router = APIRouter()
 
-# Enum for allowed dropdown types
-class DropdownType(str, Enum):
-    roles = "roles"
-    departments = "departments"
-    sub_departments = "sub_departments"
-    regions = "regions"
-    business_verticals = "business_verticals"
-    designations = "designations"
-    role_permissions = "role_permissions"
-    permissions = "permissions"
-    module = "module"
-    user = "user"
-    menu = "menu"
+@router.get("/bundle", response_model=Dict[str, Any])
+def get_dropdown_bundle(
+    response: HTTPResponse,
+    types: str = Query(..., description="Comma separated dropdown types, e.g. industry_segments,account_types,countries"),
+    versions: Optional[str] = Query(None, description="type:version pairs from an earlier bundle; lists still at that version are not resent"),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    try:
+        etag, bundle = DropdownService.get_bundle(db, types, versions)
+        if ETag.matches(if_none_match, etag):
+            return ETag.not_modified(etag)
+        response.headers["ETag"] = etag
+        return bundle
 
-# Mapping Enum values to models with value field & label field (+ optional extra field)
-ENTITY_MODELS: Dict[DropdownType, Tuple[type, str, str, str | None]] = {
-    DropdownType.roles: (Role, "id", "name", None),
-    DropdownType.departments: (Department, "id", "name", None),
-    DropdownType.sub_departments: (SubDepartment, "id", "name", "department_id"),
-    DropdownType.regions: (Region, "id", "name", None),
-    DropdownType.business_verticals: (BusinessVertical, "id", "name", None),
-    DropdownType.designations: (Designation, "id", "name", None),
-    DropdownType.role_permissions: (RolePermission, "id", "role_id", None),
-    DropdownType.permissions: (Permission, "id", "name", None),
-    DropdownType.module: (Module, "id", "name", None),
-    DropdownType.user: (User, "id", "full_name", None),
-    DropdownType.menu: (Menu, "id", "name", "module_id"),
-}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal Server Error: {str(e)}")
 
 @router.get("/{entity_name}", response_model=List[Dict])
-def get_dropdown(entity_name: DropdownType, db: Session = Depends(get_db)):
+def get_dropdown(
+    entity_name: DropdownType,
+    response: HTTPResponse,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
     try:
-        if entity_name not in ENTITY_MODELS:
-            raise HTTPException(status_code=404, detail=f"Entity '{entity_name}' not found.")
-
-        model, value_field, label_field, extra_field = ENTITY_MODELS[entity_name]
-
-        if not hasattr(model, label_field):
-            raise HTTPException(status_code=400, detail=f"Label field '{label_field}' not found in '{entity_name}' model.")
-
-        query = db.query(model)
-        if hasattr(model, "is_active"):
-            query = query.filter(model.is_active == True)
-
-        records = query.order_by(asc(getattr(model, label_field))).all()
-
-        dropdown_data = []
-        for record in records:
-            item = {
-                "id": getattr(record, value_field),
-                "name": getattr(record, label_field),
-            }
-            if extra_field and hasattr(record, extra_field):
-                item[extra_field] = getattr(record, extra_field)
-            dropdown_data.append(item)
-
+        etag, dropdown_data = DropdownService.get_dropdown(db, entity_name)
+        if ETag.matches(if_none_match, etag):
+            return ETag.not_modified(etag)
+        response.headers["ETag"] = etag
         return dropdown_data
 
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal Server Error: {str(e)}")
-
@@ -4,3 +4,11 @@ from app.models.sales.company import (
     CompanyProfit, CompanyDocument
 )
 from app.models.sales.contact import Contact, ContactAddress
+from app.models.sales.company_hierarchy import CompanyHierarchy
+from app.models.sales.company_search import CompanySearchDocument
+from app.models.sales.company_dedup import CompanyDedupKey
+from app.models.sales.company_financials import CompanyFinancialSummary
+from app.models.sales.company_document_upload import CompanyDocumentUpload
+from app.models.sales.geo_rollup import GeoRollup
+from app.models.sales.contact_identifier import ContactIdentifier
+from app.models.masters.master_zip_ranges import MasterZipRange
@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, t
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.db import Base
+from app.utils.unique import live_unique_index
 
 class MasterAddresssTypes(Base):
     __tablename__ = "master_address_types"
@@ -19,3 +20,6 @@ class MasterAddresssTypes(Base):
 
     created_user = relationship("User", foreign_keys=[created_by], lazy="joined", post_update=True)
     updated_user = relationship("User", foreign_keys=[updated_by], lazy="joined", post_update=True)
+
+
+live_unique_index(MasterAddresssTypes.name)
@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, t
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.db import Base
+from app.utils.unique import live_unique_index
 
 class MasterCities(Base):
     __tablename__ = "master_cities"
@@ -9,6 +10,7 @@ class MasterCities(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(100), nullable=False)
     description = Column(String(255), nullable=True)
+    state_id = Column(Integer, ForeignKey('master_states.id', ondelete="SET NULL"), nullable=True, index=True)
     is_active = Column(Boolean, server_default=text("true"))
     is_deleted = Column(Boolean, server_default=text("false"))
 
@@ -19,3 +21,6 @@ class MasterCities(Base):
 
     created_user = relationship("User", foreign_keys=[created_by], lazy="joined", post_update=True)
     updated_user = relationship("User", foreign_keys=[updated_by], lazy="joined", post_update=True)
+
+
+live_unique_index(MasterCities.name, MasterCities.state_id)
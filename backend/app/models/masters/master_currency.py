@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, text, Numeric
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.db import Base
+from app.utils.unique import live_unique_index
 
 
 class MasterCurrency(Base):
@@ -11,6 +12,7 @@ class MasterCurrency(Base):
     currency_code = Column(String(10), unique=True, nullable=False)
     currency_name = Column(String(50), nullable=False)
     symbol = Column(String(10), nullable=True)
+    exchange_rate = Column(Numeric(18, 6), nullable=True)  # units of the reporting currency per 1 unit
 
     is_active = Column(Boolean, server_default=text("true"))
     is_deleted = Column(Boolean, server_default=text("false"))
@@ -22,3 +24,6 @@ class MasterCurrency(Base):
 
     created_user = relationship("User", foreign_keys=[created_by], lazy="joined", post_update=True)
     updated_user = relationship("User", foreign_keys=[updated_by], lazy="joined", post_update=True)
+
+
+live_unique_index(MasterCurrency.currency_code)
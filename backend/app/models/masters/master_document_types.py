@@ -2,6 +2,7 @@ from sqlalchemy import Column, BigInteger, String, Boolean, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.db import Base
+from app.utils.unique import live_unique_index
 
 
 class DocumentType(Base):
@@ -22,3 +23,6 @@ class DocumentType(Base):
     # relationships with User (if needed)
     created_user = relationship("User", foreign_keys=[created_by], lazy="joined", post_update=True)
     updated_user = relationship("User", foreign_keys=[updated_by], lazy="joined", post_update=True)
+
+
+live_unique_index(DocumentType.document_type_name)
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, BigInteger, DateTime, ForeignKey, CheckConstraint, Index
+from datetime import datetime
+from app.database.db import Base
+
+
+class MasterZipRange(Base):
+    """An inclusive range of numeric zip / PIN codes that belongs to one city."""
+    __tablename__ = "master_zip_ranges"
+    __table_args__ = (
+        CheckConstraint("zip_from <= zip_to", name="ck_zip_ranges_order"),
+        Index("ix_zip_ranges_from", "zip_from"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    city_id = Column(Integer, ForeignKey('master_cities.id', ondelete="CASCADE"), nullable=False, index=True)
+    zip_from = Column(BigInteger, nullable=False)
+    zip_to = Column(BigInteger, nullable=False)
+
+    created_by = Column(Integer, ForeignKey('tbl_users.id', ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -11,20 +11,25 @@ class Company(Base):
     # General Info
     gst_no = Column(String(15))
     pan_no = Column(String(10))
-    industry_segment_id = Column(Integer)  # Remove FK for now
+    industry_segment_id = Column(Integer, index=True)  # Remove FK for now
     company_name = Column(String(255), nullable=False)
     website = Column(String(255))
     is_child = Column(Boolean, default=False)
-    parent_company_id = Column(Integer, ForeignKey("tbl_companies.id"), nullable=True)
+    parent_company_id = Column(Integer, ForeignKey("tbl_companies.id"), nullable=True, index=True)
     
-    # Account Details
-    account_type_id = Column(Integer)  # Remove FK for now
-    account_sub_type_id = Column(Integer)  # Remove FK for now
-    business_type_id = Column(Integer)  # Remove FK for now
-    account_region_id = Column(Integer)  # Remove FK for now
+    # Account Details (indexed for list filters and facets)
+    account_type_id = Column(Integer, index=True)  # Remove FK for now
+    account_sub_type_id = Column(Integer, index=True)  # Remove FK for now
+    business_type_id = Column(Integer, index=True)  # Remove FK for now
+    account_region_id = Column(Integer, index=True)  # Remove FK for now
     
     # Company Profile
     company_profile = Column(Text)
+
+    # Account score (0-100), recomputed in batches by company_scoring_service
+    account_score = Column(Numeric(5, 2), index=True)
+    score_stale = Column(Boolean, server_default=text("true"), index=True)
+    scored_at = Column(DateTime)
     
     # Standard fields
     is_active = Column(Boolean, server_default=text("true"))
@@ -50,12 +55,12 @@ class CompanyAddress(Base):
     __tablename__ = 'tbl_company_addresses'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    company_id = Column(Integer, ForeignKey("tbl_companies.id"), nullable=False)
+    company_id = Column(Integer, ForeignKey("tbl_companies.id"), nullable=False, index=True)
     address_type_id = Column(Integer)  # Remove FK for now
     address = Column(Text)
-    country_id = Column(Integer)  # Remove FK for now
-    state_id = Column(Integer)  # Remove FK for now
-    city_id = Column(Integer)  # Remove FK for now
+    country_id = Column(Integer, index=True)  # Remove FK for now
+    state_id = Column(Integer, index=True)  # Remove FK for now
+    city_id = Column(Integer, index=True)  # Remove FK for now
     zip_code = Column(String(10))
     
     # Standard fields
@@ -122,6 +127,9 @@ class CompanyDocument(Base):
     file_path = Column(String(500))
     file_size = Column(Integer)
     description = Column(Text)
+    # Uploaded content: SHA-256 of the bytes, stored once under DOCUMENT_STORAGE_DIR at file_path
+    content_hash = Column(String(64), index=True)
+    content_type = Column(String(100))
     
     # Standard fields
     is_active = Column(Boolean, server_default=text("true"))
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from app.database.db import Base
+
+class CompanyDedupKey(Base):
+    """
+    Blocking keys for duplicate detection: one row per (key_type, key_value) a company
+    produces (normalised GST, PAN, website domain, canonical name, name shingles).
+    Companies sharing a key are duplicate candidates; maintained by
+    app.services.sales.company_dedup_service.
+    """
+    __tablename__ = 'tbl_company_dedup_keys'
+
+    key_type = Column(String(20), primary_key=True)
+    key_value = Column(String(255), primary_key=True)
+    company_id = Column(Integer, ForeignKey("tbl_companies.id"), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_company_dedup_keys_company", "company_id"),
+    )
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, BigInteger
+from datetime import datetime
+from app.database.db import Base
+
+class CompanyDocumentUpload(Base):
+    """
+    A resumable upload in progress. Chunks are appended to a part file under
+    DOCUMENT_STORAGE_DIR/uploads; on completion the bytes move to their content
+    address and the session row is replaced by a CompanyDocument.
+    Managed by app.services.sales.company_document_service.
+    """
+    __tablename__ = 'tbl_company_document_uploads'
+
+    id = Column(String(32), primary_key=True)  # uuid4 hex, also names the part file
+    company_id = Column(Integer, ForeignKey("tbl_companies.id"), nullable=False, index=True)
+    document_type_id = Column(Integer)
+    file_name = Column(String(255), nullable=False)
+    content_type = Column(String(100))
+    description = Column(Text)
+    total_size = Column(BigInteger, nullable=False)
+    received_size = Column(BigInteger, nullable=False, default=0)
+
+    created_by = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Numeric, Index
+from datetime import datetime
+from app.database.db import Base
+
+class CompanyFinancialSummary(Base):
+    """
+    Per-company rollup of CompanyTurnover / CompanyProfit in the reporting currency.
+    One row per company, refreshed by app.services.sales.company_financials_service
+    whenever the company or its financial rows change, so dashboards read one row per
+    company instead of every financial row.
+    """
+    __tablename__ = 'tbl_company_financial_summary'
+
+    company_id = Column(Integer, ForeignKey("tbl_companies.id"), primary_key=True)
+
+    # Copied from the company so segment/region rollups need no join
+    industry_segment_id = Column(Integer)
+    account_region_id = Column(Integer)
+
+    latest_year = Column(Integer)
+    latest_turnover = Column(Numeric(20, 2))
+    previous_year = Column(Integer)
+    previous_turnover = Column(Numeric(20, 2))
+    yoy_growth = Column(Numeric(12, 4))  # (latest - previous) / previous
+    latest_profit = Column(Numeric(20, 2))
+    profit_margin = Column(Numeric(12, 4))  # latest_profit / latest_turnover, same year
+    revenue_band = Column(String(20))
+    has_unconverted = Column(Boolean, default=False)  # some rows lack an exchange rate and were skipped
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_company_financial_summary_turnover", "latest_turnover"),
+        Index("ix_company_financial_summary_growth", "yoy_growth"),
+        Index("ix_company_financial_summary_band", "revenue_band"),
+        Index("ix_company_financial_summary_segment", "industry_segment_id"),
+        Index("ix_company_financial_summary_region", "account_region_id"),
+    )
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, ForeignKey, Index
+from app.database.db import Base
+
+class CompanyHierarchy(Base):
+    """
+    Closure table for the parent/child company tree.
+    One row per (ancestor, descendant) pair, including the (id, id, 0) self row,
+    maintained by app.services.sales.company_hierarchy_service.
+    """
+    __tablename__ = 'tbl_company_hierarchy'
+
+    ancestor_id = Column(Integer, ForeignKey("tbl_companies.id"), primary_key=True)
+    descendant_id = Column(Integer, ForeignKey("tbl_companies.id"), primary_key=True)
+    depth = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_company_hierarchy_descendant_depth", "descendant_id", "depth"),
+    )
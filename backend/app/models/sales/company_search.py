@@ -0,0 +1,48 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, DDL, event, text
+from datetime import datetime
+from app.database.db import Base
+
+# Weighted document vector shared by the GIN index and the search query, so Postgres
+# can answer `@@` from the index. Title (company name) ranks above the body.
+PG_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(search_title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(search_body, '')), 'B')"
+)
+
+# SQLite keeps an external-content FTS5 table in step with the documents via triggers
+SQLITE_FTS_TABLE = "tbl_company_search_fts"
+
+
+class CompanySearchDocument(Base):
+    """
+    Denormalised, pre-normalised search text for one company (name, GST, PAN, website,
+    profile and address cities), maintained by app.services.sales.company_search_service.
+    """
+    __tablename__ = 'tbl_company_search_documents'
+
+    company_id = Column(Integer, ForeignKey("tbl_companies.id"), primary_key=True)
+    search_title = Column(String(255), nullable=False)
+    search_body = Column(Text)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index(
+            "ix_company_search_documents_tsv",
+            text(f"({PG_SEARCH_VECTOR})"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+for _statement in (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+    "search_title, search_body, content='tbl_company_search_documents', content_rowid='company_id')",
+    f"CREATE TRIGGER IF NOT EXISTS tbl_company_search_documents_ai AFTER INSERT ON tbl_company_search_documents BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, search_title, search_body) VALUES (new.company_id, new.search_title, new.search_body); END",
+    f"CREATE TRIGGER IF NOT EXISTS tbl_company_search_documents_ad AFTER DELETE ON tbl_company_search_documents BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, search_title, search_body) VALUES ('delete', old.company_id, old.search_title, old.search_body); END",
+    f"CREATE TRIGGER IF NOT EXISTS tbl_company_search_documents_au AFTER UPDATE ON tbl_company_search_documents BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, search_title, search_body) VALUES ('delete', old.company_id, old.search_title, old.search_body); "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, search_title, search_body) VALUES (new.company_id, new.search_title, new.search_body); END",
+):
+    event.listen(CompanySearchDocument.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
@@ -1,8 +1,20 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, text, Date
+from sqlalchemy import Column, Integer, SmallInteger, String, Text, Boolean, DateTime, ForeignKey, text, Date, Computed, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.db import Base
 
+# Bit of Contact.comm_prefs set when the contact opted out of the channel
+COMM_PREF_BITS = {
+    "solicit": 1,
+    "mail": 2,
+    "fax": 4,
+    "email": 8,
+    "call": 16,
+}
+COMM_PREFS_SQL = " + ".join(
+    f"(CASE WHEN dont_{channel} THEN {bit} ELSE 0 END)" for channel, bit in COMM_PREF_BITS.items()
+)
+
 class Contact(Base):
     __tablename__ = 'tbl_contacts'
 
@@ -28,6 +40,9 @@ class Contact(Base):
     dont_fax = Column(Boolean, default=False)
     dont_email = Column(Boolean, default=False)
     dont_call = Column(Boolean, default=False)
+    # The dont_* flags packed into COMM_PREF_BITS, generated by the database; segment
+    # filters turn into `comm_prefs IN (...)` over at most 32 values on its index
+    comm_prefs = Column(SmallInteger, Computed(COMM_PREFS_SQL, persisted=True))
     
     # Standard fields
     is_active = Column(Boolean, server_default=text("true"))
@@ -43,6 +58,10 @@ class Contact(Base):
     # One-to-many relationships
     addresses = relationship("ContactAddress", back_populates="contact", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_contacts_comm_prefs_company", "comm_prefs", "company_id"),
+    )
+
 
 class ContactAddress(Base):
     __tablename__ = 'tbl_contact_addresses'
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from app.database.db import Base
+
+class ContactIdentifier(Base):
+    """
+    Normalised reachability keys of a contact: one row per (kind, value) it holds, where
+    kind is "email" (trimmed, lower-cased) or "phone" (E.164-style "+<digits>" built from
+    primary_no / secondary_no / alternate_no). Backs exact caller lookup and duplicate
+    detection; maintained by app.services.sales.contact_identifier_service.
+    """
+    __tablename__ = 'tbl_contact_identifiers'
+
+    kind = Column(String(10), primary_key=True)
+    value = Column(String(150), primary_key=True)
+    contact_id = Column(Integer, ForeignKey("tbl_contacts.id"), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_contact_identifiers_contact", "contact_id"),
+    )
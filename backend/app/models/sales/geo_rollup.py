@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, SmallInteger
+from app.database.db import Base
+
+class GeoRollup(Base):
+    """
+    Live company / contact counts per territory, kept current by
+    app.services.sales.geo_rollup_service as addresses change.
+
+    One row per (level, address_type_id, country_id, state_id, city_id):
+    level 1 = country, 2 = state, 3 = city; coarser levels store 0 in the finer
+    columns, a missing id is also stored as 0, and address_type_id 0 means any type.
+    A company or contact counts once per territory however many addresses it has there.
+    """
+    __tablename__ = 'tbl_geo_rollup'
+
+    level = Column(SmallInteger, primary_key=True)
+    address_type_id = Column(Integer, primary_key=True)
+    country_id = Column(Integer, primary_key=True)
+    state_id = Column(Integer, primary_key=True)
+    city_id = Column(Integer, primary_key=True)
+
+    company_count = Column(Integer, nullable=False, default=0)
+    contact_count = Column(Integer, nullable=False, default=0)
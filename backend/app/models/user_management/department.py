@@ -2,6 +2,7 @@ from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Inte
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.db import Base
+from app.utils.unique import live_unique_index
 
 class Department(Base):
     __tablename__ = 'mst_departments'
@@ -22,3 +23,6 @@ class Department(Base):
     sub_departments = relationship("SubDepartment", back_populates="department", cascade="all, delete-orphan", lazy="joined")
     created_user = relationship("User", foreign_keys=[created_by], lazy="joined", post_update=True)
     updated_user = relationship("User", foreign_keys=[updated_by], lazy="joined", post_update=True)
+
+
+live_unique_index(Department.name)
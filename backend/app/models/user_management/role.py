@@ -2,6 +2,7 @@ from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Inte
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.db import Base
+from app.utils.unique import live_unique_index
 
 class Role(Base):
     __tablename__ = 'mst_roles'
@@ -21,3 +22,6 @@ class Role(Base):
     created_user = relationship("User", foreign_keys=[created_by], lazy="joined", post_update=True)
     updated_user = relationship("User", foreign_keys=[updated_by], lazy="joined", post_update=True)
     users = relationship("User", back_populates="role", foreign_keys="User.role_id")
+
+
+live_unique_index(Role.name)
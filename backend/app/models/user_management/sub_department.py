@@ -2,6 +2,7 @@ from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Inte
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.db import Base
+from app.utils.unique import live_unique_index
 
 class SubDepartment(Base):
     __tablename__ = 'mst_sub_departments'
@@ -24,3 +25,6 @@ class SubDepartment(Base):
     users = relationship("User", back_populates="sub_department", foreign_keys="User.sub_department_id", lazy="select")
     created_user = relationship("User", foreign_keys=[created_by], lazy="joined", post_update=True)
     updated_user = relationship("User", foreign_keys=[updated_by], lazy="joined", post_update=True)
+
+
+live_unique_index(SubDepartment.name, SubDepartment.department_id)
@@ -11,26 +11,14 @@ from app.api.v1.endpoints.user_management import designation
 from app.api.v1.endpoints.user_management import user_dropdown
 
 
-from app.api.v1.endpoints.masters import business_vertical
-from app.api.v1.endpoints.masters import region
-from app.api.v1.endpoints.masters import company_type
-from app.api.v1.endpoints.masters import head_of_company
-from app.api.v1.endpoints.masters import job_function
-from app.api.v1.endpoints.masters import partner_type
-from app.api.v1.endpoints.masters import product_service_interest
-from app.api.v1.endpoints.masters import master_account_type
-from app.api.v1.endpoints.masters import master_business_type
-from app.api.v1.endpoints.masters import master_industry_segment
-from app.api.v1.endpoints.masters import master_sub_industry_segment
-from app.api.v1.endpoints.masters import master_address_type
-from app.api.v1.endpoints.masters import master_countries
-from app.api.v1.endpoints.masters import master_state
-from app.api.v1.endpoints.masters import master_cities
-from app.api.v1.endpoints.masters import master_document_type
-from app.api.v1.endpoints.masters import master_currency
+from app.api.v1.endpoints.masters.master_router import build_master_router
+from app.api.v1.endpoints.masters import geo
+from app.services.masters.master_registry import MASTERS
 # Sales endpoints
 from app.api.v1.endpoints.sales import company
 from app.api.v1.endpoints.sales import contact
+from app.api.v1.endpoints.sales import analytics
+from app.api.v1.endpoints.sales import company_document
 
 from app.core import auth
 
@@ -46,28 +34,16 @@ api_router.include_router(user_permission.router, prefix="/user_permissions", ta
 api_router.include_router(department.router, prefix="/departments", tags=["Department"])
 api_router.include_router(sub_department.router, prefix="/sub-departments", tags=["SubDepartment"])
 api_router.include_router(designation.router, prefix="/designations", tags=["Designation"])
-api_router.include_router(business_vertical.router, prefix="/business_verticals", tags=["Business-Vertical"])
-api_router.include_router(region.router, prefix="/regions", tags=["Region"])
+for spec in MASTERS.values():
+    api_router.include_router(build_master_router(spec), prefix=f"/{spec.key}", tags=[spec.tag])
+api_router.include_router(geo.router, prefix="/geo", tags=["Geo"])
 api_router.include_router(user_dropdown.router, prefix="/user_dropdowns", tags=["dropdown"])
-api_router.include_router(company_type.router, prefix="/company_types", tags=["Company Type"])
-api_router.include_router(head_of_company.router, prefix="/head_companies", tags=["Head Of Company"])
-api_router.include_router(job_function.router, prefix="/job_functions",tags=["Job Functions"])
-api_router.include_router(partner_type.router, prefix="/partner_types",tags=["Partner Type"])
-api_router.include_router(product_service_interest.router, prefix="/product_service_interests",tags=["Product Service Interest"])
-api_router.include_router(master_account_type.router, prefix="/account_types",tags=["Account Type"])
-api_router.include_router(master_business_type.router, prefix="/business_types",tags=["Business Type"])
-api_router.include_router(master_industry_segment.router, prefix="/industry_segments", tags=["Industry Segments"])
-api_router.include_router(master_sub_industry_segment.router, prefix="/sub_industry_segments", tags=["Sub Industry Segments"])
-api_router.include_router(master_address_type.router, prefix="/address_types", tags=["Address Type"])
-api_router.include_router(master_countries.router, prefix="/countries", tags=["Countries"])
-api_router.include_router(master_state.router, prefix="/states", tags=["State"])
-api_router.include_router(master_cities.router, prefix="/cities", tags=["City"])
-api_router.include_router(master_cities.router, prefix="/document_types", tags=["Document"])
-api_router.include_router(master_currency.router, prefix="/currencies", tags=["Currency"])
 
 # Sales module routes
 api_router.include_router(company.router, prefix="/sales/companies", tags=["Companies"])
+api_router.include_router(company_document.router, prefix="/sales/companies", tags=["Company Documents"])
 api_router.include_router(contact.router, prefix="/sales/contacts", tags=["Contacts"])
+api_router.include_router(analytics.router, prefix="/sales/analytics", tags=["Sales Analytics"])
 
 
 
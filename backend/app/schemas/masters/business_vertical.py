@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any
 from datetime import datetime
 from .DefaultResponse import DefaultResponse
 
@@ -68,7 +68,7 @@ class BusinessVerticalExportOut(BaseModel):
 
 # ---------------- API Response ----------------
 class BusinessVerticalResponse(DefaultResponse):
-    data: Optional[Union[BusinessVerticalOut, PaginatedBusinessVerticals, List[BusinessVerticalExportOut]]] = None
+    data: Optional[Union[BusinessVerticalOut, PaginatedBusinessVerticals, List[BusinessVerticalExportOut], Dict[str, Any]]] = None
 
     class Config:
         orm_mode = True
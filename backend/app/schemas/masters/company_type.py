@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any
 from datetime import datetime
 from .DefaultResponse import DefaultResponse
 
@@ -65,7 +65,7 @@ class CompanyTypeExportOut(BaseModel):
 
 # ---------------- API Response ----------------
 class CompanyTypeResponse(DefaultResponse):
-    data: Optional[Union[CompanyTypeOut, PaginatedCompanyTypes, List[CompanyTypeExportOut]]] = None
+    data: Optional[Union[CompanyTypeOut, PaginatedCompanyTypes, List[CompanyTypeExportOut], Dict[str, Any]]] = None
 
     class Config:
         orm_mode = True
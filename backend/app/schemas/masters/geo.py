@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+
+# ---------------- Zip Ranges ----------------
+class ZipRangeCreate(BaseModel):
+    city_id: int
+    zip_from: int = Field(..., ge=0)
+    zip_to: int = Field(..., ge=0)
+
+
+class ZipRangeBulkCreate(BaseModel):
+    ranges: List[ZipRangeCreate] = Field(..., min_length=1, max_length=1000)
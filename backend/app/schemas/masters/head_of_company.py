@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any
 from datetime import datetime
 from .DefaultResponse import DefaultResponse
 
@@ -68,7 +68,7 @@ class HeadCompanyExportOut(BaseModel):
 
 # ---------------- API Response ----------------
 class HeadCompanyResponse(DefaultResponse):
-    data: Optional[Union[HeadCompanyOut, PaginatedHeadCompanies, List[HeadCompanyExportOut]]] = None
+    data: Optional[Union[HeadCompanyOut, PaginatedHeadCompanies, List[HeadCompanyExportOut], Dict[str, Any]]] = None
 
     class Config:
         orm_mode = True
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any
 from datetime import datetime
 from .DefaultResponse import DefaultResponse
 
@@ -68,7 +68,7 @@ class JobFunctionExportOut(BaseModel):
 
 # ---------------- API Response ----------------
 class JobFunctionResponse(DefaultResponse):
-    data: Optional[Union[JobFunctionOut, PaginatedJobFunctions, List[JobFunctionExportOut]]] = None
+    data: Optional[Union[JobFunctionOut, PaginatedJobFunctions, List[JobFunctionExportOut], Dict[str, Any]]] = None
 
     class Config:
         orm_mode = True
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any
 from datetime import datetime
 from .DefaultResponse import DefaultResponse
 
@@ -72,7 +72,8 @@ class MasterAccountTypeResponse(DefaultResponse):
     data: Optional[Union[
         MasterAccountTypeOut,
         PaginatedMasterAccountTypes,
-        List[MasterAccountTypeExportOut]
+        List[MasterAccountTypeExportOut],
+        Dict[str, Any]
     ]] = None
 
     class Config:
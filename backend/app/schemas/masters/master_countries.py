@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any
 from datetime import datetime
 from .DefaultResponse import DefaultResponse
 
@@ -72,7 +72,8 @@ class MasterCountryResponse(DefaultResponse):
     data: Optional[Union[
         MasterCountryOut,
         PaginatedMasterCountries,
-        List[MasterCountryExportOut]
+        List[MasterCountryExportOut],
+        Dict[str, Any]
     ]] = None
 
     class Config:
@@ -1,6 +1,7 @@
 from typing import Optional, List, Union
 from pydantic import BaseModel, Field
 from datetime import datetime
+from decimal import Decimal
 
 
 # --------- Base ---------
@@ -8,6 +9,7 @@ class MasterCurrencyBase(BaseModel):
     currency_code: str = Field(..., min_length=2, max_length=10)
     currency_name: str = Field(..., min_length=2, max_length=50)
     symbol: Optional[str] = None
+    exchange_rate: Optional[Decimal] = Field(None, gt=0)
     is_active: Optional[bool] = True
     is_deleted: Optional[bool] = False
 
@@ -22,6 +24,7 @@ class MasterCurrencyUpdate(BaseModel):
     currency_code: Optional[str] = None
     currency_name: Optional[str] = None
     symbol: Optional[str] = None
+    exchange_rate: Optional[Decimal] = Field(None, gt=0)
     is_active: Optional[bool] = None
 
 
@@ -31,6 +34,7 @@ class MasterCurrencyOut(BaseModel):
     currency_code: str
     currency_name: str
     symbol: Optional[str]
+    exchange_rate: Optional[Decimal] = None
     is_active: bool
     is_deleted: bool
     created_by: Optional[int]
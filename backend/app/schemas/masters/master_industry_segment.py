@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any
 from datetime import datetime
 from .DefaultResponse import DefaultResponse
 
@@ -72,7 +72,8 @@ class MasterIndustrySegmentResponse(DefaultResponse):
     data: Optional[Union[
         MasterIndustrySegmentOut,
         PaginatedMasterIndustrySegments,
-        List[MasterIndustrySegmentExportOut]
+        List[MasterIndustrySegmentExportOut],
+        Dict[str, Any]
     ]] = None
 
     class Config:
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any
 from datetime import datetime
 from .DefaultResponse import DefaultResponse
 
@@ -8,6 +8,7 @@ from .DefaultResponse import DefaultResponse
 class MasterStateBase(BaseModel):
     name: str = Field(..., min_length=3)
     description: Optional[str] = None
+    country_id: Optional[int] = None
     is_active: Optional[bool] = True
     is_deleted: Optional[bool] = False
 
@@ -26,6 +27,7 @@ class MasterStateOut(BaseModel):
     id: int
     name: Optional[str] = None
     description: Optional[str] = None
+    country_id: Optional[int] = None
     is_active: Optional[bool] = True
     is_deleted: Optional[bool] = False
     created_by: Optional[int] = None
@@ -72,7 +74,8 @@ class MasterStateResponse(DefaultResponse):
     data: Optional[Union[
         MasterStateOut,
         PaginatedMasterStates,
-        List[MasterStateExportOut]
+        List[MasterStateExportOut],
+        Dict[str, Any]
     ]] = None
 
     class Config:
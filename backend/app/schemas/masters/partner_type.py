@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any
 from datetime import datetime
 from .DefaultResponse import DefaultResponse
 
@@ -68,7 +68,7 @@ class PartnerTypeExportOut(BaseModel):
 
 # ---------------- API Response ----------------
 class PartnerTypeResponse(DefaultResponse):
-    data: Optional[Union[PartnerTypeOut, PaginatedPartnerTypes, List[PartnerTypeExportOut]]] = None
+    data: Optional[Union[PartnerTypeOut, PaginatedPartnerTypes, List[PartnerTypeExportOut], Dict[str, Any]]] = None
 
     class Config:
         orm_mode = True
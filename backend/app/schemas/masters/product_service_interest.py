@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any
 from datetime import datetime
 from .DefaultResponse import DefaultResponse
 
@@ -71,7 +71,8 @@ class ProductServiceInterestResponse(DefaultResponse):
     data: Optional[Union[
         ProductServiceInterestOut,
         PaginatedProductServiceInterest,
-        List[ProductServiceInterestExportOut]
+        List[ProductServiceInterestExportOut],
+        Dict[str, Any]
     ]] = None
 
     class Config:
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any
 from datetime import datetime
 from .DefaultResponse import DefaultResponse
 
@@ -55,7 +55,7 @@ class RegionExportOut(BaseModel):
 
 # ---------------- API Response Wrapper ----------------
 class RegionResponse(DefaultResponse):
-    data: Optional[Union[RegionOut, PaginatedRegions]] = None
+    data: Optional[Union[RegionOut, PaginatedRegions, Dict[str, Any]]] = None
 
     class Config:
         orm_mode = True
@@ -19,7 +19,7 @@ class CompanyAddressCreate(CompanyAddressBase):
 
 
 class CompanyAddressUpdate(CompanyAddressBase):
-    pass
+    id: Optional[int] = None  # existing row to update; omit to insert
 
 
 class CompanyAddressResponse(CompanyAddressBase):
@@ -44,7 +44,7 @@ class CompanyTurnoverCreate(CompanyTurnoverBase):
 
 
 class CompanyTurnoverUpdate(CompanyTurnoverBase):
-    pass
+    id: Optional[int] = None  # existing row to update; omit to insert
 
 
 class CompanyTurnoverResponse(CompanyTurnoverBase):
@@ -69,7 +69,7 @@ class CompanyProfitCreate(CompanyProfitBase):
 
 
 class CompanyProfitUpdate(CompanyProfitBase):
-    pass
+    id: Optional[int] = None  # existing row to update; omit to insert
 
 
 class CompanyProfitResponse(CompanyProfitBase):
@@ -96,12 +96,14 @@ class CompanyDocumentCreate(CompanyDocumentBase):
 
 
 class CompanyDocumentUpdate(CompanyDocumentBase):
-    pass
+    id: Optional[int] = None  # existing row to update; omit to insert
 
 
 class CompanyDocumentResponse(CompanyDocumentBase):
     id: int
     company_id: int
+    content_hash: Optional[str] = None
+    content_type: Optional[str] = None
     is_active: bool
     created_at: datetime
     updated_at: datetime
@@ -134,14 +136,109 @@ class CompanyCreate(CompanyBase):
 
 
 class CompanyUpdate(CompanyBase):
-    addresses: Optional[List[CompanyAddressUpdate]] = []
-    turnover_records: Optional[List[CompanyTurnoverUpdate]] = []
-    profit_records: Optional[List[CompanyProfitUpdate]] = []
-    documents: Optional[List[CompanyDocumentUpdate]] = []
+    # None (omitted) leaves the collection untouched; a list is reconciled by id
+    addresses: Optional[List[CompanyAddressUpdate]] = None
+    turnover_records: Optional[List[CompanyTurnoverUpdate]] = None
+    profit_records: Optional[List[CompanyProfitUpdate]] = None
+    documents: Optional[List[CompanyDocumentUpdate]] = None
+
+
+class CompanyBulkCreate(BaseModel):
+    companies: List[CompanyCreate] = Field(..., min_length=1, max_length=1000)
+
+
+class CompanyBulkItemResult(BaseModel):
+    index: int
+    status: str  # "created" | "failed"
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class CompanyBulkCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[CompanyBulkItemResult]
+
+
+class CompanyFilters(BaseModel):
+    # List filters and facet selections; several values of one field are OR-ed, fields are AND-ed
+    industry_segment_id: Optional[List[int]] = None
+    account_type_id: Optional[List[int]] = None
+    account_sub_type_id: Optional[List[int]] = None
+    business_type_id: Optional[List[int]] = None
+    account_region_id: Optional[List[int]] = None
+    is_child: Optional[bool] = None
+    parent_company_id: Optional[int] = None
+    # Matched against the company's live addresses
+    country_id: Optional[List[int]] = None
+    state_id: Optional[List[int]] = None
+    city_id: Optional[List[int]] = None
+
+
+class CompanyBulkFilter(BaseModel):
+    search: Optional[str] = None
+    industry_segment_id: Optional[int] = None
+    account_type_id: Optional[int] = None
+    account_sub_type_id: Optional[int] = None
+    business_type_id: Optional[int] = None
+    account_region_id: Optional[int] = None
+    parent_company_id: Optional[int] = None
+    is_active: Optional[bool] = None
+
+
+class CompanyBulkSelection(BaseModel):
+    # Exactly one of: explicit ids, or a filter with at least one condition
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=10000)
+    filter: Optional[CompanyBulkFilter] = None
+
+
+class CompanyBulkStatus(CompanyBulkSelection):
+    is_active: bool
+
+
+class CompanyBulkReassign(CompanyBulkSelection):
+    # Only the fields sent are changed; send null to clear one
+    account_region_id: Optional[int] = None
+    account_type_id: Optional[int] = None
+    account_sub_type_id: Optional[int] = None
+
+
+class CompanyDocumentUploadCreate(BaseModel):
+    file_name: str = Field(..., min_length=1, max_length=255)
+    total_size: int = Field(..., ge=0)
+    content_type: Optional[str] = Field(None, max_length=100)
+    document_type_id: Optional[int] = None
+    description: Optional[str] = None
+
+
+class CompanyDocumentUploadResponse(BaseModel):
+    id: str
+    company_id: int
+    file_name: str
+    total_size: int
+    received_size: int
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class CompanyMerge(BaseModel):
+    source_ids: List[int] = Field(..., min_length=1, max_length=100)
+
+
+class CompanyDedupCheck(BaseModel):
+    company_name: Optional[str] = None
+    gst_no: Optional[str] = None
+    pan_no: Optional[str] = None
+    website: Optional[str] = None
+    exclude_id: Optional[int] = None  # the company being edited
 
 
 class CompanyResponse(CompanyBase):
     id: int
+    account_score: Optional[Decimal] = None
     is_active: bool
     created_at: datetime
     updated_at: datetime
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime, date
+from app.schemas.sales.company import CompanyFilters
 
 
 # Base schemas for nested models
@@ -18,7 +19,7 @@ class ContactAddressCreate(ContactAddressBase):
 
 
 class ContactAddressUpdate(ContactAddressBase):
-    pass
+    id: Optional[int] = None  # existing row to update; omit to insert
 
 
 class ContactAddressResponse(ContactAddressBase):
@@ -58,7 +59,8 @@ class ContactCreate(ContactBase):
 
 
 class ContactUpdate(ContactBase):
-    addresses: Optional[List[ContactAddressUpdate]] = []
+    # None (omitted) leaves the addresses untouched; a list is reconciled by id
+    addresses: Optional[List[ContactAddressUpdate]] = None
 
 
 class ContactResponse(ContactBase):
@@ -72,6 +74,23 @@ class ContactResponse(ContactBase):
         from_attributes = True
 
 
+class ContactBulkCreate(BaseModel):
+    contacts: List[ContactCreate] = Field(..., min_length=1, max_length=1000)
+
+
+class ContactBulkItemResult(BaseModel):
+    index: int
+    status: str  # "created" | "failed"
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class ContactBulkCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[ContactBulkItemResult]
+
+
 class ContactListResponse(BaseModel):
     contacts: List[ContactResponse]
     total: int
@@ -82,6 +101,23 @@ class ContactListResponse(BaseModel):
         from_attributes = True
 
 
+class ContactBulkFilter(BaseModel):
+    search: Optional[str] = None
+    company_id: Optional[int] = None
+    designation_id: Optional[int] = None
+    is_active: Optional[bool] = None
+
+
+class ContactBulkSelection(BaseModel):
+    # Exactly one of: explicit ids, or a filter with at least one condition
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=10000)
+    filter: Optional[ContactBulkFilter] = None
+
+
+class ContactBulkStatus(ContactBulkSelection):
+    is_active: bool
+
+
 class ContactExportOut(BaseModel):
     id: int
     first_name: str
@@ -94,4 +130,18 @@ class ContactExportOut(BaseModel):
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class ContactSegment(BaseModel):
+    # Company attributes and region (account_region_id, company address geography)
+    company: Optional[CompanyFilters] = None
+    # Matched against the contact's own live addresses
+    country_id: Optional[List[int]] = None
+    state_id: Optional[List[int]] = None
+    city_id: Optional[List[int]] = None
+    # Channels (solicit, mail, fax, email, call) the contact must not have opted out of
+    reachable_by: Optional[List[str]] = None
+    # Channels the contact must have opted out of
+    opted_out_of: Optional[List[str]] = None
+    include_inactive: bool = False
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any
 from datetime import datetime
 from .DefaultResponse import DefaultResponse
 
@@ -118,7 +118,7 @@ class UserExportOut(BaseModel):
 
 # ---------------- API Response ----------------
 class UserResponse(DefaultResponse):
-    data: Optional[Union[UserOut, PaginatedUsers]] = None
+    data: Optional[Union[UserOut, PaginatedUsers, Dict[str, Any]]] = None
 
     class Config:
         orm_mode = True
@@ -0,0 +1,175 @@
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import select, insert, delete
+from sqlalchemy.orm import Session
+
+from app.models.masters.master_zip_ranges import MasterZipRange
+from app.schemas.masters.geo import ZipRangeCreate
+from app.services.masters import master_service as MasterService
+from app.services.masters.master_registry import MASTERS
+
+# Zip / PIN codes are matched on their digits; longer inputs are not codes
+ZIP_MAX_DIGITS = 10
+
+
+# ---------------- Index ----------------
+@dataclass(frozen=True)
+class GeoIndex:
+    """Zip ranges sorted by start, resolved through the country / state / city snapshots."""
+    sources: Tuple[Any, ...]                   # snapshots + zip write counter it was built from
+    expires: float
+    starts: Tuple[int, ...]
+    ranges: Tuple[Tuple[int, int, int], ...]   # (zip_from, zip_to, city_id), same order as starts
+
+
+_index: Optional[GeoIndex] = None
+_zip_version = 0
+_lock = threading.Lock()
+
+
+def _sources(db: Session) -> Tuple[Any, ...]:
+    return (
+        MasterService.snapshot(db, MASTERS["countries"]),
+        MasterService.snapshot(db, MASTERS["states"]),
+        MasterService.snapshot(db, MASTERS["cities"]),
+        _zip_version,
+    )
+
+
+def geo_index(db: Session) -> GeoIndex:
+    """The current index; rebuilt when a geo master or the zip ranges changed (or it expired)."""
+    global _index
+    sources = _sources(db)
+    current = _index
+    if current is not None and current.expires > time.monotonic() and all(
+        a is b for a, b in zip(current.sources[:3], sources[:3])
+    ) and current.sources[3] == sources[3]:
+        return current
+    ranges = tuple(
+        tuple(row) for row in db.execute(
+            select(MasterZipRange.zip_from, MasterZipRange.zip_to, MasterZipRange.city_id)
+            .order_by(MasterZipRange.zip_from)
+        )
+    )
+    fresh = GeoIndex(
+        sources=sources,
+        expires=time.monotonic() + MasterService.MASTER_CACHE_TTL,
+        starts=tuple(r[0] for r in ranges),
+        ranges=ranges,
+    )
+    with _lock:
+        if _zip_version == sources[3]:
+            _index = fresh
+    return fresh
+
+
+def _zip_code(value: str) -> int:
+    digits = "".join(ch for ch in (value or "") if ch.isdigit())
+    if not digits or len(digits) > ZIP_MAX_DIGITS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"'{value}' is not a valid zip code")
+    return int(digits)
+
+
+def _node(record: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    return None if record is None else {"id": record["id"], "name": record["name"]}
+
+
+def resolve(db: Session, zip_code: str) -> Optional[Dict[str, Any]]:
+    """City, state and country of a zip code: one binary search plus three snapshot lookups."""
+    code = _zip_code(zip_code)
+    index = geo_index(db)
+    at = bisect_right(index.starts, code) - 1
+    if at < 0 or index.ranges[at][1] < code:
+        return None
+    countries, states, cities = index.sources[:3]
+    city = cities.get(index.ranges[at][2])
+    if city is None:
+        return None
+    state = states.get(city["state_id"]) if city["state_id"] is not None else None
+    country = countries.get(state["country_id"]) if state and state["country_id"] is not None else None
+    return {"zip": zip_code, "city": _node(city), "state": _node(state), "country": _node(country)}
+
+
+# ---------------- Zip Ranges ----------------
+def _bump() -> None:
+    global _zip_version
+    with _lock:
+        _zip_version += 1
+
+
+def get_zip_ranges(db: Session, city_id: int) -> List[Dict[str, Any]]:
+    rows = db.execute(
+        select(MasterZipRange.id, MasterZipRange.city_id, MasterZipRange.zip_from, MasterZipRange.zip_to)
+        .where(MasterZipRange.city_id == city_id)
+        .order_by(MasterZipRange.zip_from)
+    )
+    return [dict(row._mapping) for row in rows]
+
+
+def add_zip_ranges(db: Session, ranges: List[ZipRangeCreate], login_id: int) -> List[Dict[str, Any]]:
+    """
+    Insert ranges in one executemany. Ranges may not overlap each other or an existing
+    range (a code resolves to exactly one city), and their cities must exist.
+    """
+    try:
+        reversed_range = next((r for r in ranges if r.zip_from > r.zip_to), None)
+        if reversed_range:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Zip range {reversed_range.zip_from}-{reversed_range.zip_to} ends before it starts"
+            )
+        city_ids = {r.city_id for r in ranges}
+        cities = MASTERS["cities"]
+        known = set(db.scalars(select(cities.pk).where(cities.pk.in_(city_ids), cities.model.is_deleted == False)))
+        if city_ids - known:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"City id(s) {', '.join(map(str, sorted(city_ids - known)))} do not exist"
+            )
+
+        low, high = min(r.zip_from for r in ranges), max(r.zip_to for r in ranges)
+        existing = db.execute(
+            select(MasterZipRange.zip_from, MasterZipRange.zip_to)
+            .where(MasterZipRange.zip_from <= high, MasterZipRange.zip_to >= low)
+        ).all()
+        spans = sorted([(r.zip_from, r.zip_to) for r in ranges] + [tuple(e) for e in existing])
+        for (_, previous_to), (start, end) in zip(spans, spans[1:]):
+            if start <= previous_to:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Zip range {start}-{end} overlaps another range"
+                )
+
+        rows = db.execute(
+            insert(MasterZipRange).returning(
+                MasterZipRange.id, MasterZipRange.city_id, MasterZipRange.zip_from, MasterZipRange.zip_to
+            ),
+            [{**r.model_dump(), "created_by": login_id} for r in ranges]
+        ).all()
+        db.commit()
+        _bump()
+        return [dict(row._mapping) for row in rows]
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to add zip ranges: {str(e)}")
+
+
+def delete_zip_range(db: Session, range_id: int) -> bool:
+    try:
+        deleted = db.scalar(delete(MasterZipRange).where(MasterZipRange.id == range_id).returning(MasterZipRange.id))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to delete zip range: {str(e)}")
+    if deleted is None:
+        return False
+    _bump()
+    return True
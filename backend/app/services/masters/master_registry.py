@@ -0,0 +1,195 @@
+from typing import Any, Dict
+
+from sqlalchemy.orm import Session
+
+from app.models.masters.business_vertical import BusinessVertical
+from app.models.masters.company_type import CompanyTypeMaster
+from app.models.masters.head_of_company import HeadCompanyMaster
+from app.models.masters.master_account_types import MasterAccountTypes
+from app.models.masters.master_address_type import MasterAddresssTypes
+from app.models.masters.master_business_types import MasterBusinessTypes
+from app.models.masters.master_cities import MasterCities
+from app.models.masters.master_countries import MasterCountries
+from app.models.masters.master_currency import MasterCurrency
+from app.models.masters.master_document_types import DocumentType
+from app.models.masters.master_industry_segment import MasterIndustrySegments
+from app.models.masters.master_job_function import JobFunction
+from app.models.masters.master_partner_type import MasterPartnerTypes
+from app.models.masters.master_states import MasterStates
+from app.models.masters.master_sub_industry_segment import MasterSubIndustrySegments
+from app.models.masters.product_service_interest import ProductServiceInterest
+from app.models.masters.region import Region
+from app.schemas.masters import business_vertical as BusinessVerticalSchema
+from app.schemas.masters import company_type as CompanyTypeSchema
+from app.schemas.masters import head_of_company as HeadCompanySchema
+from app.schemas.masters import job_function as JobFunctionSchema
+from app.schemas.masters import master_account_types as AccountTypeSchema
+from app.schemas.masters import master_address_type as AddressTypeSchema
+from app.schemas.masters import master_business_type as BusinessTypeSchema
+from app.schemas.masters import master_cities as CitySchema
+from app.schemas.masters import master_countries as CountrySchema
+from app.schemas.masters import master_currency as CurrencySchema
+from app.schemas.masters import master_document_type as DocumentTypeSchema
+from app.schemas.masters import master_industry_segment as IndustrySegmentSchema
+from app.schemas.masters import master_state as StateSchema
+from app.schemas.masters import master_sub_industry_segment as SubIndustrySegmentSchema
+from app.schemas.masters import partner_type as PartnerTypeSchema
+from app.schemas.masters import product_service_interest as ProductServiceInterestSchema
+from app.schemas.masters import region as RegionSchema
+from app.services.masters.master_service import MasterSpec
+from app.services.sales import company_financials_service
+
+
+def _refresh_currency(db: Session, currency_id: int, values: Dict[str, Any]) -> None:
+    # Converted turnover / profit of the companies using this currency depend on its rate
+    if "exchange_rate" in values or "currency_code" in values:
+        company_financials_service.refresh_currency(db, currency_id)
+
+
+# ---------------- Registry ----------------
+# One entry per master table, in the order the routers are mounted
+MASTERS: Dict[str, MasterSpec] = {spec.key: spec for spec in (
+    MasterSpec(
+        key="business_verticals", model=BusinessVertical,
+        create_schema=BusinessVerticalSchema.BusinessVerticalCreate,
+        update_schema=BusinessVerticalSchema.BusinessVerticalUpdate,
+        response_model=BusinessVerticalSchema.BusinessVerticalResponse,
+        export_schema=BusinessVerticalSchema.BusinessVerticalExportOut,
+        label="Business vertical", plural="Business verticals", list_key="business_verticals",
+        permission=(1, "/business-verticals"), tag="Business-Vertical",
+    ),
+    MasterSpec(
+        key="regions", model=Region,
+        create_schema=RegionSchema.RegionCreate,
+        update_schema=RegionSchema.RegionUpdate,
+        response_model=RegionSchema.RegionResponse,
+        export_schema=RegionSchema.RegionExportOut,
+        label="Region", plural="Regions", list_key="regions",
+        permission=(1, "/regions"), tag="Region",
+    ),
+    MasterSpec(
+        key="company_types", model=CompanyTypeMaster,
+        create_schema=CompanyTypeSchema.CompanyTypeCreate,
+        update_schema=CompanyTypeSchema.CompanyTypeUpdate,
+        response_model=CompanyTypeSchema.CompanyTypeResponse,
+        export_schema=CompanyTypeSchema.CompanyTypeExportOut,
+        label="Company type", plural="Company types", list_key="company_types",
+        permission=(2, "/company_types"), tag="Company Type",
+    ),
+    MasterSpec(
+        key="head_companies", model=HeadCompanyMaster,
+        create_schema=HeadCompanySchema.HeadCompanyCreate,
+        update_schema=HeadCompanySchema.HeadCompanyUpdate,
+        response_model=HeadCompanySchema.HeadCompanyResponse,
+        export_schema=HeadCompanySchema.HeadCompanyExportOut,
+        label="Head company", plural="Head companies", list_key="head_companies",
+        permission=(2, "/head_companies"), tag="Head Of Company",
+    ),
+    MasterSpec(
+        key="job_functions", model=JobFunction,
+        create_schema=JobFunctionSchema.JobFunctionCreate,
+        update_schema=JobFunctionSchema.JobFunctionUpdate,
+        response_model=JobFunctionSchema.JobFunctionResponse,
+        label="Job Function", plural="Job Functions", list_key="job_functions",
+        permission=(2, "/job_functions"), tag="Job Functions",
+    ),
+    MasterSpec(
+        key="partner_types", model=MasterPartnerTypes,
+        create_schema=PartnerTypeSchema.PartnerTypeCreate,
+        update_schema=PartnerTypeSchema.PartnerTypeUpdate,
+        response_model=PartnerTypeSchema.PartnerTypeResponse,
+        label="Partner Type", plural="Partner Types", list_key="partner_types",
+        permission=(2, "/partner_types"), tag="Partner Type",
+    ),
+    MasterSpec(
+        key="product_service_interests", model=ProductServiceInterest,
+        create_schema=ProductServiceInterestSchema.ProductServiceInterestCreate,
+        update_schema=ProductServiceInterestSchema.ProductServiceInterestUpdate,
+        response_model=ProductServiceInterestSchema.ProductServiceInterestResponse,
+        label="Product/Service Interest", plural="Product/Service Interests", list_key="product_service_interests",
+        permission=(2, "/product_service_interests"), tag="Product Service Interest",
+    ),
+    MasterSpec(
+        key="account_types", model=MasterAccountTypes,
+        create_schema=AccountTypeSchema.MasterAccountTypeCreate,
+        update_schema=AccountTypeSchema.MasterAccountTypeUpdate,
+        response_model=AccountTypeSchema.MasterAccountTypeResponse,
+        label="Account Type", plural="Account Types", list_key="master_account_types",
+        permission=(2, "/account_types"), tag="Account Type",
+    ),
+    MasterSpec(
+        key="business_types", model=MasterBusinessTypes,
+        create_schema=BusinessTypeSchema.MasterBusinessTypeCreate,
+        update_schema=BusinessTypeSchema.MasterBusinessTypeUpdate,
+        response_model=BusinessTypeSchema.MasterBusinessTypeResponse,
+        label="Business Type", plural="Business Types", list_key="master_business_types",
+        permission=(2, "/business_types"), tag="Business Type",
+    ),
+    MasterSpec(
+        key="industry_segments", model=MasterIndustrySegments,
+        create_schema=IndustrySegmentSchema.MasterIndustrySegmentCreate,
+        update_schema=IndustrySegmentSchema.MasterIndustrySegmentUpdate,
+        response_model=IndustrySegmentSchema.MasterIndustrySegmentResponse,
+        label="Industry Segment", plural="Industry Segments", list_key="master_industry_segments",
+        permission=(2, "/industry_segments"), tag="Industry Segments",
+    ),
+    MasterSpec(
+        key="sub_industry_segments", model=MasterSubIndustrySegments,
+        create_schema=SubIndustrySegmentSchema.MasterSubIndustrySegmentCreate,
+        update_schema=SubIndustrySegmentSchema.MasterSubIndustrySegmentUpdate,
+        response_model=SubIndustrySegmentSchema.MasterSubIndustrySegmentResponse,
+        label="Sub Industry Segment", plural="Sub Industry Segments", list_key="master_sub_industry_segments",
+        permission=(2, "/sub_industry_segments"), tag="Sub Industry Segments",
+    ),
+    MasterSpec(
+        key="address_types", model=MasterAddresssTypes,
+        create_schema=AddressTypeSchema.MasterAddressTypeCreate,
+        update_schema=AddressTypeSchema.MasterAddressTypeUpdate,
+        response_model=AddressTypeSchema.MasterAddressTypeResponse,
+        label="Address Type", plural="Address Types", list_key="master_address_types",
+        permission=(2, "/address_types"), tag="Address Type",
+    ),
+    MasterSpec(
+        key="countries", model=MasterCountries,
+        create_schema=CountrySchema.MasterCountryCreate,
+        update_schema=CountrySchema.MasterCountryUpdate,
+        response_model=CountrySchema.MasterCountryResponse,
+        label="Country", plural="Countries", list_key="master_countries",
+        permission=(2, "/countries"), tag="Countries",
+    ),
+    MasterSpec(
+        key="states", model=MasterStates,
+        create_schema=StateSchema.MasterStateCreate,
+        update_schema=StateSchema.MasterStateUpdate,
+        response_model=StateSchema.MasterStateResponse,
+        label="State", plural="States", list_key="master_states",
+        permission=(2, "/states"), tag="State", parent_column="country_id",
+    ),
+    MasterSpec(
+        key="cities", model=MasterCities,
+        create_schema=CitySchema.MasterCityCreate,
+        update_schema=CitySchema.MasterCityUpdate,
+        response_model=CitySchema.MasterCityResponse,
+        label="City", plural="Cities", list_key="master_cities",
+        permission=(2, "/cities"), tag="City", parent_column="state_id",
+    ),
+    MasterSpec(
+        key="document_types", model=DocumentType,
+        create_schema=DocumentTypeSchema.DocumentTypeCreate,
+        update_schema=DocumentTypeSchema.DocumentTypeUpdate,
+        label="DocumentType", plural="DocumentTypes", list_key="document_types",
+        permission=(2, "/document-types"), tag="Document",
+        id_column="document_type_id", id_key="id",
+        name_column="document_type_name", search_columns=("document_type_name",),
+    ),
+    MasterSpec(
+        key="currencies", model=MasterCurrency,
+        create_schema=CurrencySchema.MasterCurrencyCreate,
+        update_schema=CurrencySchema.MasterCurrencyUpdate,
+        label="Currency", plural="Currencies", list_key="currencies",
+        permission=(2, "/currencies"), tag="Currency",
+        id_column="currency_id",
+        name_column="currency_code", search_columns=("currency_code", "currency_name"),
+        on_update=_refresh_currency,
+    ),
+)}
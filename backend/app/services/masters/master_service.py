@@ -0,0 +1,462 @@
+import csv
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from io import StringIO
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import select, update, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from app.models.user_management.user import User
+from app.schemas.masters.DefaultResponse import DefaultResponse
+from app.utils import etag as ETag
+from app.utils import unique as Unique
+from app.utils.env import env_get
+from app.utils.projection import resolve_columns
+
+# How long a snapshot may miss writes made by other processes
+MASTER_CACHE_TTL = int(env_get("MASTER_CACHE_TTL") or 300)
+
+# Columns a client can never write directly
+AUDIT_FIELDS = {"is_deleted", "created_by", "updated_by", "created_at", "updated_at"}
+
+
+@dataclass(frozen=True)
+class MasterSpec:
+    """
+    Everything that differs between two master tables. One spec drives the service
+    functions below and the router built by app.api.v1.endpoints.masters.master_router.
+    """
+    key: str                                   # URL prefix under /api/v1, also the cache namespace
+    model: Any
+    create_schema: Type[BaseModel]
+    update_schema: Type[BaseModel]
+    label: str                                 # "City"; messages use "<label> created successfully"
+    plural: str                                # "Cities"
+    list_key: str                              # key holding the page in list responses
+    permission: Tuple[int, str]                # (module id, menu path) for check_permission
+    tag: str
+    response_model: Type[BaseModel] = DefaultResponse
+    export_schema: Optional[Type[BaseModel]] = None
+    id_column: str = "id"
+    id_key: Optional[str] = None               # key of the id in responses; default id_column
+    name_column: str = "name"                  # unique (case-insensitive) among live rows
+    search_columns: Tuple[str, ...] = ("name", "description")
+    parent_column: Optional[str] = None        # FK to the master one level up, e.g. country_id of a state
+    # Called inside the update transaction with (db, id, changed values)
+    on_update: Optional[Callable[[Session, int, Dict[str, Any]], None]] = field(default=None, compare=False)
+
+    @property
+    def pk(self):
+        return getattr(self.model, self.id_column)
+
+    @property
+    def name(self):
+        return getattr(self.model, self.name_column)
+
+    @property
+    def output_id(self) -> str:
+        return self.id_key or self.id_column
+
+    @property
+    def parent_target(self):
+        """The column `parent_column` references (e.g. MasterCountries.id)."""
+        return next(iter(getattr(self.model, self.parent_column).property.columns[0].foreign_keys)).column
+
+    @property
+    def unique_index(self):
+        """The partial unique index on lower(name) (per parent for states and cities) over live rows."""
+        return Unique.live_index(self.name)
+
+    @property
+    def writable(self) -> List[str]:
+        columns = {attr.key for attr in self.model.__mapper__.column_attrs}
+        return [f for f in self.create_schema.model_fields if f in columns and f not in AUDIT_FIELDS]
+
+
+# ---------------- Snapshots ----------------
+# Each master is held per process as one immutable snapshot of its live rows. A write
+# through this module bumps the master's version and swaps in a freshly loaded snapshot;
+# writes from other processes are picked up once MASTER_CACHE_TTL has passed.
+@dataclass(frozen=True)
+class Snapshot:
+    version: int
+    expires: float
+    fields: Tuple[str, ...]
+    rows: Tuple[tuple, ...]                    # id order
+    by_id: Dict[int, int]                      # id -> position in rows
+    by_name: Dict[str, int]                    # lower(name) -> position in rows
+    by_label: Tuple[int, ...]                  # positions of active rows in name order
+    by_parent: Dict[int, Tuple[int, ...]]      # parent id -> positions, for masters with a parent_column
+
+    def record(self, position: int, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        row = self.rows[position]
+        if fields is None:
+            return dict(zip(self.fields, row))
+        return {f: row[self.fields.index(f)] for f in fields}
+
+    def get(self, record_id: int) -> Optional[Dict[str, Any]]:
+        position = self.by_id.get(record_id)
+        return None if position is None else self.record(position)
+
+
+_snapshots: Dict[str, Snapshot] = {}
+_versions: Dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def invalidate(spec: MasterSpec) -> None:
+    with _lock:
+        _versions[spec.key] = _versions.get(spec.key, 0) + 1
+
+
+def _load_snapshot(db: Session, spec: MasterSpec, version: int) -> Snapshot:
+    result = db.execute(_record_select(spec).where(*_live(spec)).order_by(spec.pk))
+    fields = tuple(result.keys())
+    rows = tuple(tuple(row) for row in result)
+    id_at, name_at = fields.index(spec.output_id), fields.index(spec.name_column)
+    active_at = fields.index("is_active")
+    by_parent: Dict[int, List[int]] = {}
+    if spec.parent_column:
+        parent_at = fields.index(spec.parent_column)
+        for position, row in enumerate(rows):
+            if row[parent_at] is not None:
+                by_parent.setdefault(row[parent_at], []).append(position)
+    return Snapshot(
+        version=version,
+        expires=time.monotonic() + MASTER_CACHE_TTL,
+        fields=fields,
+        rows=rows,
+        by_id={row[id_at]: position for position, row in enumerate(rows)},
+        by_name={row[name_at].lower(): position for position, row in enumerate(rows) if row[name_at]},
+        by_label=tuple(sorted(
+            (position for position, row in enumerate(rows) if row[active_at]),
+            key=lambda position: (rows[position][name_at] or "").lower()
+        )),
+        by_parent={parent_id: tuple(positions) for parent_id, positions in by_parent.items()},
+    )
+
+
+def refresh(db: Session, spec: MasterSpec) -> Snapshot:
+    version = _versions.get(spec.key, 0)
+    fresh = _load_snapshot(db, spec, version)
+    with _lock:
+        # A write that landed while this one was loading has already bumped the version
+        if _versions.get(spec.key, 0) == version:
+            _snapshots[spec.key] = fresh
+    return fresh
+
+
+def snapshot(db: Session, spec: MasterSpec) -> Snapshot:
+    current = _snapshots.get(spec.key)
+    if current is not None and current.version == _versions.get(spec.key, 0) and current.expires > time.monotonic():
+        return current
+    return refresh(db, spec)
+
+
+# ---------------- Projection ----------------
+def _record_select(spec: MasterSpec):
+    """Every column plus creator / updater names via two outer joins (no ORM entities)."""
+    created_user, updated_user = aliased(User), aliased(User)
+    columns = [
+        column.label(spec.output_id) if column.key == spec.id_column else column
+        for column in resolve_columns(spec.model)
+    ]
+    return (
+        select(
+            *columns,
+            created_user.full_name.label("created_by_name"),
+            updated_user.full_name.label("updated_by_name"),
+        )
+        .select_from(spec.model)
+        .outerjoin(created_user, created_user.id == spec.model.created_by)
+        .outerjoin(updated_user, updated_user.id == spec.model.updated_by)
+    )
+
+
+def _live(spec: MasterSpec, search: Optional[str] = None) -> List[Any]:
+    conditions = [spec.model.is_deleted == False]
+    if search:
+        conditions.append(or_(*(
+            getattr(spec.model, column).ilike(f"%{search}%") for column in spec.search_columns
+        )))
+    return conditions
+
+
+def _load_record(db: Session, spec: MasterSpec, record_id: int) -> Optional[Dict[str, Any]]:
+    row = db.execute(_record_select(spec).where(spec.pk == record_id)).first()
+    return dict(row._mapping) if row else None
+
+
+# ---------------- Reads ----------------
+def get_page(
+    db: Session,
+    spec: MasterSpec,
+    skip: int = 0,
+    limit: int = 10,
+    search: Optional[str] = None,
+    fields: Optional[str] = None,
+    parent_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    One page of live rows in id order; `fields` narrows the projection to those columns
+    and `parent_id` to the children of one parent (e.g. the states of a country).
+    """
+    snap = snapshot(db, spec)
+    positions = range(len(snap.rows)) if parent_id is None else snap.by_parent.get(parent_id, ())
+    if search:
+        needle = search.lower()
+        searched = [snap.fields.index(column) for column in spec.search_columns]
+        positions = [
+            p for p in positions
+            if any(snap.rows[p][i] is not None and needle in str(snap.rows[p][i]).lower() for i in searched)
+        ]
+    keys = None
+    if fields:
+        keys = [
+            spec.output_id if column.key == spec.id_column else column.key
+            for column in resolve_columns(spec.model, fields)
+        ]
+    return {
+        spec.list_key: [snap.record(p, keys) for p in positions[skip:skip + limit]],
+        "total": len(positions),
+        "limit": limit,
+        "page": (skip // limit) + 1
+    }
+
+
+def get_record(db: Session, spec: MasterSpec, record_id: int) -> Optional[Dict[str, Any]]:
+    return snapshot(db, spec).get(record_id)
+
+
+def get_by_name(db: Session, spec: MasterSpec, name: str) -> Optional[Dict[str, Any]]:
+    """Live row whose name matches case-insensitively."""
+    snap = snapshot(db, spec)
+    position = snap.by_name.get((name or "").strip().lower())
+    return None if position is None else snap.record(position)
+
+
+def dropdown(db: Session, spec: MasterSpec) -> List[Dict[str, Any]]:
+    """Active rows as `{"id", "name"}` (plus the parent id, if any) in name order."""
+    snap = snapshot(db, spec)
+    id_at, name_at = snap.fields.index(spec.output_id), snap.fields.index(spec.name_column)
+    if not spec.parent_column:
+        return [{"id": snap.rows[p][id_at], "name": snap.rows[p][name_at]} for p in snap.by_label]
+    parent_at = snap.fields.index(spec.parent_column)
+    return [
+        {"id": snap.rows[p][id_at], "name": snap.rows[p][name_at], spec.parent_column: snap.rows[p][parent_at]}
+        for p in snap.by_label
+    ]
+
+
+def record_etag(spec: MasterSpec, record: Dict[str, Any]) -> str:
+    return ETag.version_etag(spec.key, record[spec.output_id], record.get("updated_at"))
+
+
+def export_rows(db: Session, spec: MasterSpec) -> List[BaseModel]:
+    snap = snapshot(db, spec)
+    return [spec.export_schema.model_validate(snap.record(p)) for p in range(len(snap.rows))]
+
+
+# ---------------- Writes ----------------
+def _missing_parents(db: Session, spec: MasterSpec, parent_ids: Set[int]) -> Set[int]:
+    """Those of `parent_ids` that are not live rows of the parent master."""
+    if not spec.parent_column or not parent_ids:
+        return set()
+    target = spec.parent_target
+    found = set(db.scalars(select(target).where(target.in_(parent_ids), target.table.c.is_deleted == False)))
+    return parent_ids - found
+
+
+def _ensure_parent(db: Session, spec: MasterSpec, values: Dict[str, Any]) -> None:
+    parent_id = values.get(spec.parent_column) if spec.parent_column else None
+    if parent_id is not None and _missing_parents(db, spec, {parent_id}):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{spec.parent_column} {parent_id} does not exist.")
+
+
+def _values(spec: MasterSpec, data: BaseModel, exclude_unset: bool = False) -> Dict[str, Any]:
+    values = data.model_dump(include=set(spec.writable), exclude_unset=exclude_unset)
+    if isinstance(values.get(spec.name_column), str):
+        values[spec.name_column] = values[spec.name_column].strip()
+    return values
+
+
+def _write(db: Session, spec: MasterSpec, action: str, work: Callable[[], Optional[int]]) -> Optional[Dict[str, Any]]:
+    """Run one write, commit, swap in a fresh snapshot and return the written record."""
+    try:
+        record_id = work()
+        if record_id is None:
+            db.rollback()
+            return None
+        db.commit()
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to {action} {spec.label}: {str(e)}")
+    invalidate(spec)
+    # Deleted rows are no longer in the snapshot
+    return refresh(db, spec).get(record_id) or _load_record(db, spec, record_id)
+
+
+def _check_version(db: Session, spec: MasterSpec, record_id: int, if_match: Optional[str]) -> bool:
+    """Lock the live row for a conditional write; False if it does not exist, 412 if the ETag is stale."""
+    row = db.execute(
+        select(spec.pk, spec.model.updated_at)
+        .where(spec.pk == record_id, spec.model.is_deleted == False)
+        .with_for_update()
+    ).first()
+    if not row:
+        return False
+    ETag.require_match(if_match, ETag.version_etag(spec.key, row[0], row[1]), spec.label)
+    return True
+
+
+def _unique_key(spec: MasterSpec, values: Dict[str, Any]) -> Tuple:
+    """`values`' key in the live-name index: lower(name) plus any parent id (0 when unset)."""
+    return Unique.index_key(spec.unique_index, values.get(spec.name_column), values)
+
+
+def _duplicate(spec: MasterSpec, name: Optional[str]) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{spec.label} '{name}' already exists.")
+
+
+def create(db: Session, spec: MasterSpec, data: BaseModel, login_id: int) -> Dict[str, Any]:
+    """One INSERT ... ON CONFLICT DO NOTHING; the live-name unique index turns a duplicate into a 400."""
+    def work():
+        values = _values(spec, data)
+        _ensure_parent(db, spec, values)
+        record_id = Unique.insert_unique(
+            db, spec.unique_index, {**values, "is_deleted": False, "created_by": login_id, "updated_by": login_id}
+        )
+        if record_id is None:
+            raise _duplicate(spec, values.get(spec.name_column))
+        return record_id
+    return _write(db, spec, "create", work)
+
+
+def upsert(db: Session, spec: MasterSpec, data: BaseModel, login_id: int) -> Tuple[Dict[str, Any], bool]:
+    """
+    Create the live row with this name, or update it with the fields sent, in one
+    INSERT ... ON CONFLICT DO UPDATE; safe to repeat. Returns `(record, created)`.
+    """
+    now = datetime.utcnow()
+    outcome = {}
+
+    def work():
+        values = _values(spec, data)
+        changes = {k: v for k, v in _values(spec, data, exclude_unset=True).items() if k != spec.name_column}
+        _ensure_parent(db, spec, values)
+        record_id, created_at = Unique.upsert(
+            db, spec.unique_index,
+            {**values, "is_deleted": False, "created_by": login_id, "updated_by": login_id, "created_at": now, "updated_at": now},
+            {**changes, "updated_by": login_id, "updated_at": now},
+            spec.pk, spec.model.created_at
+        )
+        # Only a fresh insert carries this request's timestamp as created_at
+        outcome["created"] = created_at == now
+        if not outcome["created"] and spec.on_update:
+            spec.on_update(db, record_id, changes)
+        return record_id
+    return _write(db, spec, "upsert", work), outcome["created"]
+
+
+def update_record(
+    db: Session, spec: MasterSpec, record_id: int, data: BaseModel, login_id: int, if_match: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Partial update in one UPDATE ... RETURNING; `if_match` makes it conditional (412 if stale)."""
+    def work():
+        if if_match is not None and not _check_version(db, spec, record_id, if_match):
+            return None
+        values = _values(spec, data, exclude_unset=True)
+        _ensure_parent(db, spec, values)
+        try:
+            updated_id = db.scalar(
+                update(spec.model)
+                .where(spec.pk == record_id, spec.model.is_deleted == False)
+                .values(**values, updated_by=login_id, updated_at=datetime.utcnow())
+                .returning(spec.pk)
+            )
+        except IntegrityError as e:
+            if not Unique.violates(e, spec.unique_index):
+                raise
+            # Renamed onto another live row's name (the unique index rejects it)
+            raise _duplicate(spec, values.get(spec.name_column))
+        if updated_id is not None and spec.on_update:
+            spec.on_update(db, updated_id, values)
+        return updated_id
+    return _write(db, spec, "update", work)
+
+
+def delete_record(
+    db: Session, spec: MasterSpec, record_id: int, login_id: int, if_match: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Soft delete in one UPDATE ... RETURNING; returns the deleted record."""
+    def work():
+        if if_match is not None and not _check_version(db, spec, record_id, if_match):
+            return None
+        return db.scalar(
+            update(spec.model)
+            .where(spec.pk == record_id, spec.model.is_deleted == False)
+            .values(is_deleted=True, updated_by=login_id, updated_at=datetime.utcnow())
+            .returning(spec.pk)
+        )
+    return _write(db, spec, "delete", work)
+
+
+def import_csv(db: Session, spec: MasterSpec, content: bytes, login_id: int) -> Dict[str, Any]:
+    """
+    Validate every CSV row against the create schema, skip invalid rows and names repeated
+    in the file, then insert the rest with one executemany INSERT ... ON CONFLICT DO NOTHING;
+    rows the live-name index rejected are reported as already existing.
+    """
+    reader = csv.DictReader(StringIO(content.decode("utf-8-sig")))  # utf-8-sig drops a BOM
+    rows, skipped, seen = [], [], set()
+    for line, raw in enumerate(reader, start=2):
+        try:
+            data = spec.create_schema.model_validate({k: v for k, v in raw.items() if k and v not in ("", None)})
+        except ValidationError as e:
+            skipped.append({"line": line, "error": "; ".join(err["msg"] for err in e.errors())})
+            continue
+        values = _values(spec, data)
+        key = _unique_key(spec, values)
+        if key in seen:
+            skipped.append({"line": line, "error": f"Duplicate {spec.label} '{values[spec.name_column]}' in the file"})
+            continue
+        seen.add(key)
+        rows.append((line, values))
+
+    missing = _missing_parents(db, spec, {
+        values[spec.parent_column] for _, values in rows if values.get(spec.parent_column) is not None
+    } if spec.parent_column else set())
+    to_insert = []
+    for line, values in rows:
+        if spec.parent_column and values.get(spec.parent_column) in missing:
+            skipped.append({"line": line, "error": f"{spec.parent_column} {values[spec.parent_column]} does not exist"})
+        else:
+            to_insert.append((line, {**values, "is_deleted": False, "created_by": login_id, "updated_by": login_id}))
+
+    try:
+        inserted = {
+            tuple(key) for _, *key in Unique.insert_many_unique(
+                db, spec.unique_index, [values for _, values in to_insert], spec.pk, *spec.unique_index.expressions
+            )
+        }
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Failed to import {spec.plural}: {str(e)}")
+    for line, values in to_insert:
+        if _unique_key(spec, values) not in inserted:
+            skipped.append({"line": line, "error": f"{spec.label} '{values[spec.name_column]}' already exists"})
+    imported = len(inserted)
+    if imported:
+        invalidate(spec)
+        refresh(db, spec)
+    return {"imported": imported, "skipped": sorted(skipped, key=lambda s: s["line"])}
@@ -0,0 +1,292 @@
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import select, update, or_
+from sqlalchemy.orm import Session
+from app.models.sales.company import Company
+from app.models.sales.company_hierarchy import CompanyHierarchy
+from app.models.sales.contact import Contact
+from app.schemas.sales.company import CompanyBulkSelection, CompanyBulkStatus, CompanyBulkReassign
+from app.schemas.sales.contact import ContactBulkSelection, ContactBulkStatus
+from app.services.sales import (
+    company_typeahead_service, company_search_service, company_dedup_service,
+    company_financials_service, company_scoring_service, company_facet_service, geo_rollup_service,
+    company_hierarchy_service, contact_identifier_service
+)
+
+
+# ---------------- Selection ----------------
+def _company_conditions(selection: CompanyBulkSelection) -> List[Any]:
+    if selection.ids:
+        return [Company.id.in_(selection.ids)]
+    values = selection.filter.dict(exclude_none=True)
+    conditions = []
+    search = values.pop("search", None)
+    if search:
+        conditions.append(or_(
+            Company.company_name.ilike(f"%{search}%"),
+            Company.gst_no.ilike(f"%{search}%"),
+            Company.pan_no.ilike(f"%{search}%")
+        ))
+    conditions.extend(getattr(Company, field) == value for field, value in values.items())
+    return conditions
+
+
+def _contact_conditions(selection: ContactBulkSelection) -> List[Any]:
+    if selection.ids:
+        return [Contact.id.in_(selection.ids)]
+    values = selection.filter.dict(exclude_none=True)
+    conditions = []
+    search = values.pop("search", None)
+    if search:
+        conditions.append(or_(
+            Contact.first_name.ilike(f"%{search}%"),
+            Contact.last_name.ilike(f"%{search}%"),
+            Contact.email.ilike(f"%{search}%"),
+            Contact.primary_no.ilike(f"%{search}%")
+        ))
+    conditions.extend(getattr(Contact, field) == value for field, value in values.items())
+    return conditions
+
+
+def _validate_selection(selection) -> None:
+    has_filter = selection.filter is not None and selection.filter.dict(exclude_none=True)
+    if bool(selection.ids) == bool(has_filter):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Send either ids or a filter with at least one condition"
+        )
+
+
+# ---------------- Execution ----------------
+def _update_returning(db: Session, model, conditions: Sequence[Any], values: Dict[str, Any], returning: Sequence[Any]):
+    """
+    One set-based UPDATE; returns the changed rows' `returning` columns. Dialects without
+    UPDATE .. RETURNING lock the matching ids first and update by primary key instead.
+    """
+    if db.get_bind().dialect.update_returning:
+        return db.execute(
+            update(model).where(*conditions).values(**values).returning(*returning)
+            .execution_options(synchronize_session=False)
+        ).all()
+    rows = db.execute(select(*returning).where(*conditions).with_for_update()).all()
+    if rows:
+        db.execute(
+            update(model).where(model.id.in_([row[0] for row in rows])).values(**values)
+            .execution_options(synchronize_session=False)
+        )
+    return rows
+
+
+def _audit(entity: str, action: str, selection, values: Dict[str, Any], affected_ids: List[int], login_id: int) -> Dict[str, Any]:
+    """Summary returned to the caller: what was asked, what changed and what was skipped."""
+    requested = len(set(selection.ids)) if selection.ids else None
+    return {
+        "entity": entity,
+        "action": action,
+        "selection": {"ids": selection.ids} if selection.ids else {"filter": selection.filter.dict(exclude_none=True)},
+        "values": {k: v for k, v in values.items() if k not in ("updated_by", "updated_at")},
+        "requested": requested,
+        "affected": len(affected_ids),
+        # ids that were missing or already in the target state
+        "skipped": requested - len(affected_ids) if requested is not None else None,
+        "affected_ids": sorted(affected_ids),
+        "performed_by": login_id,
+        "performed_at": values["updated_at"],
+    }
+
+
+def _run(db: Session, work) -> Dict[str, Any]:
+    try:
+        result = work()
+        db.commit()
+        return result
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Bulk update failed: {str(e)}")
+
+
+# ---------------- Companies ----------------
+def _company_action(
+    db: Session, action: str, selection: CompanyBulkSelection, state: List[Any], values: Dict[str, Any], login_id: int
+) -> Tuple[Dict[str, Any], List[int]]:
+    _validate_selection(selection)
+    values = {**values, "updated_by": login_id, "updated_at": datetime.utcnow()}
+    rows = _update_returning(db, Company, [*_company_conditions(selection), *state], values, [Company.id])
+    ids = [row[0] for row in rows]
+    return _audit("company", action, selection, values, ids, login_id), ids
+
+
+def bulk_delete_companies(db: Session, selection: CompanyBulkSelection, login_id: int) -> Dict[str, Any]:
+    def work():
+        summary, ids = _company_action(db, "delete", selection, [Company.is_deleted == False], {"is_deleted": True}, login_id)
+        company_dedup_service.remove_companies(db, ids)
+        company_scoring_service.mark_stale_with_ancestors(db, ids)
+        company_financials_service.refresh_companies(db, ids)
+        geo_rollup_service.remove_entities(db, "company", ids)
+        return summary
+    summary = _run(db, work)
+    company_typeahead_service.invalidate()
+    company_facet_service.invalidate()
+    return summary
+
+
+def _restore_conflicts(db: Session, selection: CompanyBulkSelection) -> Dict[int, str]:
+    """
+    Deleted companies in the selection whose GST/PAN is now held by a live company, or by
+    a lower id restored in the same call, mapped to the reason; two queries.
+    """
+    _validate_selection(selection)
+    candidates = db.execute(
+        select(Company.id, Company.gst_no, Company.pan_no)
+        .where(*_company_conditions(selection), Company.is_deleted == True)
+        .order_by(Company.id)
+    ).all()
+    taken = company_dedup_service.taken_unique_keys(db, ((c.gst_no, c.pan_no) for c in candidates))
+    conflicts, restored = {}, {}
+    for company in candidates:
+        keys = company_dedup_service.unique_keys(company.gst_no, company.pan_no)
+        clash = next((key for key in keys if key in taken or key in restored), None)
+        if clash:
+            holder = taken.get(clash) or restored[clash]
+            conflicts[company.id] = f"{clash[0].upper()} '{clash[1]}' already exists on company {holder}"
+        else:
+            restored.update((key, company.id) for key in keys)
+    return conflicts
+
+
+def _restore_hierarchy(db: Session, ids: List[int]) -> None:
+    """Re-add closure rows for restored merge sources (a merge drops them), parents first."""
+    indexed = set(db.scalars(
+        select(CompanyHierarchy.descendant_id).where(CompanyHierarchy.descendant_id.in_(ids), CompanyHierarchy.depth == 0)
+    ))
+    missing = [company_id for company_id in ids if company_id not in indexed]
+    if not missing:
+        return
+    parents = dict(db.execute(select(Company.id, Company.parent_company_id).where(Company.id.in_(missing))).all())
+    pending = set(missing)
+    while pending:
+        ready = [company_id for company_id in pending if parents[company_id] not in pending] or list(pending)
+        company_hierarchy_service.add_companies(db, ready)
+        pending.difference_update(ready)
+
+
+def bulk_restore_companies(db: Session, selection: CompanyBulkSelection, login_id: int) -> Dict[str, Any]:
+    """
+    Undo soft deletes. Companies whose GST/PAN a live company now holds stay deleted and
+    are listed under `conflicts`.
+    """
+    def work():
+        conflicts = _restore_conflicts(db, selection)
+        state = [Company.is_deleted == True, Company.id.notin_(list(conflicts))]
+        summary, ids = _company_action(db, "restore", selection, state, {"is_deleted": False}, login_id)
+        summary["conflicts"] = [{"id": company_id, "error": error} for company_id, error in sorted(conflicts.items())]
+        _restore_hierarchy(db, ids)
+        company_dedup_service.index_companies(db, ids)
+        company_search_service.index_companies(db, ids)
+        company_financials_service.refresh_companies(db, ids)
+        company_scoring_service.mark_stale_with_ancestors(db, ids)
+        geo_rollup_service.add_entities(db, "company", ids)
+        return summary
+    summary = _run(db, work)
+    company_typeahead_service.invalidate()
+    company_facet_service.invalidate()
+    return summary
+
+
+def bulk_set_company_status(db: Session, selection: CompanyBulkStatus, login_id: int) -> Dict[str, Any]:
+    action = "activate" if selection.is_active else "deactivate"
+    state = [Company.is_deleted == False, Company.is_active.is_not(selection.is_active)]
+    summary = _run(db, lambda: _company_action(db, action, selection, state, {"is_active": selection.is_active}, login_id)[0])
+    company_typeahead_service.invalidate()
+    company_facet_service.invalidate()
+    return summary
+
+
+def bulk_reassign_companies(db: Session, selection: CompanyBulkReassign, login_id: int) -> Dict[str, Any]:
+    """Set region / account type / sub type on every selected company; only fields sent are changed."""
+    values = {
+        field: getattr(selection, field)
+        for field in ("account_region_id", "account_type_id", "account_sub_type_id")
+        if field in selection.model_fields_set
+    }
+    if not values:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Send at least one of account_region_id, account_type_id, account_sub_type_id"
+        )
+    # Rows already holding every requested value are left alone and reported as skipped
+    state = [Company.is_deleted == False, or_(*(getattr(Company, f).is_distinct_from(v) for f, v in values.items()))]
+
+    def work():
+        summary, ids = _company_action(db, "reassign", selection, state, values, login_id)
+        if "account_region_id" in values:
+            company_financials_service.refresh_companies(db, ids)
+        if "account_type_id" in values:
+            company_scoring_service.mark_stale(db, ids)
+        return summary
+    summary = _run(db, work)
+    company_facet_service.invalidate()
+    return summary
+
+
+# ---------------- Contacts ----------------
+def _contact_action(
+    db: Session, action: str, selection: ContactBulkSelection, state: List[Any], values: Dict[str, Any], login_id: int
+) -> Dict[str, Any]:
+    _validate_selection(selection)
+    values = {**values, "updated_by": login_id, "updated_at": datetime.utcnow()}
+    rows = _update_returning(db, Contact, [*_contact_conditions(selection), *state], values, [Contact.id, Contact.company_id])
+    ids = [row[0] for row in rows]
+    # Contact counts feed the account score of their companies
+    company_scoring_service.mark_stale(db, {row[1] for row in rows})
+    if action == "delete":
+        geo_rollup_service.remove_entities(db, "contact", ids)
+        contact_identifier_service.remove_contacts(db, ids)
+    elif action == "restore":
+        geo_rollup_service.add_entities(db, "contact", ids)
+        contact_identifier_service.index_contacts(db, ids)
+    return _audit("contact", action, selection, values, ids, login_id)
+
+
+def bulk_delete_contacts(db: Session, selection: ContactBulkSelection, login_id: int) -> Dict[str, Any]:
+    return _run(db, lambda: _contact_action(db, "delete", selection, [Contact.is_deleted == False], {"is_deleted": True}, login_id))
+
+
+def _contact_restore_conflicts(db: Session, selection: ContactBulkSelection) -> Dict[int, str]:
+    """
+    Deleted contacts in the selection whose email / phone is now held by a live contact,
+    or by a lower id restored in the same call, mapped to the reason; two queries.
+    """
+    _validate_selection(selection)
+    candidates = db.execute(
+        select(Contact.id, Contact.email, *(getattr(Contact, field) for field in contact_identifier_service.PHONE_FIELDS))
+        .where(*_contact_conditions(selection), Contact.is_deleted == True)
+        .order_by(Contact.id)
+    ).all()
+    ids = [contact.id for contact in candidates]
+    duplicates = contact_identifier_service.find_batch_duplicates(db, candidates, ids)
+    return {ids[index]: error for index, error in duplicates.items()}
+
+
+def bulk_restore_contacts(db: Session, selection: ContactBulkSelection, login_id: int) -> Dict[str, Any]:
+    """
+    Undo soft deletes. Contacts whose email / phone a live contact now holds stay deleted
+    and are listed under `conflicts`.
+    """
+    def work():
+        conflicts = _contact_restore_conflicts(db, selection)
+        state = [Contact.is_deleted == True, Contact.id.notin_(list(conflicts))]
+        summary = _contact_action(db, "restore", selection, state, {"is_deleted": False}, login_id)
+        summary["conflicts"] = [{"id": contact_id, "error": error} for contact_id, error in sorted(conflicts.items())]
+        return summary
+    return _run(db, work)
+
+
+def bulk_set_contact_status(db: Session, selection: ContactBulkStatus, login_id: int) -> Dict[str, Any]:
+    action = "activate" if selection.is_active else "deactivate"
+    state = [Contact.is_deleted == False, Contact.is_active.is_not(selection.is_active)]
+    return _run(db, lambda: _contact_action(db, action, selection, state, {"is_active": selection.is_active}, login_id))
@@ -0,0 +1,146 @@
+from collections import defaultdict
+from typing import Optional, Dict, Any, List, Set
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select, func, literal, union_all
+from app.models.sales.company import Company
+from app.models.sales.company_financials import CompanyFinancialSummary
+from app.models.sales.company_hierarchy import CompanyHierarchy
+from app.models.sales.contact import Contact
+from app.models.masters.master_industry_segment import MasterIndustrySegments
+from app.models.masters.master_account_types import MasterAccountTypes
+from app.models.masters.master_account_sub_types import AccountSubType
+from app.models.masters.master_business_types import MasterBusinessTypes
+from app.models.masters.region import Region
+from app.models.masters.master_address_type import MasterAddresssTypes
+from app.models.masters.master_countries import MasterCountries
+from app.models.masters.master_states import MasterStates
+from app.models.masters.master_cities import MasterCities
+from app.models.masters.master_currency import MasterCurrency
+from app.models.masters.master_document_types import DocumentType
+from app.models.masters.master_titles import Title
+from app.models.user_management.designation import Designation
+from app.schemas.sales.company import CompanyResponse
+from app.schemas.sales.contact import ContactResponse
+
+# Foreign key column -> (id column, name column) of the master it points at. Every
+# occurrence anywhere in the payload gets a sibling "<column minus _id>_name" key.
+MASTER_LOOKUPS = {
+    "industry_segment_id": (MasterIndustrySegments.id, MasterIndustrySegments.name),
+    "account_type_id": (MasterAccountTypes.id, MasterAccountTypes.name),
+    "account_sub_type_id": (AccountSubType.id, AccountSubType.name),
+    "business_type_id": (MasterBusinessTypes.id, MasterBusinessTypes.name),
+    "account_region_id": (Region.id, Region.name),
+    "address_type_id": (MasterAddresssTypes.id, MasterAddresssTypes.name),
+    "country_id": (MasterCountries.id, MasterCountries.name),
+    "state_id": (MasterStates.id, MasterStates.name),
+    "city_id": (MasterCities.id, MasterCities.name),
+    "currency_id": (MasterCurrency.currency_id, MasterCurrency.currency_name),
+    "document_type_id": (DocumentType.document_type_id, DocumentType.document_type_name),
+    "title_id": (Title.id, Title.name),
+    "designation_id": (Designation.id, Designation.name),
+}
+
+
+def _walk(node, visit) -> None:
+    if isinstance(node, dict):
+        visit(node)
+        for value in list(node.values()):
+            _walk(value, visit)
+    elif isinstance(node, list):
+        for item in node:
+            _walk(item, visit)
+
+
+def _id_fields(node: Dict[str, Any]):
+    # keys naming a master whose value is an id (or null), not a nested collection
+    return [field for field in MASTER_LOOKUPS.keys() & node.keys() if not isinstance(node[field], (list, dict))]
+
+
+def resolve_master_names(db: Session, payload: Dict[str, Any]) -> None:
+    """Collect every master id in the payload, resolve them all in one UNION ALL, write the names back."""
+    wanted: Dict[str, Set[int]] = defaultdict(set)
+
+    def collect(node: Dict[str, Any]) -> None:
+        for field in _id_fields(node):
+            if node[field] is not None:
+                wanted[field].add(node[field])
+
+    _walk(payload, collect)
+    names: Dict[str, Dict[int, str]] = defaultdict(dict)
+    if wanted:
+        selects = [
+            select(literal(field).label("field"), id_col.label("id"), name_col.label("name")).where(id_col.in_(ids))
+            for field, ids in wanted.items()
+            for id_col, name_col in [MASTER_LOOKUPS[field]]
+        ]
+        statement = selects[0] if len(selects) == 1 else union_all(*selects)
+        for field, master_id, name in db.execute(statement):
+            names[field][master_id] = name
+
+    def attach(node: Dict[str, Any]) -> None:
+        for field in _id_fields(node):
+            node[f"{field[:-3]}_name"] = names[field].get(node[field])
+
+    _walk(payload, attach)
+
+
+def get_company_360(db: Session, company_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Everything the company detail screen shows, in a fixed number of queries however
+    many contacts or child rows there are: the company (1) and its four child
+    collections (4, selectin), contacts (1) with addresses (1), ancestors (1), direct
+    subsidiaries (1), subtree size (1), financial summary (1) and every master name (1).
+    """
+    company = db.query(Company).options(
+        selectinload(Company.addresses),
+        selectinload(Company.turnover_records),
+        selectinload(Company.profit_records),
+        selectinload(Company.documents),
+    ).filter(Company.id == company_id, Company.is_deleted == False).first()
+    if not company:
+        return None
+
+    contacts = db.query(Contact).options(selectinload(Contact.addresses)).filter(
+        Contact.company_id == company_id,
+        Contact.is_deleted == False
+    ).order_by(Contact.id).all()
+
+    ancestors = db.execute(
+        select(Company.id, Company.company_name, CompanyHierarchy.depth)
+        .join(CompanyHierarchy, CompanyHierarchy.ancestor_id == Company.id)
+        .where(CompanyHierarchy.descendant_id == company_id, CompanyHierarchy.depth > 0, Company.is_deleted == False)
+        .order_by(CompanyHierarchy.depth)
+    ).all()
+    children = db.execute(
+        select(Company.id, Company.company_name)
+        .where(Company.parent_company_id == company_id, Company.is_deleted == False)
+        .order_by(Company.company_name)
+    ).all()
+    descendant_count = db.scalar(
+        select(func.count())
+        .select_from(CompanyHierarchy)
+        .join(Company, Company.id == CompanyHierarchy.descendant_id)
+        .where(CompanyHierarchy.ancestor_id == company_id, CompanyHierarchy.depth > 0, Company.is_deleted == False)
+    )
+    financials = db.get(CompanyFinancialSummary, company_id)
+
+    payload = CompanyResponse.from_orm(company).dict()
+    payload["contacts"] = [ContactResponse.from_orm(contact).dict() for contact in contacts]
+    payload["hierarchy"] = {
+        # A deleted parent is gone from the chain; don't promote the grandparent in its place
+        "parent": {"id": ancestors[0].id, "name": ancestors[0].company_name} if ancestors and ancestors[0].depth == 1 else None,
+        "ancestors": [{"id": r.id, "name": r.company_name, "depth": r.depth} for r in ancestors],
+        "children": [{"id": r.id, "name": r.company_name} for r in children],
+        "descendant_count": descendant_count,
+    }
+    payload["financials"] = None if financials is None else {
+        "latest_year": financials.latest_year,
+        "latest_turnover": financials.latest_turnover,
+        "previous_turnover": financials.previous_turnover,
+        "yoy_growth": financials.yoy_growth,
+        "latest_profit": financials.latest_profit,
+        "profit_margin": financials.profit_margin,
+        "revenue_band": financials.revenue_band,
+    }
+    resolve_master_names(db, payload)
+    return payload
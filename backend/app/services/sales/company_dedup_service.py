@@ -0,0 +1,275 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, delete, func, tuple_
+from typing import Optional, List, Dict, Any, Iterable, Set, Tuple
+from collections import defaultdict
+from urllib.parse import urlsplit
+from fastapi import HTTPException, status
+from app.models.sales.company import Company
+from app.models.sales.company_dedup import CompanyDedupKey
+from app.utils.prefix_index import normalize
+
+# Key types strong enough to call two companies duplicates on their own
+STRONG_KEY_TYPES = ("gst", "pan", "domain", "name")
+# Blocks bigger than this are too common to be evidence (e.g. a shingle like "india pvt")
+MAX_BLOCK_SIZE = 50
+REINDEX_BATCH_SIZE = 1000
+SHINGLE_STEM_LENGTH = 5
+
+LEGAL_SUFFIXES = {
+    "the", "ltd", "limited", "pvt", "private", "inc", "incorporated", "llp", "llc",
+    "co", "company", "corp", "corporation", "plc", "gmbh", "pte", "opc",
+}
+
+
+# ---------------- Key computation ----------------
+def normalize_tax_id(value: Optional[str]) -> Optional[str]:
+    """Upper-case alphanumerics only: ` 27aaact-2727q1zw ` -> `27AAACT2727Q1ZW`."""
+    cleaned = "".join(ch for ch in (value or "") if ch.isalnum()).upper()
+    return cleaned or None
+
+
+def website_domain(value: Optional[str]) -> Optional[str]:
+    """Registrable-looking host of a website: `https://www.Tata.com/x` -> `tata.com`."""
+    if not value or not value.strip():
+        return None
+    raw = value.strip().lower()
+    host = urlsplit(raw if "://" in raw else f"//{raw}").hostname or ""
+    if host.startswith("www."):
+        host = host[4:]
+    return host or None
+
+
+def name_tokens(company_name: Optional[str]) -> List[str]:
+    """Normalised name words without legal-form noise (`Tata Motors Pvt. Ltd.` -> tata, motors)."""
+    tokens = normalize(company_name).split()
+    significant = [t for t in tokens if t not in LEGAL_SUFFIXES]
+    return significant or tokens
+
+
+def compute_keys(
+    company_name: Optional[str] = None,
+    gst_no: Optional[str] = None,
+    pan_no: Optional[str] = None,
+    website: Optional[str] = None,
+) -> Set[Tuple[str, str]]:
+    """Blocking keys for one company as `(key_type, key_value)` pairs."""
+    keys = set()
+    gst = normalize_tax_id(gst_no)
+    if gst:
+        keys.add(("gst", gst))
+        # Characters 3-12 of a GSTIN are the holder's PAN
+        if len(gst) == 15:
+            keys.add(("pan", gst[2:12]))
+    pan = normalize_tax_id(pan_no)
+    if pan:
+        keys.add(("pan", pan))
+    domain = website_domain(website)
+    if domain:
+        keys.add(("domain", domain))
+
+    tokens = name_tokens(company_name)
+    if tokens:
+        keys.add(("name", " ".join(tokens)[:255]))
+        stems = [t[:SHINGLE_STEM_LENGTH] for t in tokens]
+        shingles = zip(stems, stems[1:]) if len(stems) > 1 else [(stems[0],)]
+        keys.update(("shingle", " ".join(s)) for s in shingles)
+    return keys
+
+
+# ---------------- Maintenance ----------------
+def index_companies(db: Session, company_ids: Iterable[int]) -> int:
+    """Recompute the keys of the given companies: one SELECT, one DELETE, one executemany."""
+    ids = list(company_ids)
+    if not ids:
+        return 0
+    companies = db.execute(
+        select(Company.id, Company.company_name, Company.gst_no, Company.pan_no, Company.website)
+        .where(Company.id.in_(ids))
+    ).all()
+
+    remove_companies(db, ids)
+    rows = [
+        {"key_type": key_type, "key_value": key_value, "company_id": c.id}
+        for c in companies
+        for key_type, key_value in compute_keys(c.company_name, c.gst_no, c.pan_no, c.website)
+    ]
+    if rows:
+        db.execute(insert(CompanyDedupKey), rows)
+    return len(companies)
+
+
+def remove_companies(db: Session, company_ids: Iterable[int]) -> None:
+    db.execute(
+        delete(CompanyDedupKey).where(CompanyDedupKey.company_id.in_(list(company_ids)))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def reindex_all(db: Session) -> int:
+    """Rebuild the keys of every non-deleted company in batches."""
+    db.execute(delete(CompanyDedupKey))
+    total, last_id = 0, 0
+    while True:
+        ids = list(db.scalars(
+            select(Company.id)
+            .where(Company.id > last_id, Company.is_deleted == False)
+            .order_by(Company.id).limit(REINDEX_BATCH_SIZE)
+        ))
+        if not ids:
+            return total
+        total += index_companies(db, ids)
+        last_id = ids[-1]
+
+
+# ---------------- Lookups ----------------
+def _matching_keys(db: Session, keys: Set[Tuple[str, str]], exclude_id: Optional[int] = None):
+    """`(company_id, key_type, key_value)` for live companies sharing any of `keys`; one indexed query."""
+    if not keys:
+        return []
+    query = (
+        select(CompanyDedupKey.company_id, CompanyDedupKey.key_type, CompanyDedupKey.key_value)
+        .join(Company, Company.id == CompanyDedupKey.company_id)
+        .where(
+            tuple_(CompanyDedupKey.key_type, CompanyDedupKey.key_value).in_(list(keys)),
+            Company.is_deleted == False
+        )
+    )
+    if exclude_id is not None:
+        query = query.where(CompanyDedupKey.company_id != exclude_id)
+    return db.execute(query).all()
+
+
+def find_candidates(
+    db: Session,
+    company_name: Optional[str] = None,
+    gst_no: Optional[str] = None,
+    pan_no: Optional[str] = None,
+    website: Optional[str] = None,
+    exclude_id: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Existing companies that look like the given one, strongest first.
+    `match` is "exact" when a GST/PAN/domain/name key is shared, else "possible".
+    """
+    matched: Dict[int, Set[str]] = defaultdict(set)
+    for company_id, key_type, _ in _matching_keys(db, compute_keys(company_name, gst_no, pan_no, website), exclude_id):
+        matched[company_id].add(key_type)
+    if not matched:
+        return []
+
+    names = dict(db.execute(select(Company.id, Company.company_name).where(Company.id.in_(list(matched)))).all())
+    candidates = [
+        {
+            "company_id": company_id,
+            "company_name": names.get(company_id),
+            "matched_keys": sorted(key_types),
+            "match": "exact" if key_types & set(STRONG_KEY_TYPES) else "possible",
+        }
+        for company_id, key_types in matched.items()
+    ]
+    candidates.sort(key=lambda c: (c["match"] != "exact", -len(c["matched_keys"]), c["company_id"]))
+    return candidates
+
+
+def unique_keys(gst_no: Optional[str] = None, pan_no: Optional[str] = None) -> Set[Tuple[str, str]]:
+    """
+    Keys that must not be shared: the GSTIN and an explicitly entered PAN. The PAN
+    embedded in a GSTIN only feeds candidate matching, so a new GSTIN is never blocked by it.
+    """
+    gst, pan = normalize_tax_id(gst_no), normalize_tax_id(pan_no)
+    return {key for key in (("gst", gst), ("pan", pan)) if key[1]}
+
+
+def ensure_unique(
+    db: Session,
+    gst_no: Optional[str] = None,
+    pan_no: Optional[str] = None,
+    exclude_id: Optional[int] = None
+) -> None:
+    """Reject a GST/PAN already held by another live company."""
+    taken = _matching_keys(db, unique_keys(gst_no, pan_no), exclude_id)
+    if taken:
+        company_id, key_type, key_value = taken[0]
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{key_type.upper()} '{key_value}' already exists on company {company_id}."
+        )
+
+
+def taken_unique_keys(db: Session, items: Iterable[Tuple[Optional[str], Optional[str]]]) -> Dict[Tuple[str, str], int]:
+    """For a batch of `(gst_no, pan_no)`: each unique key already held, mapped to its company; one query."""
+    keys = set()
+    for gst_no, pan_no in items:
+        keys.update(unique_keys(gst_no, pan_no))
+    return {(key_type, key_value): company_id for company_id, key_type, key_value in _matching_keys(db, keys)}
+
+
+# ---------------- Batch scan ----------------
+def find_clusters(
+    db: Session,
+    key_types: Iterable[str] = STRONG_KEY_TYPES,
+    max_block_size: int = MAX_BLOCK_SIZE,
+    min_size: int = 2
+) -> List[Dict[str, Any]]:
+    """
+    Duplicate clusters across all live companies without pairwise comparison:
+    the database groups companies by shared key (blocks of 2..max_block_size), then a
+    union-find over the block memberships merges overlapping blocks into clusters.
+    Three queries in total; work is linear in the number of key rows.
+    """
+    key_types = list(key_types)
+    live_key = (
+        select(CompanyDedupKey.key_type, CompanyDedupKey.key_value, CompanyDedupKey.company_id)
+        .join(Company, Company.id == CompanyDedupKey.company_id)
+        .where(CompanyDedupKey.key_type.in_(key_types), Company.is_deleted == False)
+        .subquery()
+    )
+    blocks = (
+        select(live_key.c.key_type, live_key.c.key_value)
+        .group_by(live_key.c.key_type, live_key.c.key_value)
+        .having(func.count().between(2, max_block_size))
+        .subquery()
+    )
+    memberships = db.execute(
+        select(live_key.c.key_type, live_key.c.key_value, live_key.c.company_id)
+        .join(blocks, (blocks.c.key_type == live_key.c.key_type) & (blocks.c.key_value == live_key.c.key_value))
+        .order_by(live_key.c.key_type, live_key.c.key_value)
+    ).all()
+
+    parent: Dict[int, int] = {}
+
+    def find(x: int) -> int:
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    block_members: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+    for key_type, key_value, company_id in memberships:
+        block_members[(key_type, key_value)].append(company_id)
+    for members in block_members.values():
+        root = find(members[0])
+        for company_id in members[1:]:
+            parent[find(company_id)] = root
+
+    clusters: Dict[int, Dict[str, Any]] = {}
+    for (key_type, key_value), members in block_members.items():
+        cluster = clusters.setdefault(find(members[0]), {"company_ids": set(), "keys": []})
+        cluster["company_ids"].update(members)
+        cluster["keys"].append({"key_type": key_type, "key_value": key_value, "company_ids": sorted(members)})
+
+    result = [c for c in clusters.values() if len(c["company_ids"]) >= min_size]
+    all_ids = [company_id for c in result for company_id in c["company_ids"]]
+    names = dict(db.execute(select(Company.id, Company.company_name).where(Company.id.in_(all_ids))).all()) if all_ids else {}
+
+    output = [
+        {
+            "size": len(c["company_ids"]),
+            "companies": [{"id": i, "company_name": names.get(i)} for i in sorted(c["company_ids"])],
+            "keys": c["keys"],
+        }
+        for c in result
+    ]
+    output.sort(key=lambda c: (-c["size"], c["companies"][0]["id"]))
+    return output
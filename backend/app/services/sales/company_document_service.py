@@ -0,0 +1,334 @@
+import hashlib
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from app.models.sales.company import Company, CompanyDocument
+from app.models.sales.company_document_upload import CompanyDocumentUpload
+from app.schemas.sales.company import (
+    CompanyDocumentResponse, CompanyDocumentUploadCreate, CompanyDocumentUploadResponse
+)
+from app.utils.env import env_get
+
+# Blobs live at <root>/<hash[:2]>/<hash[2:4]>/<hash>; unfinished uploads at <root>/uploads
+DOCUMENT_STORAGE_DIR = env_get("DOCUMENT_STORAGE_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "storage", "documents"
+)
+DOCUMENT_MAX_SIZE = int(env_get("DOCUMENT_MAX_SIZE") or 100 * 1024 * 1024)
+DOCUMENT_UPLOAD_TTL_HOURS = int(env_get("DOCUMENT_UPLOAD_TTL_HOURS") or 24)
+HASH_CHUNK_SIZE = 1024 * 1024
+# A blob is written (or reused) before its document row commits; the sweep leaves young ones alone
+BLOB_SWEEP_GRACE_SECONDS = 3600
+BLOB_SWEEP_BATCH_SIZE = 1000
+
+
+def _upload_dir() -> str:
+    path = os.path.join(DOCUMENT_STORAGE_DIR, "uploads")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def relative_blob_path(content_hash: str) -> str:
+    return os.path.join(content_hash[:2], content_hash[2:4], content_hash)
+
+
+def blob_path(content_hash: str) -> str:
+    return os.path.join(DOCUMENT_STORAGE_DIR, relative_blob_path(content_hash))
+
+
+def _part_path(upload_id: str) -> str:
+    return os.path.join(_upload_dir(), f"{upload_id}.part")
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# ---------------- Writing ----------------
+class ChunkWriter:
+    """
+    Streams request chunks to a file under the storage root without buffering the body,
+    hashing as it goes. `offset` resumes a part file: anything past it is discarded first,
+    so a client may safely resend a chunk whose acknowledgement it never received.
+    """
+
+    def __init__(self, path: str, offset: int = 0, max_size: int = DOCUMENT_MAX_SIZE):
+        self.path = path
+        self.size = offset
+        self.max_size = max_size
+        self.sha256 = hashlib.sha256()
+        self._file = open(path, "r+b" if offset else "wb")
+        if offset:
+            self._file.truncate(offset)
+            self._file.seek(offset)
+
+    def write(self, chunk: bytes) -> None:
+        if self.size + len(chunk) > self.max_size:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Document exceeds the {self.max_size} byte limit"
+            )
+        self._file.write(chunk)
+        self.sha256.update(chunk)
+        self.size += len(chunk)
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def discard(self) -> None:
+        self.close()
+        _remove(self.path)
+
+
+def open_upload() -> ChunkWriter:
+    """Writer for a single-request upload, finished with store_document()."""
+    return ChunkWriter(os.path.join(_upload_dir(), f"{uuid.uuid4().hex}.part"))
+
+
+def _hash_file(path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def _commit_blob(part_path: str, content_hash: str) -> bool:
+    """Move a finished part file to its content address; returns True when the bytes were already stored."""
+    target = blob_path(content_hash)
+    if os.path.exists(target):
+        _remove(part_path)
+        os.utime(target)  # restart the sweep's grace period for the row about to reference it
+        return True
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    os.replace(part_path, target)
+    return False
+
+
+def ensure_company_exists(db: Session, company_id: int) -> None:
+    exists = db.query(Company.id).filter(Company.id == company_id, Company.is_deleted == False).first()
+    if not exists:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Company not found")
+
+
+def _create_document(
+    db: Session,
+    company_id: int,
+    content_hash: str,
+    size: int,
+    file_name: str,
+    content_type: Optional[str],
+    document_type_id: Optional[int],
+    description: Optional[str],
+    login_id: int,
+    deduplicated: bool
+) -> Dict[str, Any]:
+    document = CompanyDocument(
+        company_id=company_id,
+        document_type_id=document_type_id,
+        file_name=file_name,
+        file_path=relative_blob_path(content_hash),
+        file_size=size,
+        content_hash=content_hash,
+        content_type=content_type,
+        description=description,
+        created_by=login_id
+    )
+    db.add(document)
+    # The company's detail payload (and so its ETag) includes its documents
+    db.execute(
+        update(Company).where(Company.id == company_id).values(updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    db.refresh(document)
+    return {
+        **CompanyDocumentResponse.from_orm(document).dict(),
+        "deduplicated": deduplicated
+    }
+
+
+# ---------------- Single request upload ----------------
+def store_document(
+    db: Session,
+    company_id: int,
+    writer: ChunkWriter,
+    file_name: str,
+    content_type: Optional[str],
+    document_type_id: Optional[int],
+    description: Optional[str],
+    login_id: int
+) -> Dict[str, Any]:
+    """Finish a streamed upload: content-address the bytes and record the document row."""
+    writer.close()
+    try:
+        content_hash = writer.sha256.hexdigest()
+        deduplicated = _commit_blob(writer.path, content_hash)
+        return _create_document(
+            db, company_id, content_hash, writer.size, file_name, content_type,
+            document_type_id, description, login_id, deduplicated
+        )
+    except Exception:
+        db.rollback()
+        _remove(writer.path)
+        raise
+
+
+# ---------------- Resumable upload ----------------
+def _purge_expired_uploads(db: Session) -> None:
+    cutoff = datetime.utcnow() - timedelta(hours=DOCUMENT_UPLOAD_TTL_HOURS)
+    expired = db.query(CompanyDocumentUpload).filter(CompanyDocumentUpload.updated_at < cutoff).all()
+    for upload in expired:
+        _remove(_part_path(upload.id))
+        db.delete(upload)
+
+
+def create_upload(
+    db: Session, company_id: int, data: CompanyDocumentUploadCreate, login_id: int
+) -> CompanyDocumentUploadResponse:
+    try:
+        ensure_company_exists(db, company_id)
+        if data.total_size > DOCUMENT_MAX_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Document exceeds the {DOCUMENT_MAX_SIZE} byte limit"
+            )
+        _purge_expired_uploads(db)
+
+        upload = CompanyDocumentUpload(
+            id=uuid.uuid4().hex,
+            company_id=company_id,
+            received_size=0,
+            created_by=login_id,
+            **data.dict()
+        )
+        open(_part_path(upload.id), "wb").close()
+        db.add(upload)
+        db.commit()
+        db.refresh(upload)
+        return CompanyDocumentUploadResponse.from_orm(upload)
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Error creating upload: {str(e)}")
+
+
+def get_upload(db: Session, company_id: int, upload_id: str) -> CompanyDocumentUpload:
+    upload = db.query(CompanyDocumentUpload).filter(
+        CompanyDocumentUpload.id == upload_id,
+        CompanyDocumentUpload.company_id == company_id
+    ).first()
+    if not upload:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found or expired")
+    return upload
+
+
+def open_chunk(db: Session, company_id: int, upload_id: str, offset: int) -> ChunkWriter:
+    """
+    Writer positioned at `offset` of the upload's part file. Offsets beyond the bytes
+    received so far are refused with 409 so the client re-syncs from received_size.
+    """
+    upload = get_upload(db, company_id, upload_id)
+    if offset > upload.received_size:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Offset {offset} is past the {upload.received_size} bytes received; resume from {upload.received_size}"
+        )
+    return ChunkWriter(_part_path(upload.id), offset=offset, max_size=upload.total_size)
+
+
+def record_chunk(db: Session, company_id: int, upload_id: str, writer: ChunkWriter) -> CompanyDocumentUploadResponse:
+    writer.close()
+    upload = get_upload(db, company_id, upload_id)
+    upload.received_size = writer.size
+    upload.updated_at = datetime.utcnow()
+    db.commit()
+    db.refresh(upload)
+    return CompanyDocumentUploadResponse.from_orm(upload)
+
+
+def complete_upload(db: Session, company_id: int, upload_id: str, login_id: int) -> Dict[str, Any]:
+    """Hash the assembled part file, move it to its content address and record the document."""
+    try:
+        upload = get_upload(db, company_id, upload_id)
+        if upload.received_size != upload.total_size:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Upload incomplete: {upload.received_size} of {upload.total_size} bytes received"
+            )
+        part_path = _part_path(upload.id)
+        content_hash = _hash_file(part_path)
+        deduplicated = _commit_blob(part_path, content_hash)
+        db.delete(upload)
+        return _create_document(
+            db, company_id, content_hash, upload.total_size, upload.file_name, upload.content_type,
+            upload.document_type_id, upload.description, login_id, deduplicated
+        )
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Error completing upload: {str(e)}")
+
+
+def cancel_upload(db: Session, company_id: int, upload_id: str) -> None:
+    upload = get_upload(db, company_id, upload_id)
+    _remove(_part_path(upload.id))
+    db.delete(upload)
+    db.commit()
+
+
+# ---------------- Blob sweep ----------------
+def _unreferenced(db: Session, hashes: List[str]) -> List[str]:
+    referenced = set(db.scalars(select(CompanyDocument.content_hash).where(CompanyDocument.content_hash.in_(hashes))))
+    return [content_hash for content_hash in hashes if content_hash not in referenced]
+
+
+def sweep_blobs(db: Session) -> int:
+    """
+    Delete stored blobs that no document row (live or soft-deleted) references any more:
+    child reconciliation and merges delete rows without touching the shared files. One
+    query per BLOB_SWEEP_BATCH_SIZE blobs; returns the number removed.
+    """
+    cutoff = time.time() - BLOB_SWEEP_GRACE_SECONDS
+    candidates = []
+    for directory, subdirs, files in os.walk(DOCUMENT_STORAGE_DIR):
+        if directory == DOCUMENT_STORAGE_DIR and "uploads" in subdirs:
+            subdirs.remove("uploads")  # part files belong to the upload purge
+        candidates.extend(
+            name for name in files
+            if os.path.join(directory, name) == blob_path(name) and os.path.getmtime(blob_path(name)) < cutoff
+        )
+    removed = 0
+    for start in range(0, len(candidates), BLOB_SWEEP_BATCH_SIZE):
+        for content_hash in _unreferenced(db, candidates[start:start + BLOB_SWEEP_BATCH_SIZE]):
+            _remove(blob_path(content_hash))
+            removed += 1
+    return removed
+
+
+# ---------------- Download ----------------
+def get_document_file(db: Session, company_id: int, document_id: int) -> CompanyDocument:
+    """The document row of an uploaded file whose bytes are present on disk."""
+    document = db.query(CompanyDocument).filter(
+        CompanyDocument.id == document_id,
+        CompanyDocument.company_id == company_id,
+        CompanyDocument.is_deleted == False
+    ).first()
+    if not document:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+    if not document.content_hash or not os.path.exists(blob_path(document.content_hash)):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document has no stored content")
+    return document
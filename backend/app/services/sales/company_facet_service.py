@@ -0,0 +1,156 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select, func, and_, literal, union_all, distinct, exists, tuple_
+from sqlalchemy.orm import Session, aliased
+from app.models.sales.company import Company, CompanyAddress
+from app.schemas.sales.company import CompanyFilters
+from app.services.sales.company_360_service import resolve_master_names
+from app.utils.env import env_get
+
+COMPANY_FACET_TTL = int(env_get("COMPANY_FACET_TTL") or 60)
+COMPANY_FACET_CACHE_SIZE = 256
+
+COMPANY_FACETS = {
+    "industry_segment_id": Company.industry_segment_id,
+    "account_type_id": Company.account_type_id,
+    "account_sub_type_id": Company.account_sub_type_id,
+    "business_type_id": Company.business_type_id,
+    "account_region_id": Company.account_region_id,
+    "is_child": Company.is_child,
+}
+ADDRESS_FACETS = {
+    "country_id": CompanyAddress.country_id,
+    "state_id": CompanyAddress.state_id,
+    "city_id": CompanyAddress.city_id,
+}
+FACETS = {**COMPANY_FACETS, **ADDRESS_FACETS}
+
+
+# ---------------- Filters ----------------
+def filter_conditions(filters: Optional[CompanyFilters]) -> List[Any]:
+    """WHERE conditions on Company for the list and facet endpoints (address filters as EXISTS)."""
+    if filters is None:
+        return []
+    conditions = []
+    for field, column in COMPANY_FACETS.items():
+        value = getattr(filters, field)
+        if value is None:
+            continue
+        conditions.append(column.in_(value) if isinstance(value, list) else column == value)
+    if filters.parent_company_id is not None:
+        conditions.append(Company.parent_company_id == filters.parent_company_id)
+
+    # Aliased so the EXISTS stays correlated to Company only when the facet query joins addresses itself
+    address = aliased(CompanyAddress)
+    address_conditions = [
+        getattr(address, field).in_(getattr(filters, field)) for field in ADDRESS_FACETS if getattr(filters, field)
+    ]
+    if address_conditions:
+        conditions.append(exists().where(
+            address.company_id == Company.id, address.is_deleted == False, *address_conditions
+        ))
+    return conditions
+
+
+# ---------------- Cache ----------------
+_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _signature(filters: Optional[CompanyFilters]) -> str:
+    values = {} if filters is None else filters.dict(exclude_none=True)
+    return json.dumps({k: sorted(set(v)) if isinstance(v, list) else v for k, v in values.items()}, sort_keys=True)
+
+
+def invalidate() -> None:
+    """Drop cached counts; called wherever company rows or addresses are written."""
+    with _lock:
+        _cache.clear()
+
+
+# ---------------- Counting ----------------
+def _facet_rows_grouping_sets(db: Session, base_conditions: List[Any]):
+    """One GROUPING SETS query: a set per facet plus () for the total. GROUPING() tells the sets apart."""
+    columns = list(FACETS.values())
+    rows = db.execute(
+        select(func.grouping(*columns).label("grouping_id"), *columns, func.count(distinct(Company.id)))
+        .select_from(Company)
+        .outerjoin(CompanyAddress, and_(CompanyAddress.company_id == Company.id, CompanyAddress.is_deleted == False))
+        .where(*base_conditions)
+        .group_by(func.grouping_sets(*[tuple_(column) for column in columns], tuple_()))
+    )
+    width = len(columns)
+    bit_to_field = {width - 1 - i: field for i, field in enumerate(FACETS)}
+    for row in rows:
+        grouped = [bit for bit in range(width) if not (row.grouping_id >> bit) & 1]
+        if not grouped:
+            yield None, None, row[-1]
+        else:
+            field = bit_to_field[grouped[0]]
+            yield field, row[1 + list(FACETS).index(field)], row[-1]
+
+
+def _facet_rows_union(db: Session, base_conditions: List[Any]):
+    """Same counts for dialects without GROUPING SETS: one UNION ALL of GROUP BYs, still a single round trip."""
+    joined = (
+        select(Company.id.label("company_id"), *[column.label(field) for field, column in FACETS.items()])
+        .select_from(Company)
+        .outerjoin(CompanyAddress, and_(CompanyAddress.company_id == Company.id, CompanyAddress.is_deleted == False))
+        .where(*base_conditions)
+        .subquery()
+    )
+    parts = [
+        select(literal(field).label("facet"), joined.c[field].label("value"), func.count(distinct(joined.c.company_id)))
+        .group_by(joined.c[field])
+        for field in FACETS
+    ]
+    parts.append(select(literal(None).label("facet"), literal(None).label("value"), func.count(distinct(joined.c.company_id))))
+    yield from db.execute(union_all(*parts))
+
+
+def get_facets(db: Session, filters: Optional[CompanyFilters] = None) -> Dict[str, Any]:
+    """
+    Count of matching companies per value of every facet, for the current filters
+    (drill-down counts), plus the total. Address facets count a company once per
+    distinct country / state / city among its live addresses. Cached per filter
+    signature for COMPANY_FACET_TTL seconds.
+    """
+    key = _signature(filters)
+    now = time.monotonic()
+    with _lock:
+        cached = _cache.get(key)
+        if cached and cached[0] > now:
+            _cache.move_to_end(key)
+            return cached[1]
+
+    base_conditions = [Company.is_deleted == False, *filter_conditions(filters)]
+    if db.get_bind().dialect.name == "postgresql":
+        rows = _facet_rows_grouping_sets(db, base_conditions)
+    else:
+        rows = _facet_rows_union(db, base_conditions)
+
+    total = 0
+    facets: Dict[str, List[Dict[str, Any]]] = {field: [] for field in FACETS}
+    for field, value, count in rows:
+        if field is None:
+            total = count
+            continue
+        if value is not None:
+            value = FACETS[field].type.python_type(value)  # UNION ALL loses per-facet column types
+        if value is not None or field in COMPANY_FACETS:
+            # a NULL address value only means "no address", which is not a facet value
+            facets[field].append({field: value, "count": count})
+    for items in facets.values():
+        items.sort(key=lambda item: -item["count"])
+    result = {"total": total, "facets": facets}
+    resolve_master_names(db, result)
+
+    with _lock:
+        _cache[key] = (now + COMPANY_FACET_TTL, result)
+        _cache.move_to_end(key)
+        while len(_cache) > COMPANY_FACET_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
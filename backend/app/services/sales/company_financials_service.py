@@ -0,0 +1,272 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, delete, func, union
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+from collections import defaultdict
+from decimal import Decimal
+from fastapi import HTTPException, status
+from app.models.sales.company import Company, CompanyTurnover, CompanyProfit
+from app.models.sales.company_financials import CompanyFinancialSummary
+from app.models.masters.master_currency import MasterCurrency
+from app.services.sales import company_scoring_service
+from app.utils.env import env_get
+
+# Amounts are normalised into this currency; its rate is 1 whatever master_currencies says
+REPORTING_CURRENCY_CODE = (env_get("REPORTING_CURRENCY_CODE") or "INR").upper()
+REFRESH_BATCH_SIZE = 1000
+
+# (label, exclusive upper bound in the reporting currency); the last band is open-ended
+REVENUE_BANDS = (
+    ("< 1 Cr", Decimal("10000000")),
+    ("1-10 Cr", Decimal("100000000")),
+    ("10-100 Cr", Decimal("1000000000")),
+    ("100-1000 Cr", Decimal("10000000000")),
+    ("1000+ Cr", None),
+)
+
+SEGMENT_COLUMNS = {
+    "industry_segment": CompanyFinancialSummary.industry_segment_id,
+    "region": CompanyFinancialSummary.account_region_id,
+}
+
+
+def revenue_band(amount: Optional[Decimal]) -> Optional[str]:
+    if amount is None:
+        return None
+    for label, upper in REVENUE_BANDS:
+        if upper is None or amount < upper:
+            return label
+
+
+# ---------------- Refresh ----------------
+def _exchange_rates(db: Session) -> Dict[Optional[int], Optional[Decimal]]:
+    """currency_id -> rate into the reporting currency (None = unknown). Rows without a currency count as reporting currency."""
+    rates: Dict[Optional[int], Optional[Decimal]] = {None: Decimal(1)}
+    for currency_id, code, rate in db.execute(
+        select(MasterCurrency.currency_id, MasterCurrency.currency_code, MasterCurrency.exchange_rate)
+    ):
+        rates[currency_id] = Decimal(1) if code and code.upper() == REPORTING_CURRENCY_CODE else rate
+    return rates
+
+
+def _yearly_totals(
+    db: Session, model, company_ids: List[int], rates: Dict[Optional[int], Optional[Decimal]]
+) -> Tuple[Dict[int, Dict[int, Decimal]], set]:
+    """Per company and year, the sum of live rows converted to the reporting currency; one SELECT."""
+    totals: Dict[int, Dict[int, Decimal]] = defaultdict(lambda: defaultdict(Decimal))
+    unconverted = set()
+    for company_id, year, revenue, currency_id in db.execute(
+        select(model.company_id, model.year, model.revenue, model.currency_id)
+        .where(model.company_id.in_(company_ids), model.is_deleted == False, model.revenue.isnot(None))
+    ):
+        rate = rates.get(currency_id)
+        if rate is None:
+            unconverted.add(company_id)
+            continue
+        totals[company_id][year] += Decimal(revenue) * rate
+    return totals, unconverted
+
+
+def _ratio(numerator: Optional[Decimal], denominator: Optional[Decimal]) -> Optional[Decimal]:
+    if numerator is None or not denominator:
+        return None
+    return (numerator / denominator).quantize(Decimal("0.0001"))
+
+
+def refresh_companies(db: Session, company_ids: Iterable[int]) -> int:
+    """
+    Recompute the summary rows of the given companies from their financial rows:
+    four SELECTs, one DELETE and one executemany, whatever the number of companies.
+    Deleted (or missing) companies simply lose their row.
+    """
+    ids = list(dict.fromkeys(company_ids))
+    if not ids:
+        return 0
+
+    companies = db.execute(
+        select(Company.id, Company.industry_segment_id, Company.account_region_id)
+        .where(Company.id.in_(ids), Company.is_deleted == False)
+    ).all()
+    rates = _exchange_rates(db)
+    turnover, unconverted_turnover = _yearly_totals(db, CompanyTurnover, ids, rates)
+    profit, unconverted_profit = _yearly_totals(db, CompanyProfit, ids, rates)
+
+    rows = []
+    for company in companies:
+        years = turnover.get(company.id, {})
+        latest_year = max(years) if years else None
+        latest = years.get(latest_year) if latest_year is not None else None
+        previous_year = latest_year - 1 if latest_year is not None and latest_year - 1 in years else None
+        previous = years.get(previous_year) if previous_year is not None else None
+        latest_profit = profit.get(company.id, {}).get(latest_year) if latest_year is not None else None
+        rows.append({
+            "company_id": company.id,
+            "industry_segment_id": company.industry_segment_id,
+            "account_region_id": company.account_region_id,
+            "latest_year": latest_year,
+            "latest_turnover": latest,
+            "previous_year": previous_year,
+            "previous_turnover": previous,
+            "yoy_growth": _ratio(latest - previous, previous) if previous is not None else None,
+            "latest_profit": latest_profit,
+            "profit_margin": _ratio(latest_profit, latest),
+            "revenue_band": revenue_band(latest),
+            "has_unconverted": company.id in unconverted_turnover or company.id in unconverted_profit,
+        })
+
+    db.execute(
+        delete(CompanyFinancialSummary).where(CompanyFinancialSummary.company_id.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    if rows:
+        db.execute(insert(CompanyFinancialSummary), rows, execution_options={"render_nulls": True})
+    # Growth and margin feed the account score
+    company_scoring_service.mark_stale(db, ids)
+    return len(rows)
+
+
+def _refresh_in_batches(db: Session, id_query) -> int:
+    total, last_id = 0, 0
+    while True:
+        ids = list(db.scalars(id_query.where(id_query.selected_columns[0] > last_id).limit(REFRESH_BATCH_SIZE)))
+        if not ids:
+            return total
+        total += refresh_companies(db, ids)
+        last_id = ids[-1]
+
+
+def refresh_all(db: Session) -> int:
+    """Rebuild every summary row (initial backfill or after bulk rate changes)."""
+    db.execute(delete(CompanyFinancialSummary))
+    return _refresh_in_batches(db, select(Company.id).where(Company.is_deleted == False).order_by(Company.id))
+
+
+def refresh_currency(db: Session, currency_id: int) -> int:
+    """Refresh only the companies holding turnover or profit rows in `currency_id`."""
+    holders = union(
+        select(CompanyTurnover.company_id.label("company_id")).where(CompanyTurnover.currency_id == currency_id),
+        select(CompanyProfit.company_id.label("company_id")).where(CompanyProfit.currency_id == currency_id),
+    ).subquery()
+    return _refresh_in_batches(db, select(holders.c.company_id).order_by(holders.c.company_id))
+
+
+# ---------------- Analytics ----------------
+def _live_summaries(industry_segment_id: Optional[int] = None, account_region_id: Optional[int] = None):
+    """Base filter: summaries with a latest turnover, optionally narrowed to one segment / region."""
+    conditions = [CompanyFinancialSummary.latest_turnover.isnot(None)]
+    if industry_segment_id is not None:
+        conditions.append(CompanyFinancialSummary.industry_segment_id == industry_segment_id)
+    if account_region_id is not None:
+        conditions.append(CompanyFinancialSummary.account_region_id == account_region_id)
+    return conditions
+
+
+def _amount(value) -> Optional[Decimal]:
+    return None if value is None else Decimal(value).quantize(Decimal("0.01"))
+
+
+def get_revenue_bands(db: Session, industry_segment_id: Optional[int] = None, account_region_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Company count and total latest turnover per revenue band, in band order (one GROUP BY)."""
+    counts = {
+        band: (count, total) for band, count, total in db.execute(
+            select(CompanyFinancialSummary.revenue_band, func.count(), func.sum(CompanyFinancialSummary.latest_turnover))
+            .where(*_live_summaries(industry_segment_id, account_region_id))
+            .group_by(CompanyFinancialSummary.revenue_band)
+        )
+    }
+    return [
+        {
+            "band": label,
+            "upper_bound": upper,
+            "company_count": counts.get(label, (0, None))[0],
+            "total_turnover": _amount(counts.get(label, (0, None))[1]) or Decimal("0.00"),
+        }
+        for label, upper in REVENUE_BANDS
+    ]
+
+
+def get_top_companies(
+    db: Session, limit: int = 10, industry_segment_id: Optional[int] = None, account_region_id: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Top companies by latest turnover, read off the turnover index."""
+    rows = db.execute(
+        select(CompanyFinancialSummary, Company.company_name)
+        .join(Company, Company.id == CompanyFinancialSummary.company_id)
+        .where(*_live_summaries(industry_segment_id, account_region_id))
+        .order_by(CompanyFinancialSummary.latest_turnover.desc(), CompanyFinancialSummary.company_id)
+        .limit(limit)
+    ).all()
+    return [_summary_item(summary, name) for summary, name in rows]
+
+
+def get_growth(
+    db: Session,
+    limit: int = 10,
+    direction: str = "top",
+    min_turnover: Optional[Decimal] = None,
+    industry_segment_id: Optional[int] = None,
+    account_region_id: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Fastest growing (`top`) or shrinking (`bottom`) companies by year-on-year turnover growth."""
+    if direction not in ("top", "bottom"):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="direction must be 'top' or 'bottom'")
+    growth = CompanyFinancialSummary.yoy_growth
+    query = (
+        select(CompanyFinancialSummary, Company.company_name)
+        .join(Company, Company.id == CompanyFinancialSummary.company_id)
+        .where(*_live_summaries(industry_segment_id, account_region_id), growth.isnot(None))
+        .order_by(growth.desc() if direction == "top" else growth.asc(), CompanyFinancialSummary.company_id)
+        .limit(limit)
+    )
+    if min_turnover is not None:
+        query = query.where(CompanyFinancialSummary.latest_turnover >= min_turnover)
+    return [_summary_item(summary, name) for summary, name in db.execute(query).all()]
+
+
+def get_segment_totals(db: Session, group_by: str = "industry_segment") -> List[Dict[str, Any]]:
+    """Latest turnover / profit sums and average growth per industry segment or region (one GROUP BY)."""
+    column = SEGMENT_COLUMNS.get(group_by)
+    if column is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"group_by must be one of: {', '.join(SEGMENT_COLUMNS)}"
+        )
+    summary = CompanyFinancialSummary
+    rows = db.execute(
+        select(
+            column,
+            func.count(),
+            func.sum(summary.latest_turnover),
+            func.sum(summary.latest_profit),
+            func.avg(summary.yoy_growth),
+        )
+        .where(*_live_summaries())
+        .group_by(column)
+        .order_by(func.sum(summary.latest_turnover).desc())
+    )
+    return [
+        {
+            f"{group_by}_id": key,
+            "company_count": count,
+            "total_turnover": _amount(turnover),
+            "total_profit": _amount(profit),
+            "avg_yoy_growth": None if growth is None else Decimal(growth).quantize(Decimal("0.0001")),
+        }
+        for key, count, turnover, profit, growth in rows
+    ]
+
+
+def _summary_item(summary: CompanyFinancialSummary, company_name: str) -> Dict[str, Any]:
+    return {
+        "company_id": summary.company_id,
+        "company_name": company_name,
+        "industry_segment_id": summary.industry_segment_id,
+        "account_region_id": summary.account_region_id,
+        "latest_year": summary.latest_year,
+        "latest_turnover": summary.latest_turnover,
+        "previous_turnover": summary.previous_turnover,
+        "yoy_growth": summary.yoy_growth,
+        "latest_profit": summary.latest_profit,
+        "profit_margin": summary.profit_margin,
+        "revenue_band": summary.revenue_band,
+        "has_unconverted": summary.has_unconverted,
+    }
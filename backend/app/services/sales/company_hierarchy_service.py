@@ -0,0 +1,240 @@
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select, insert, delete, func, literal
+from typing import Optional, List, Dict, Any, Iterable
+from fastapi import HTTPException, status
+from app.models.sales.company import Company, CompanyTurnover
+from app.models.sales.company_hierarchy import CompanyHierarchy
+from app.models.sales.contact import Contact
+
+# Guard for rebuild(): a deeper tree than this means parent_company_id contains a cycle
+MAX_HIERARCHY_DEPTH = 100
+
+
+# ---------------- Maintenance ----------------
+def add_companies(db: Session, company_ids: Iterable[int]) -> None:
+    """
+    Register newly inserted companies in the closure table.
+    Two statements regardless of batch size: the self rows, then one INSERT ... SELECT
+    copying each parent's ancestor chain. Parents must already be indexed.
+    """
+    ids = list(company_ids)
+    if not ids:
+        return
+
+    db.execute(
+        insert(CompanyHierarchy),
+        [{"ancestor_id": company_id, "descendant_id": company_id, "depth": 0} for company_id in ids]
+    )
+    db.execute(
+        insert(CompanyHierarchy).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(CompanyHierarchy.ancestor_id, Company.id, CompanyHierarchy.depth + 1)
+            .join(CompanyHierarchy, CompanyHierarchy.descendant_id == Company.parent_company_id)
+            .where(Company.id.in_(ids))
+        )
+    )
+
+
+def get_subtree_ids(db: Session, root_ids: Iterable[int]) -> List[int]:
+    """Every company under the given roots, roots included."""
+    return list(db.scalars(
+        select(CompanyHierarchy.descendant_id).where(CompanyHierarchy.ancestor_id.in_(list(root_ids))).distinct()
+    ))
+
+
+def ensure_no_cycle(db: Session, company_ids: Iterable[int], new_parent_id: Optional[int]) -> None:
+    """Reject a re-parent that would place a company under itself or its own descendants."""
+    if new_parent_id is None:
+        return
+    hit = db.scalar(
+        select(CompanyHierarchy.ancestor_id).where(
+            CompanyHierarchy.ancestor_id.in_(list(company_ids)),
+            CompanyHierarchy.descendant_id == new_parent_id
+        ).limit(1)
+    )
+    if hit is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Company {new_parent_id} is a descendant of company {hit}; this would create a cycle"
+        )
+
+
+def move_subtrees(db: Session, root_ids: Iterable[int], new_parent_id: Optional[int]) -> None:
+    """
+    Re-link the subtrees rooted at `root_ids` under `new_parent_id` (None = make them roots).
+    Cost is three statements plus the subtree id fetch, independent of tree depth.
+    Callers update Company.parent_company_id themselves.
+    """
+    roots = list(root_ids)
+    if not roots:
+        return
+    ensure_no_cycle(db, roots, new_parent_id)
+
+    subtree_ids = get_subtree_ids(db, roots)
+
+    # Drop every link from outside the moved subtrees into them
+    db.execute(
+        delete(CompanyHierarchy).where(
+            CompanyHierarchy.descendant_id.in_(subtree_ids),
+            CompanyHierarchy.ancestor_id.notin_(subtree_ids)
+        ).execution_options(synchronize_session=False)
+    )
+
+    if new_parent_id is None:
+        return
+
+    # Cross join the new parent's ancestor chain with each moved subtree
+    above = aliased(CompanyHierarchy)
+    below = aliased(CompanyHierarchy)
+    db.execute(
+        insert(CompanyHierarchy).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(above.ancestor_id, below.descendant_id, above.depth + below.depth + 1)
+            .select_from(above)
+            .join(below, literal(True))
+            .where(above.descendant_id == new_parent_id, below.ancestor_id.in_(roots))
+        )
+    )
+
+
+def rebuild(db: Session) -> int:
+    """
+    Recompute the whole closure table from Company.parent_company_id, one level per
+    statement. Served by POST /sales/companies/hierarchy/rebuild for repairs; returns the
+    number of rows written.
+    """
+    db.execute(delete(CompanyHierarchy))
+    total = db.execute(
+        insert(CompanyHierarchy).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(Company.id, Company.id, literal(0))
+        )
+    ).rowcount
+
+    for depth in range(1, MAX_HIERARCHY_DEPTH + 1):
+        added = db.execute(
+            insert(CompanyHierarchy).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(CompanyHierarchy.ancestor_id, Company.id, literal(depth))
+                .join(CompanyHierarchy, CompanyHierarchy.descendant_id == Company.parent_company_id)
+                .where(CompanyHierarchy.depth == depth - 1)
+            )
+        ).rowcount
+        if not added:
+            return total
+        total += added
+
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Company hierarchy deeper than {MAX_HIERARCHY_DEPTH} levels; parent_company_id contains a cycle"
+    )
+
+
+# ---------------- Queries ----------------
+def _company_exists(db: Session, company_id: int) -> bool:
+    return db.scalar(
+        select(Company.id).where(Company.id == company_id, Company.is_deleted == False)
+    ) is not None
+
+
+def get_ancestors(db: Session, company_id: int) -> Optional[List[Dict[str, Any]]]:
+    """Non-deleted ancestor chain from the direct parent up to the root."""
+    if not _company_exists(db, company_id):
+        return None
+    rows = db.execute(
+        select(Company.id, Company.company_name, CompanyHierarchy.depth)
+        .join(CompanyHierarchy, CompanyHierarchy.ancestor_id == Company.id)
+        .where(
+            CompanyHierarchy.descendant_id == company_id,
+            CompanyHierarchy.depth > 0,
+            Company.is_deleted == False
+        )
+        .order_by(CompanyHierarchy.depth)
+    )
+    return [{"id": r.id, "name": r.company_name, "depth": r.depth} for r in rows]
+
+
+def get_descendants(db: Session, company_id: int, max_depth: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+    """Every non-deleted company below `company_id`, breadth first."""
+    if not _company_exists(db, company_id):
+        return None
+    query = (
+        select(Company.id, Company.company_name, Company.parent_company_id, CompanyHierarchy.depth)
+        .join(CompanyHierarchy, CompanyHierarchy.descendant_id == Company.id)
+        .where(
+            CompanyHierarchy.ancestor_id == company_id,
+            CompanyHierarchy.depth > 0,
+            Company.is_deleted == False
+        )
+    )
+    if max_depth is not None:
+        query = query.where(CompanyHierarchy.depth <= max_depth)
+    rows = db.execute(query.order_by(CompanyHierarchy.depth, Company.company_name))
+    return [
+        {"id": r.id, "name": r.company_name, "parent_company_id": r.parent_company_id, "depth": r.depth}
+        for r in rows
+    ]
+
+
+def get_subtree_summary(db: Session, company_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Rollups over a company and all of its subsidiaries in three queries:
+    company count and max depth, contact count, and latest-year turnover per currency.
+    """
+    if not _company_exists(db, company_id):
+        return None
+
+    subtree = (
+        select(CompanyHierarchy.descendant_id.label("company_id"))
+        .join(Company, Company.id == CompanyHierarchy.descendant_id)
+        .where(CompanyHierarchy.ancestor_id == company_id, Company.is_deleted == False)
+        .subquery()
+    )
+
+    company_count, max_depth = db.execute(
+        select(func.count(), func.max(CompanyHierarchy.depth))
+        .select_from(CompanyHierarchy)
+        .join(Company, Company.id == CompanyHierarchy.descendant_id)
+        .where(CompanyHierarchy.ancestor_id == company_id, Company.is_deleted == False)
+    ).one()
+
+    contact_count = db.scalar(
+        select(func.count(Contact.id)).where(
+            Contact.company_id.in_(select(subtree.c.company_id)),
+            Contact.is_deleted == False
+        )
+    )
+
+    ranked = (
+        select(
+            CompanyTurnover.company_id,
+            CompanyTurnover.revenue,
+            CompanyTurnover.currency_id,
+            func.row_number().over(
+                partition_by=CompanyTurnover.company_id,
+                order_by=CompanyTurnover.year.desc()
+            ).label("rn")
+        )
+        .where(
+            CompanyTurnover.company_id.in_(select(subtree.c.company_id)),
+            CompanyTurnover.is_deleted == False
+        )
+        .subquery()
+    )
+    turnover_rows = db.execute(
+        select(ranked.c.currency_id, func.sum(ranked.c.revenue), func.count())
+        .where(ranked.c.rn == 1)
+        .group_by(ranked.c.currency_id)
+    )
+
+    return {
+        "company_id": company_id,
+        "company_count": company_count,
+        "subsidiary_count": company_count - 1,
+        "max_depth": max_depth or 0,
+        "contact_count": contact_count,
+        "latest_turnover": [
+            {"currency_id": currency_id, "total": total, "company_count": count}
+            for currency_id, total, count in turnover_rows
+        ]
+    }
@@ -0,0 +1,164 @@
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, delete, func, or_
+from typing import List, Dict, Any, Iterable
+from fastapi import HTTPException, status
+from app.models.sales.company import Company, CompanyAddress, CompanyTurnover, CompanyProfit, CompanyDocument
+from app.models.sales.company_hierarchy import CompanyHierarchy
+from app.models.sales.contact import Contact
+from app.services.sales import (
+    company_hierarchy_service, company_typeahead_service, company_search_service, company_dedup_service,
+    company_financials_service, company_scoring_service, company_facet_service, geo_rollup_service
+)
+
+# Child rows that describe the same fact once both companies' rows share a company_id
+DUPLICATE_KEYS = {
+    "addresses": (CompanyAddress, ("address_type_id", "address", "country_id", "state_id", "city_id", "zip_code")),
+    "documents": (CompanyDocument, ("document_type_id", "file_path")),
+}
+# Yearly figures: the target's own row for a year wins over any source row
+YEARLY_MODELS = {"turnover_records": CompanyTurnover, "profit_records": CompanyProfit}
+
+
+def _validate(db: Session, target_id: int, source_ids: List[int]) -> None:
+    if target_id in source_ids:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A company cannot be merged into itself")
+
+    live_ids = set(db.scalars(
+        select(Company.id).where(Company.id.in_([target_id, *source_ids]), Company.is_deleted == False)
+    ))
+    if target_id not in live_ids:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Company not found")
+    missing = [source_id for source_id in source_ids if source_id not in live_ids]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Source company id(s) not found: {', '.join(map(str, missing))}"
+        )
+
+    # Folding an ancestor into its own descendant would leave the target under itself
+    ancestor = db.scalar(
+        select(CompanyHierarchy.ancestor_id).where(
+            CompanyHierarchy.ancestor_id.in_(source_ids),
+            CompanyHierarchy.descendant_id == target_id
+        ).limit(1)
+    )
+    if ancestor is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Company {target_id} is a descendant of source company {ancestor}"
+        )
+
+
+def _delete_duplicates(db: Session, model, target_id: int, key_columns: Iterable[str]) -> int:
+    """Keep the lowest id of each group of live rows equal on `key_columns`; one DELETE."""
+    keep = (
+        select(func.min(model.id))
+        .where(model.company_id == target_id, model.is_deleted == False)
+        .group_by(*(getattr(model, column) for column in key_columns))
+    )
+    return db.execute(
+        delete(model)
+        .where(model.company_id == target_id, model.is_deleted == False, model.id.notin_(keep))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def _repoint(db: Session, model, source_ids: List[int], target_id: int, login_id: int) -> int:
+    return db.execute(
+        update(model)
+        .where(model.company_id.in_(source_ids))
+        .values(company_id=target_id, updated_by=login_id)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def merge_companies(db: Session, target_id: int, source_ids: List[int], login_id: int) -> Dict[str, Any]:
+    """
+    Fold the source companies into the target in one transaction.
+    Contacts, addresses, yearly figures, documents and child companies are re-pointed
+    with one UPDATE per table, duplicate child rows are deleted (as child_sync does for
+    rows dropped from a collection), the sources are soft-deleted and the target's
+    updated_at moves on, which versions its ETag. The statement count is fixed; it does
+    not grow with the number of rows moved.
+    """
+    source_ids = list(dict.fromkeys(source_ids))
+    try:
+        _validate(db, target_id, source_ids)
+        territories_before = geo_rollup_service.snapshot(db, "company", [target_id, *source_ids])
+        summary: Dict[str, Any] = {"target_id": target_id, "source_ids": source_ids}
+
+        summary["contacts_moved"] = db.execute(
+            update(Contact)
+            .where(Contact.company_id.in_(source_ids))
+            .values(company_id=target_id, updated_by=login_id)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+        for name, model in YEARLY_MODELS.items():
+            target_years = select(model.year).where(model.company_id == target_id, model.is_deleted == False)
+            superseded = db.execute(
+                delete(model)
+                .where(model.company_id.in_(source_ids), model.is_deleted == False, model.year.in_(target_years))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            moved = _repoint(db, model, source_ids, target_id, login_id)
+            duplicates = superseded + _delete_duplicates(db, model, target_id, ("year",))
+            summary[f"{name}_moved"] = moved
+            summary[f"{name}_duplicates_removed"] = duplicates
+
+        for name, (model, key_columns) in DUPLICATE_KEYS.items():
+            summary[f"{name}_moved"] = _repoint(db, model, source_ids, target_id, login_id)
+            summary[f"{name}_duplicates_removed"] = _delete_duplicates(db, model, target_id, key_columns)
+
+        # Subsidiaries of the sources move under the target, closure table first
+        child_ids = list(db.scalars(
+            select(Company.id).where(Company.parent_company_id.in_(source_ids), Company.id.notin_(source_ids))
+        ))
+        if child_ids:
+            company_hierarchy_service.move_subtrees(db, child_ids, target_id)
+            db.execute(
+                update(Company)
+                .where(Company.id.in_(child_ids))
+                .values(parent_company_id=target_id, is_child=True, updated_by=login_id)
+                .execution_options(synchronize_session=False)
+            )
+        summary["child_companies_moved"] = len(child_ids)
+
+        db.execute(
+            delete(CompanyHierarchy)
+            .where(or_(CompanyHierarchy.ancestor_id.in_(source_ids), CompanyHierarchy.descendant_id.in_(source_ids)))
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            update(Company)
+            .where(Company.id.in_(source_ids))
+            .values(is_deleted=True, updated_by=login_id)
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            update(Company)
+            .where(Company.id == target_id)
+            .values(updated_at=datetime.utcnow(), updated_by=login_id)
+            .execution_options(synchronize_session=False)
+        )
+        company_dedup_service.remove_companies(db, source_ids)
+        company_search_service.index_companies(db, [target_id])
+        company_financials_service.refresh_companies(db, [target_id, *source_ids])
+        company_scoring_service.mark_stale_with_ancestors(db, [target_id])
+        geo_rollup_service.apply_change(db, "company", territories_before)
+
+        db.commit()
+        company_typeahead_service.invalidate()
+        company_facet_service.invalidate()
+        return summary
+
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Error merging companies: {str(e)}"
+        )
@@ -0,0 +1,198 @@
+import json
+import numpy as np
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, func, bindparam
+from typing import Dict, Iterable, List
+from app.models.sales.company import Company
+from app.models.sales.company_financials import CompanyFinancialSummary
+from app.models.sales.company_hierarchy import CompanyHierarchy
+from app.models.sales.contact import Contact
+from app.utils.env import env_get
+
+# Every feature is mapped onto 0..1 with fixed bounds (never min/max of the current
+# book), so scoring a subset of companies gives the same numbers as a full run.
+FEATURE_WEIGHTS = {
+    "turnover_growth": 25.0,
+    "profit_margin": 20.0,
+    "industry_segment": 10.0,
+    "account_type": 10.0,
+    "business_type": 10.0,
+    "contact_coverage": 15.0,
+    "hierarchy_size": 10.0,
+}
+GROWTH_RANGE = (-0.5, 1.0)   # -50% .. +100% year on year
+MARGIN_RANGE = (-0.2, 0.3)   # -20% .. +30%
+CONTACT_SATURATION = 3.0     # 1 - exp(-contacts / 3): 1 contact ~0.28, 5 ~0.81
+HIERARCHY_SATURATION = 50    # log1p(subsidiaries) / log1p(50)
+
+# Per-id preference (0..1) for categorical masters; unlisted ids score CATEGORY_DEFAULT,
+# companies with no value score 0. Master ids differ per deployment, so none are listed
+# by default: out of the box these three features only reward having the field filled in.
+# Set COMPANY_SCORE_CATEGORY_WEIGHTS to a JSON object to rank values, e.g.
+#   {"account_type_id": {"3": 1.0, "4": 0.2}, "industry_segment_id": {"12": 0.9}}
+CATEGORY_DEFAULT = 0.5
+
+
+def _load_category_weights(raw: str) -> Dict[str, Dict[int, float]]:
+    weights: Dict[str, Dict[int, float]] = {"industry_segment_id": {}, "account_type_id": {}, "business_type_id": {}}
+    for column, preferences in json.loads(raw or "{}").items():
+        if column not in weights:
+            raise ValueError(f"COMPANY_SCORE_CATEGORY_WEIGHTS: unknown column '{column}'")
+        for master_id, weight in preferences.items():
+            if not 0.0 <= float(weight) <= 1.0:
+                raise ValueError(f"COMPANY_SCORE_CATEGORY_WEIGHTS: {column}[{master_id}] must be between 0 and 1")
+            weights[column][int(master_id)] = float(weight)
+    return weights
+
+
+CATEGORY_WEIGHTS = _load_category_weights(env_get("COMPANY_SCORE_CATEGORY_WEIGHTS"))
+
+SCORING_BATCH_SIZE = 5000
+
+
+# ---------------- Staleness ----------------
+# Scores are derived data: keeping updated_at as it is stops these writes from firing its
+# onupdate, which would change the company ETag and fail a concurrent If-Match edit.
+def mark_stale(db: Session, company_ids: Iterable[int]) -> None:
+    """Flag companies for the next incremental run."""
+    ids = list(company_ids)
+    if ids:
+        db.execute(
+            update(Company).where(Company.id.in_(ids)).values(score_stale=True, updated_at=Company.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def mark_stale_with_ancestors(db: Session, company_ids: Iterable[int]) -> None:
+    """Flag companies and every ancestor, whose hierarchy size depends on them."""
+    ids = list(company_ids)
+    if ids:
+        db.execute(
+            update(Company)
+            .where(Company.id.in_(
+                select(CompanyHierarchy.ancestor_id).where(CompanyHierarchy.descendant_id.in_(ids))
+            ))
+            .values(score_stale=True, updated_at=Company.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+
+
+# ---------------- Feature scaling ----------------
+def _scale(values: np.ndarray, low: float, high: float) -> np.ndarray:
+    """Clip to [low, high] and map onto 0..1; NaN (unknown) scores 0."""
+    scaled = (np.clip(values, low, high) - low) / (high - low)
+    return np.nan_to_num(scaled, nan=0.0)
+
+
+def _categorical(ids: np.ndarray, weights: Dict[int, float]) -> np.ndarray:
+    """Vectorised lookup: 0 for missing (-1), configured weight, else CATEGORY_DEFAULT."""
+    scores = np.where(ids >= 0, CATEGORY_DEFAULT, 0.0)
+    if weights:
+        keys = np.fromiter(weights.keys(), dtype=np.int64)
+        values = np.fromiter(weights.values(), dtype=np.float64)
+        order = np.argsort(keys)
+        keys, values = keys[order], values[order]
+        positions = np.clip(np.searchsorted(keys, ids), 0, len(keys) - 1)
+        known = keys[positions] == ids
+        scores = np.where(known, values[positions], scores)
+    return scores
+
+
+def compute_scores(features: Dict[str, np.ndarray]) -> np.ndarray:
+    """Weighted 0..100 score per row from raw feature columns (all arrays of equal length)."""
+    parts = {
+        "turnover_growth": _scale(features["yoy_growth"], *GROWTH_RANGE),
+        "profit_margin": _scale(features["profit_margin"], *MARGIN_RANGE),
+        "industry_segment": _categorical(features["industry_segment_id"], CATEGORY_WEIGHTS["industry_segment_id"]),
+        "account_type": _categorical(features["account_type_id"], CATEGORY_WEIGHTS["account_type_id"]),
+        "business_type": _categorical(features["business_type_id"], CATEGORY_WEIGHTS["business_type_id"]),
+        "contact_coverage": 1.0 - np.exp(-features["contact_count"] / CONTACT_SATURATION),
+        "hierarchy_size": np.minimum(np.log1p(features["subsidiary_count"]) / np.log1p(HIERARCHY_SATURATION), 1.0),
+    }
+    total = sum(FEATURE_WEIGHTS[name] * values for name, values in parts.items())
+    return np.round(total, 2)
+
+
+# ---------------- Bulk load ----------------
+def _load_features(db: Session, ids: List[int]) -> Dict[str, np.ndarray]:
+    """Three column-projected SELECTs for a batch, turned into aligned NumPy arrays."""
+    rows = db.execute(
+        select(
+            Company.id, Company.industry_segment_id, Company.account_type_id, Company.business_type_id,
+            CompanyFinancialSummary.yoy_growth, CompanyFinancialSummary.profit_margin
+        )
+        .outerjoin(CompanyFinancialSummary, CompanyFinancialSummary.company_id == Company.id)
+        .where(Company.id.in_(ids))
+        .order_by(Company.id)
+    ).all()
+    columns = list(zip(*rows)) if rows else [()] * 6
+    position = {company_id: i for i, company_id in enumerate(columns[0])}
+    size = len(rows)
+
+    def categorical(values) -> np.ndarray:
+        return np.array([-1 if v is None else v for v in values], dtype=np.int64)
+
+    def numeric(values) -> np.ndarray:
+        return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+
+    contact_count = np.zeros(size)
+    for company_id, count in db.execute(
+        select(Contact.company_id, func.count())
+        .where(Contact.company_id.in_(ids), Contact.is_deleted == False)
+        .group_by(Contact.company_id)
+    ):
+        contact_count[position[company_id]] = count
+
+    subsidiary_count = np.zeros(size)
+    for company_id, count in db.execute(
+        select(CompanyHierarchy.ancestor_id, func.count())
+        .join(Company, Company.id == CompanyHierarchy.descendant_id)
+        .where(CompanyHierarchy.ancestor_id.in_(ids), CompanyHierarchy.depth > 0, Company.is_deleted == False)
+        .group_by(CompanyHierarchy.ancestor_id)
+    ):
+        subsidiary_count[position[company_id]] = count
+
+    return {
+        "id": np.array(columns[0], dtype=np.int64),
+        "industry_segment_id": categorical(columns[1]),
+        "account_type_id": categorical(columns[2]),
+        "business_type_id": categorical(columns[3]),
+        "yoy_growth": numeric(columns[4]),
+        "profit_margin": numeric(columns[5]),
+        "contact_count": contact_count,
+        "subsidiary_count": subsidiary_count,
+    }
+
+
+def recompute_scores(db: Session, full: bool = False) -> int:
+    """
+    Score stale companies (or every company with `full`) in batches of SCORING_BATCH_SIZE:
+    three SELECTs and one executemany UPDATE per batch. Commits per batch; returns the
+    number of companies scored.
+    """
+    scored, last_id = 0, 0
+    while True:
+        query = select(Company.id).where(Company.id > last_id, Company.is_deleted == False)
+        if not full:
+            query = query.where(Company.score_stale == True)
+        ids = list(db.scalars(query.order_by(Company.id).limit(SCORING_BATCH_SIZE)))
+        if not ids:
+            return scored
+
+        features = _load_features(db, ids)
+        scores = compute_scores(features)
+        now = datetime.utcnow()
+        table = Company.__table__
+        db.execute(
+            update(table)
+            .where(table.c.id == bindparam("company_id"))
+            .values(account_score=bindparam("score"), score_stale=False, scored_at=now, updated_at=table.c.updated_at),
+            [
+                {"company_id": int(company_id), "score": float(score)}
+                for company_id, score in zip(features["id"], scores)
+            ]
+        )
+        db.commit()
+        scored += len(ids)
+        last_id = ids[-1]
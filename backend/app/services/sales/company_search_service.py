@@ -0,0 +1,175 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, delete, func, text, literal_column, case
+from typing import Optional, List, Dict, Any, Iterable
+from collections import defaultdict
+from app.models.sales.company import Company, CompanyAddress
+from app.models.sales.company_search import CompanySearchDocument, PG_SEARCH_VECTOR, SQLITE_FTS_TABLE
+from app.models.masters.master_cities import MasterCities
+from app.utils.prefix_index import normalize, word_spans
+
+# Fields returned with every hit and scanned for highlight offsets
+HIGHLIGHT_FIELDS = ("company_name", "gst_no", "pan_no", "website", "company_profile")
+REINDEX_BATCH_SIZE = 1000
+
+
+# ---------------- Indexing ----------------
+def index_companies(db: Session, company_ids: Iterable[int]) -> int:
+    """
+    (Re)build the search documents for the given companies: one SELECT for the
+    companies, one for their address cities, then a delete + executemany insert.
+    Text is stored pre-normalised (`www.tata.com` -> `www tata com`) so every engine
+    tokenises GST/PAN/website the same way and prefix queries work on each part.
+    """
+    ids = list(company_ids)
+    if not ids:
+        return 0
+
+    companies = db.execute(
+        select(Company.id, Company.company_name, Company.gst_no, Company.pan_no, Company.website, Company.company_profile)
+        .where(Company.id.in_(ids))
+    ).all()
+
+    cities: Dict[int, List[str]] = defaultdict(list)
+    for company_id, city in db.execute(
+        select(CompanyAddress.company_id, MasterCities.name)
+        .join(MasterCities, MasterCities.id == CompanyAddress.city_id)
+        .where(CompanyAddress.company_id.in_(ids), CompanyAddress.is_deleted == False)
+        .distinct()
+    ):
+        cities[company_id].append(city)
+
+    db.execute(
+        delete(CompanySearchDocument).where(CompanySearchDocument.company_id.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    rows = [
+        {
+            "company_id": c.id,
+            "search_title": normalize(c.company_name),
+            "search_body": normalize(" ".join(filter(None, (
+                c.gst_no, c.pan_no, c.website, *cities.get(c.id, []), c.company_profile
+            )))),
+        }
+        for c in companies
+    ]
+    if rows:
+        db.execute(insert(CompanySearchDocument), rows)
+    return len(rows)
+
+
+def reindex_all(db: Session) -> int:
+    """Rebuild every search document in batches; returns the number indexed."""
+    total, last_id = 0, 0
+    while True:
+        ids = list(db.scalars(
+            select(Company.id).where(Company.id > last_id).order_by(Company.id).limit(REINDEX_BATCH_SIZE)
+        ))
+        if not ids:
+            return total
+        total += index_companies(db, ids)
+        last_id = ids[-1]
+
+
+# ---------------- Search ----------------
+def _terms(q: str) -> List[str]:
+    return normalize(q).split()
+
+
+def _match_postgresql(db: Session, terms: List[str], skip: int, limit: int):
+    # Every term as a prefix: `tata:* & mot:*`. Terms are \w+ only, so no escaping needed.
+    tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+    vector = literal_column(f"({PG_SEARCH_VECTOR})")
+    rank = func.ts_rank_cd(vector, tsquery)
+    return db.execute(
+        select(CompanySearchDocument.company_id, rank.label("score"), func.count().over().label("total"))
+        .join(Company, Company.id == CompanySearchDocument.company_id)
+        .where(vector.op("@@")(tsquery), Company.is_deleted == False)
+        .order_by(rank.desc(), CompanySearchDocument.company_id)
+        .offset(skip).limit(limit)
+    ).all()
+
+
+def _match_sqlite(db: Session, terms: List[str], skip: int, limit: int):
+    # bm25() is lower-is-better; negate so callers always sort score descending
+    return db.execute(
+        text(
+            "SELECT m.company_id, m.score, COUNT(*) OVER () AS total FROM ("
+            f"SELECT rowid AS company_id, -bm25({SQLITE_FTS_TABLE}, 10.0, 1.0) AS score "
+            f"FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH :match"
+            ") m JOIN tbl_companies c ON c.id = m.company_id WHERE c.is_deleted = 0 "
+            "ORDER BY m.score DESC, m.company_id LIMIT :limit OFFSET :skip"
+        ),
+        {"match": " ".join(f'"{term}"*' for term in terms), "limit": limit, "skip": skip}
+    ).all()
+
+
+def _match_fallback(db: Session, terms: List[str], skip: int, limit: int):
+    # Other dialects: unindexed LIKE over the normalised documents, title hits first
+    doc = CompanySearchDocument
+    haystack = " " + doc.search_title + " " + func.coalesce(doc.search_body, "")
+    title_hit = case(((" " + doc.search_title).like(f"% {terms[0]}%"), 1), else_=0)
+    return db.execute(
+        select(doc.company_id, title_hit.label("score"), func.count().over().label("total"))
+        .join(Company, Company.id == doc.company_id)
+        .where(*(haystack.like(f"% {term}%") for term in terms), Company.is_deleted == False)
+        .order_by(title_hit.desc(), doc.company_id)
+        .offset(skip).limit(limit)
+    ).all()
+
+
+def highlight_offsets(value: Optional[str], terms: List[str]) -> List[List[int]]:
+    """`[start, end]` spans in `value` where a word starts with one of the terms."""
+    if not value:
+        return []
+    spans = []
+    folded = value.casefold()
+    for start, end in word_spans(folded):
+        term = next((t for t in terms if folded.startswith(t, start, end)), None)
+        if term:
+            spans.append([start, start + len(term)])
+    return spans
+
+
+def search_companies(db: Session, q: str, skip: int = 0, limit: int = 10) -> Dict[str, Any]:
+    """
+    Relevance-ranked company search. Every term must match the start of a word in the
+    company's name, GST, PAN, website, address cities or profile.
+    Postgres: GIN-indexed tsvector + ts_rank_cd. SQLite: FTS5 + bm25. Others: LIKE.
+    """
+    terms = _terms(q)
+    if not terms:
+        return {"results": [], "total": 0, "page": 1, "limit": limit}
+
+    dialect = db.get_bind().dialect.name
+    matcher = {"postgresql": _match_postgresql, "sqlite": _match_sqlite}.get(dialect, _match_fallback)
+    hits = matcher(db, terms, skip, limit)
+
+    companies = {}
+    if hits:
+        companies = {
+            row.id: row for row in db.execute(
+                select(Company.id, *(getattr(Company, f) for f in HIGHLIGHT_FIELDS))
+                .where(Company.id.in_([hit.company_id for hit in hits]))
+            )
+        }
+
+    results = []
+    for hit in hits:
+        company = companies[hit.company_id]
+        item = {"id": hit.company_id, "score": float(hit.score or 0)}
+        highlights = {}
+        for field in HIGHLIGHT_FIELDS:
+            value = getattr(company, field)
+            item[field] = value
+            spans = highlight_offsets(value, terms)
+            if spans:
+                highlights[field] = spans
+        item["highlights"] = highlights
+        results.append(item)
+
+    return {
+        "results": results,
+        "total": hits[0].total if hits else 0,
+        "page": (skip // limit) + 1,
+        "limit": limit
+    }
@@ -1,17 +1,36 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import Optional, List
+from sqlalchemy import or_, insert, select
+from typing import Optional, List, Dict, Any
+from datetime import datetime
 from app.models.sales.company import Company, CompanyAddress, CompanyTurnover, CompanyProfit, CompanyDocument
 from app.schemas.sales.company import (
     CompanyCreate, CompanyUpdate, CompanyResponse, CompanyListResponse,
-    CompanyAddressCreate, CompanyTurnoverCreate, CompanyProfitCreate, CompanyDocumentCreate
+    CompanyAddressCreate, CompanyTurnoverCreate, CompanyProfitCreate, CompanyDocumentCreate,
+    CompanyBulkCreateResponse, CompanyBulkItemResult, CompanyFilters
 )
 from fastapi import HTTPException, status
+from app.utils.projection import project_rows, attach_children
+from app.utils.child_sync import sync_children
+from app.utils import etag as ETag
+from app.services.sales import (
+    company_hierarchy_service, company_typeahead_service, company_search_service, company_dedup_service,
+    company_financials_service, company_scoring_service, company_facet_service, geo_rollup_service
+)
+
+# Child collections that can be requested with `include=` on list endpoints
+COMPANY_CHILDREN = {
+    "addresses": (CompanyAddress, "company_id"),
+    "turnover_records": (CompanyTurnover, "company_id"),
+    "profit_records": (CompanyProfit, "company_id"),
+    "documents": (CompanyDocument, "company_id"),
+}
 
 
 def create_company(db: Session, company_data: CompanyCreate, created_by: int) -> CompanyResponse:
     """Create a new company with related data"""
     try:
+        company_dedup_service.ensure_unique(db, company_data.gst_no, company_data.pan_no)
+
         # Create main company record
         company = Company(
             gst_no=company_data.gst_no,
@@ -31,6 +50,8 @@ def create_company(db: Session, company_data: CompanyCreate, created_by: int) ->
         
         db.add(company)
         db.flush()  # Get the company ID
+        company_hierarchy_service.add_companies(db, [company.id])
+        company_scoring_service.mark_stale_with_ancestors(db, [company.id])
         
         # Add addresses
         for addr_data in company_data.addresses:
@@ -81,11 +102,21 @@ def create_company(db: Session, company_data: CompanyCreate, created_by: int) ->
             )
             db.add(document)
         
+        db.flush()
+        company_search_service.index_companies(db, [company.id])
+        company_dedup_service.index_companies(db, [company.id])
+        company_financials_service.refresh_companies(db, [company.id])
+        geo_rollup_service.add_entities(db, "company", [company.id])
         db.commit()
+        company_typeahead_service.invalidate()
+        company_facet_service.invalidate()
         db.refresh(company)
         
         return CompanyResponse.from_orm(company)
     
+    except HTTPException:
+        db.rollback()
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -94,14 +125,149 @@ def create_company(db: Session, company_data: CompanyCreate, created_by: int) ->
         )
 
 
+def _validate_bulk_item(
+    company_data: CompanyCreate,
+    existing_parent_ids: set,
+    taken_keys: Dict[tuple, int],
+    seen_keys: set
+) -> Optional[str]:
+    """Return an error message for a bulk item that cannot be inserted, else None"""
+    if company_data.parent_company_id is not None and company_data.parent_company_id not in existing_parent_ids:
+        return f"Parent company {company_data.parent_company_id} not found"
+    keys = company_dedup_service.unique_keys(company_data.gst_no, company_data.pan_no)
+    for key_type, key_value in keys:
+        if (key_type, key_value) in taken_keys:
+            return f"{key_type.upper()} '{key_value}' already exists on company {taken_keys[(key_type, key_value)]}"
+    # Same normalised keys as the database check, so `27-ABCDE-...` repeats `27ABCDE...`
+    for key_type, key_value in keys:
+        if (key_type, key_value) in seen_keys:
+            return f"Duplicate {key_type.upper()} number {key_value} within the batch"
+    seen_keys.update(keys)
+    return None
+
+
+def bulk_create_companies(
+    db: Session,
+    companies: List[CompanyCreate],
+    created_by: int
+) -> CompanyBulkCreateResponse:
+    """
+    Create many companies in one transaction.
+    Parents go in as a single multi-row INSERT ... RETURNING and each child table as one
+    executemany, so round-trips do not grow with the batch size. Items failing validation
+    are reported per index and skipped; a database error rolls back the whole batch.
+    """
+    parent_ids = {c.parent_company_id for c in companies if c.parent_company_id is not None}
+    existing_parent_ids = set()
+    if parent_ids:
+        existing_parent_ids = set(db.scalars(
+            select(Company.id).where(Company.id.in_(parent_ids), Company.is_deleted == False)
+        ))
+
+    taken_keys = company_dedup_service.taken_unique_keys(db, ((c.gst_no, c.pan_no) for c in companies))
+
+    results: List[Optional[CompanyBulkItemResult]] = [None] * len(companies)
+    accepted: List[int] = []
+    seen_keys = set()
+    for index, company_data in enumerate(companies):
+        error = _validate_bulk_item(company_data, existing_parent_ids, taken_keys, seen_keys)
+        if error:
+            results[index] = CompanyBulkItemResult(index=index, status="failed", error=error)
+        else:
+            accepted.append(index)
+
+    try:
+        if accepted:
+            child_fields = {"addresses", "turnover_records", "profit_records", "documents"}
+            company_rows = [
+                {**companies[i].dict(exclude=child_fields), "created_by": created_by}
+                for i in accepted
+            ]
+            # render_nulls keeps every row on the same column set, so the ORM does not
+            # split the batch into one statement per distinct combination of NULLs
+            new_ids = db.scalars(
+                insert(Company).returning(Company.id, sort_by_parameter_order=True),
+                company_rows,
+                execution_options={"render_nulls": True}
+            ).all()
+            company_hierarchy_service.add_companies(db, new_ids)
+            company_scoring_service.mark_stale_with_ancestors(db, new_ids)
+
+            child_rows: Dict[Any, List[Dict[str, Any]]] = {
+                CompanyAddress: [], CompanyTurnover: [], CompanyProfit: [], CompanyDocument: []
+            }
+            for index, company_id in zip(accepted, new_ids):
+                company_data = companies[index]
+                for model, items in (
+                    (CompanyAddress, company_data.addresses),
+                    (CompanyTurnover, company_data.turnover_records),
+                    (CompanyProfit, company_data.profit_records),
+                    (CompanyDocument, company_data.documents),
+                ):
+                    child_rows[model].extend(
+                        {**item.dict(), "company_id": company_id, "created_by": created_by}
+                        for item in items or []
+                    )
+                results[index] = CompanyBulkItemResult(index=index, status="created", id=company_id)
+
+            for model, rows in child_rows.items():
+                if rows:
+                    db.execute(insert(model), rows, execution_options={"render_nulls": True})
+            company_search_service.index_companies(db, new_ids)
+            company_dedup_service.index_companies(db, new_ids)
+            company_financials_service.refresh_companies(db, new_ids)
+            geo_rollup_service.add_entities(db, "company", new_ids)
+
+        db.commit()
+        company_typeahead_service.invalidate()
+        company_facet_service.invalidate()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Error creating companies: {str(e)}"
+        )
+
+    return CompanyBulkCreateResponse(
+        created=len(accepted),
+        failed=len(companies) - len(accepted),
+        results=results
+    )
+
+
+COMPANY_SORTS = {
+    "id": (Company.id.asc(),),
+    "-id": (Company.id.desc(),),
+    "company_name": (Company.company_name.asc(), Company.id.asc()),
+    "-company_name": (Company.company_name.desc(), Company.id.asc()),
+    "account_score": (Company.account_score.asc().nulls_last(), Company.id.asc()),
+    "-account_score": (Company.account_score.desc().nulls_last(), Company.id.asc()),
+}
+
+
 def get_companies(
     db: Session, 
     skip: int = 0, 
     limit: int = 10, 
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
+    sort: Optional[str] = None,
+    filters: Optional[CompanyFilters] = None
 ) -> CompanyListResponse:
-    """Get list of companies with pagination and search"""
-    query = db.query(Company).filter(Company.is_deleted == False)
+    """
+    Get list of companies with pagination and search.
+    When `fields` or `include` is given the page is fetched as a column-projected
+    SELECT and returned as plain dicts instead of full CompanyResponse objects.
+    `sort` is one of COMPANY_SORTS, e.g. "-account_score" for the best scored first.
+    `filters` narrows the list the same way it narrows the facet counts.
+    """
+    if sort and sort not in COMPANY_SORTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"sort must be one of: {', '.join(COMPANY_SORTS)}"
+        )
+    query = db.query(Company).filter(Company.is_deleted == False, *company_facet_service.filter_conditions(filters))
     
     if search:
         query = query.filter(
@@ -113,7 +279,19 @@ def get_companies(
         )
     
     total = query.count()
-    companies = query.offset(skip).limit(limit).all()
+    order_by = COMPANY_SORTS[sort] if sort else (Company.id.asc(),)
+    page_query = query.order_by(*order_by).offset(skip).limit(limit)
+
+    if fields or include:
+        rows = project_rows(page_query, Company, fields)
+        return {
+            "companies": attach_children(db, rows, COMPANY_CHILDREN, include),
+            "total": total,
+            "page": (skip // limit) + 1,
+            "limit": limit
+        }
+
+    companies = page_query.all()
     
     return CompanyListResponse(
         companies=[CompanyResponse.from_orm(company) for company in companies],
@@ -123,6 +301,21 @@ def get_companies(
     )
 
 
+def company_etag(company_id: int, updated_at: Optional[datetime]) -> str:
+    # updated_at only moves on edits to the company or its children: update_company,
+    # bulk actions, merges and document uploads. Derived writes (score, staleness) pin
+    # it, so they never invalidate a client's ETag.
+    return ETag.version_etag("company", company_id, updated_at)
+
+
+def get_company_etag(db: Session, company_id: int) -> Optional[str]:
+    """Current ETag from a single-column read; None when the company does not exist."""
+    row = db.execute(
+        select(Company.updated_at).where(Company.id == company_id, Company.is_deleted == False)
+    ).first()
+    return company_etag(company_id, row.updated_at) if row else None
+
+
 def get_company_by_id(db: Session, company_id: int) -> Optional[CompanyResponse]:
     """Get company by ID"""
     company = db.query(Company).filter(
@@ -139,86 +332,65 @@ def update_company(
     db: Session, 
     company_id: int, 
     company_data: CompanyUpdate, 
-    updated_by: int
+    updated_by: int,
+    if_match: Optional[str] = None
 ) -> Optional[CompanyResponse]:
-    """Update company and related data"""
+    """Update company and related data. `if_match` (an ETag) makes the update conditional: 412 if stale."""
     try:
-        company = db.query(Company).filter(
+        query = db.query(Company).filter(
             Company.id == company_id,
             Company.is_deleted == False
-        ).first()
+        )
+        if if_match is not None:
+            # Hold the row until commit so nobody can slip in between the check and the write
+            query = query.with_for_update().populate_existing()
+        company = query.first()
         
         if not company:
             return None
+        ETag.require_match(if_match, company_etag(company.id, company.updated_at), "Company")
         
+        changes = company_data.dict(exclude_unset=True)
+        if "gst_no" in changes or "pan_no" in changes:
+            company_dedup_service.ensure_unique(
+                db, changes.get("gst_no", company.gst_no), changes.get("pan_no", company.pan_no), exclude_id=company.id
+            )
+
+        # Re-link the subtree in the closure table before the parent pointer changes;
+        # both the old and the new ancestor chains need re-scoring
+        if "parent_company_id" in changes and changes["parent_company_id"] != company.parent_company_id:
+            company_scoring_service.mark_stale_with_ancestors(db, [company.id])
+            company_hierarchy_service.move_subtrees(db, [company.id], changes["parent_company_id"])
+        company_scoring_service.mark_stale_with_ancestors(db, [company.id])
+        territories_before = geo_rollup_service.snapshot(db, "company", [company.id])
+
         # Update main company fields
         for field, value in company_data.dict(exclude_unset=True, exclude={'addresses', 'turnover_records', 'profit_records', 'documents'}).items():
             setattr(company, field, value)
         company.updated_by = updated_by
+        company.updated_at = datetime.utcnow()  # also when only child rows change
         
-        # Update addresses (simple approach: delete and recreate)
-        if company_data.addresses is not None:
-            # Delete existing addresses
-            db.query(CompanyAddress).filter(CompanyAddress.company_id == company_id).delete()
-            
-            # Add new addresses
-            for addr_data in company_data.addresses:
-                address = CompanyAddress(
-                    company_id=company.id,
-                    address_type_id=addr_data.address_type_id,
-                    address=addr_data.address,
-                    country_id=addr_data.country_id,
-                    state_id=addr_data.state_id,
-                    city_id=addr_data.city_id,
-                    zip_code=addr_data.zip_code,
-                    created_by=updated_by
-                )
-                db.add(address)
-        
-        # Similar updates for turnover, profit, and documents
-        if company_data.turnover_records is not None:
-            db.query(CompanyTurnover).filter(CompanyTurnover.company_id == company_id).delete()
-            for turnover_data in company_data.turnover_records:
-                turnover = CompanyTurnover(
-                    company_id=company.id,
-                    year=turnover_data.year,
-                    revenue=turnover_data.revenue,
-                    currency_id=turnover_data.currency_id,
-                    created_by=updated_by
-                )
-                db.add(turnover)
-        
-        if company_data.profit_records is not None:
-            db.query(CompanyProfit).filter(CompanyProfit.company_id == company_id).delete()
-            for profit_data in company_data.profit_records:
-                profit = CompanyProfit(
-                    company_id=company.id,
-                    year=profit_data.year,
-                    revenue=profit_data.revenue,
-                    currency_id=profit_data.currency_id,
-                    created_by=updated_by
-                )
-                db.add(profit)
-        
-        if company_data.documents is not None:
-            db.query(CompanyDocument).filter(CompanyDocument.company_id == company_id).delete()
-            for doc_data in company_data.documents:
-                document = CompanyDocument(
-                    company_id=company.id,
-                    document_type_id=doc_data.document_type_id,
-                    file_name=doc_data.file_name,
-                    file_path=doc_data.file_path,
-                    file_size=doc_data.file_size,
-                    description=doc_data.description,
-                    created_by=updated_by
-                )
-                db.add(document)
+        # Reconcile child collections by id (omitted lists are left untouched)
+        sync_children(db, CompanyAddress, "company_id", company.id, company_data.addresses, updated_by)
+        sync_children(db, CompanyTurnover, "company_id", company.id, company_data.turnover_records, updated_by)
+        sync_children(db, CompanyProfit, "company_id", company.id, company_data.profit_records, updated_by)
+        sync_children(db, CompanyDocument, "company_id", company.id, company_data.documents, updated_by)
         
+        db.flush()
+        company_search_service.index_companies(db, [company.id])
+        company_dedup_service.index_companies(db, [company.id])
+        company_financials_service.refresh_companies(db, [company.id])
+        geo_rollup_service.apply_change(db, "company", territories_before)
         db.commit()
+        company_typeahead_service.invalidate()
+        company_facet_service.invalidate()
         db.refresh(company)
         
         return CompanyResponse.from_orm(company)
     
+    except HTTPException:
+        db.rollback()
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -227,26 +399,32 @@ def update_company(
         )
 
 
-def delete_company(db: Session, company_id: int) -> bool:
-    """Soft delete company"""
-    company = db.query(Company).filter(
+def delete_company(db: Session, company_id: int, if_match: Optional[str] = None) -> bool:
+    """Soft delete company; with `if_match` only if it is unchanged since that ETag (412 otherwise)"""
+    query = db.query(Company).filter(
         Company.id == company_id,
         Company.is_deleted == False
-    ).first()
+    )
+    if if_match is not None:
+        query = query.with_for_update().populate_existing()
+    company = query.first()
     
     if not company:
         return False
+    ETag.require_match(if_match, company_etag(company.id, company.updated_at), "Company")
     
     company.is_deleted = True
+    company_dedup_service.remove_companies(db, [company.id])
+    company_scoring_service.mark_stale_with_ancestors(db, [company.id])
+    db.flush()
+    company_financials_service.refresh_companies(db, [company.id])
+    geo_rollup_service.remove_entities(db, "company", [company.id])
     db.commit()
+    company_typeahead_service.invalidate()
+    company_facet_service.invalidate()
     return True
 
 
 def get_parent_companies(db: Session) -> List[dict]:
-    """Get list of companies that can be parent companies"""
-    companies = db.query(Company).filter(
-        Company.is_deleted == False,
-        Company.is_active == True
-    ).all()
-    
-    return [{"id": company.id, "name": company.company_name} for company in companies]
\ No newline at end of file
+    """Get list of companies that can be parent companies (served from the typeahead index)"""
+    return company_typeahead_service.list_companies()
\ No newline at end of file
@@ -0,0 +1,60 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+from typing import Optional, List, Iterable
+from app.database.db import SessionLocal
+from app.models.sales.company import Company
+from app.services.sales import company_hierarchy_service
+from app.utils.env import env_get
+from app.utils.prefix_index import PrefixIndex
+
+# Local writes invalidate immediately; the TTL bounds staleness from other workers
+COMPANY_TYPEAHEAD_TTL = int(env_get("COMPANY_TYPEAHEAD_TTL") or 300)
+
+
+def _load_companies():
+    """Selectable companies as `(id, name)`; one projected SELECT, no ORM hydration."""
+    db = SessionLocal()
+    try:
+        return db.execute(
+            select(Company.id, Company.company_name).where(
+                Company.is_deleted == False,
+                Company.is_active == True
+            )
+        ).all()
+    finally:
+        db.close()
+
+
+company_index = PrefixIndex(_load_companies, ttl=COMPANY_TYPEAHEAD_TTL)
+
+
+def invalidate() -> None:
+    """Drop the index after a company is created, renamed, (de)activated or deleted."""
+    company_index.invalidate()
+
+
+def search_companies(
+    db: Session,
+    q: str,
+    limit: int = 10,
+    exclude_ids: Optional[Iterable[int]] = None,
+    exclude_descendants_of: Optional[int] = None
+) -> List[dict]:
+    """
+    Prefix typeahead over company names.
+    `exclude_descendants_of` drops that company and its whole subtree, which is what a
+    parent-company picker needs to avoid offering a cycle.
+    """
+    excluded = set(exclude_ids or [])
+    if exclude_descendants_of is not None:
+        excluded.update(company_hierarchy_service.get_subtree_ids(db, [exclude_descendants_of]))
+
+    return [
+        {"id": company_id, "name": name}
+        for company_id, name in company_index.search(q, limit, excluded)
+    ]
+
+
+def list_companies() -> List[dict]:
+    """Every selectable company ordered by name, served from the index."""
+    return [{"id": company_id, "name": name} for company_id, name in company_index.all()]
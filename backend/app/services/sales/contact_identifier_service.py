@@ -0,0 +1,200 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, delete, tuple_
+from typing import Optional, List, Dict, Any, Iterable, Set, Tuple
+from collections import defaultdict
+from fastapi import HTTPException, status
+from app.models.sales.company import Company
+from app.models.sales.contact import Contact
+from app.models.sales.contact_identifier import ContactIdentifier
+from app.utils.env import env_get
+
+# National numbers (no "+" / "00" prefix) are assumed to be from this country
+DEFAULT_COUNTRY_CODE = env_get("DEFAULT_PHONE_COUNTRY_CODE") or "91"
+NATIONAL_NUMBER_LENGTH = 10
+# E.164 allows at most 15 digits; anything much shorter is an extension or a typo
+PHONE_DIGITS_RANGE = (8, 15)
+REINDEX_BATCH_SIZE = 1000
+
+PHONE_FIELDS = ("primary_no", "secondary_no", "alternate_no")
+
+
+# ---------------- Normalisation ----------------
+def normalize_email(value: Optional[str]) -> Optional[str]:
+    """Trimmed, lower-cased address: ` Ravi.K@Tata.COM ` -> `ravi.k@tata.com`; None if not an address."""
+    cleaned = (value or "").strip().lower()
+    local, _, domain = cleaned.partition("@")
+    return cleaned if local and domain else None
+
+
+def normalize_phone(value: Optional[str]) -> Optional[str]:
+    """
+    E.164-style `+<country code><number>`: `+91 98765-43210`, `0091 9876543210`,
+    `09876543210` and `98765 43210` all give `+919876543210`. None if too short / long.
+    """
+    raw = (value or "").strip()
+    digits = "".join(ch for ch in raw if ch.isdigit())
+    if not raw.startswith("+"):
+        if digits.startswith("00"):
+            digits = digits[2:]
+        else:
+            national = digits[1:] if digits.startswith("0") else digits  # trunk prefix
+            if len(national) == NATIONAL_NUMBER_LENGTH:
+                digits = DEFAULT_COUNTRY_CODE + national
+    low, high = PHONE_DIGITS_RANGE
+    return f"+{digits}" if low <= len(digits) <= high else None
+
+
+def compute_identifiers(email: Optional[str] = None, phones: Iterable[Optional[str]] = ()) -> Set[Tuple[str, str]]:
+    """Identifiers for one contact as `(kind, value)` pairs."""
+    keys = set()
+    normalized_email = normalize_email(email)
+    if normalized_email:
+        keys.add(("email", normalized_email[:150]))
+    for phone in phones:
+        normalized_phone = normalize_phone(phone)
+        if normalized_phone:
+            keys.add(("phone", normalized_phone))
+    return keys
+
+
+def _contact_identifiers(contact) -> Set[Tuple[str, str]]:
+    """Identifiers of a Contact row or ContactCreate payload."""
+    return compute_identifiers(contact.email, (getattr(contact, field) for field in PHONE_FIELDS))
+
+
+# ---------------- Maintenance ----------------
+def index_contacts(db: Session, contact_ids: Iterable[int]) -> int:
+    """Recompute the identifiers of the given contacts: one SELECT, one DELETE, one executemany."""
+    ids = list(contact_ids)
+    if not ids:
+        return 0
+    contacts = db.execute(
+        select(Contact.id, Contact.email, *(getattr(Contact, field) for field in PHONE_FIELDS))
+        .where(Contact.id.in_(ids))
+    ).all()
+
+    remove_contacts(db, ids)
+    rows = [
+        {"kind": kind, "value": value, "contact_id": c.id}
+        for c in contacts
+        for kind, value in _contact_identifiers(c)
+    ]
+    if rows:
+        db.execute(insert(ContactIdentifier), rows)
+    return len(contacts)
+
+
+def remove_contacts(db: Session, contact_ids: Iterable[int]) -> None:
+    db.execute(
+        delete(ContactIdentifier).where(ContactIdentifier.contact_id.in_(list(contact_ids)))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def reindex_all(db: Session) -> int:
+    """Rebuild the identifiers of every non-deleted contact in batches."""
+    db.execute(delete(ContactIdentifier))
+    total, last_id = 0, 0
+    while True:
+        ids = list(db.scalars(
+            select(Contact.id)
+            .where(Contact.id > last_id, Contact.is_deleted == False)
+            .order_by(Contact.id).limit(REINDEX_BATCH_SIZE)
+        ))
+        if not ids:
+            return total
+        total += index_contacts(db, ids)
+        last_id = ids[-1]
+
+
+# ---------------- Lookups ----------------
+def _matching(db: Session, keys: Set[Tuple[str, str]], exclude_id: Optional[int] = None):
+    """`(contact_id, kind, value)` for live contacts holding any of `keys`; one primary key probe per key."""
+    if not keys:
+        return []
+    query = (
+        select(ContactIdentifier.contact_id, ContactIdentifier.kind, ContactIdentifier.value)
+        .join(Contact, Contact.id == ContactIdentifier.contact_id)
+        .where(
+            tuple_(ContactIdentifier.kind, ContactIdentifier.value).in_(list(keys)),
+            Contact.is_deleted == False
+        )
+        .order_by(ContactIdentifier.contact_id)
+    )
+    if exclude_id is not None:
+        query = query.where(ContactIdentifier.contact_id != exclude_id)
+    return db.execute(query).all()
+
+
+def lookup(db: Session, phone: Optional[str] = None, email: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Live contacts holding the given phone number and/or email, with what matched."""
+    if not phone and not email:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Provide phone or email")
+    keys = set()
+    if phone:
+        normalized_phone = normalize_phone(phone)
+        if not normalized_phone:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"'{phone}' is not a valid phone number")
+        keys.add(("phone", normalized_phone))
+    if email:
+        normalized_email = normalize_email(email)
+        if not normalized_email:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"'{email}' is not a valid email address")
+        keys.add(("email", normalized_email))
+
+    matched: Dict[int, Set[str]] = defaultdict(set)
+    for contact_id, kind, _ in _matching(db, keys):
+        matched[contact_id].add(kind)
+    if not matched:
+        return []
+
+    rows = db.execute(
+        select(
+            Contact.id, Contact.first_name, Contact.last_name, Contact.email,
+            Contact.primary_no, Contact.company_id, Company.company_name
+        )
+        .join(Company, Company.id == Contact.company_id)
+        .where(Contact.id.in_(list(matched)))
+        .order_by(Contact.id)
+    ).all()
+    return [{**row._asdict(), "matched_on": sorted(matched[row.id])} for row in rows]
+
+
+def _duplicate_message(kind: str, value: str, contact_id: int) -> str:
+    return f"{'Email' if kind == 'email' else 'Phone'} '{value}' already exists on contact {contact_id}"
+
+
+def ensure_unique(db: Session, contact, exclude_id: Optional[int] = None) -> None:
+    """Reject a contact whose email or any phone number is already held by another live contact."""
+    taken = _matching(db, _contact_identifiers(contact), exclude_id)
+    if taken:
+        contact_id, kind, value = taken[0]
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{_duplicate_message(kind, value, contact_id)}.")
+
+
+def find_batch_duplicates(db: Session, contacts: List[Any], ids: Optional[List[int]] = None) -> Dict[int, str]:
+    """
+    For an import batch: index -> reason, for items sharing an identifier with a live
+    contact or with an earlier item of the batch. One query for the whole batch.
+    `ids` names existing contacts (a restore), so a clash with an earlier one cites its id.
+    """
+    identifiers = [_contact_identifiers(c) for c in contacts]
+    taken: Dict[Tuple[str, str], int] = {}
+    for contact_id, kind, value in _matching(db, set().union(*identifiers)):
+        taken.setdefault((kind, value), contact_id)
+    errors: Dict[int, str] = {}
+    seen: Dict[Tuple[str, str], int] = {}
+    for index, keys in enumerate(identifiers):
+        for kind, value in sorted(keys):
+            if (kind, value) in taken:
+                errors[index] = _duplicate_message(kind, value, taken[(kind, value)])
+                break
+            if (kind, value) in seen and ids is not None:
+                errors[index] = _duplicate_message(kind, value, ids[seen[(kind, value)]])
+                break
+            if (kind, value) in seen:
+                errors[index] = f"{'Email' if kind == 'email' else 'Phone'} '{value}' duplicates item {seen[(kind, value)]} of the batch"
+                break
+        else:
+            seen.update((key, index) for key in keys)
+    return errors
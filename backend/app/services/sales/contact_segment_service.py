@@ -0,0 +1,108 @@
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select, func, exists, false
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from fastapi import HTTPException, status
+from app.models.sales.company import Company
+from app.models.sales.contact import Contact, ContactAddress, COMM_PREF_BITS
+from app.schemas.sales.contact import ContactSegment
+from app.services.sales import company_facet_service
+
+SEGMENT_EXPORT_BATCH_SIZE = 1000
+ALL_PREFS = range(1 << len(COMM_PREF_BITS))
+
+# Columns of the campaign export, in output order
+EXPORT_COLUMNS = (
+    Contact.id, Contact.first_name, Contact.last_name, Contact.email,
+    Contact.primary_no, Contact.secondary_no, Contact.alternate_no,
+    Contact.company_id, Company.company_name,
+    Contact.dont_solicit, Contact.dont_mail, Contact.dont_fax, Contact.dont_email, Contact.dont_call,
+)
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+
+# ---------------- Filters ----------------
+def _mask(channels: Optional[Iterable[str]]) -> int:
+    unknown = sorted(set(channels or ()) - set(COMM_PREF_BITS))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown channel(s): {', '.join(unknown)}; use {', '.join(COMM_PREF_BITS)}"
+        )
+    mask = 0
+    for channel in channels or ():
+        mask |= COMM_PREF_BITS[channel]
+    return mask
+
+
+def _prefs_condition(reachable_by: Optional[List[str]], opted_out_of: Optional[List[str]]):
+    """
+    Preference filter as `comm_prefs IN (...)`: the bitmask has only 32 values, so the
+    matching ones are enumerated here and the database does an index range scan.
+    """
+    clear, opted = _mask(reachable_by), _mask(opted_out_of)
+    if not clear and not opted:
+        return None
+    allowed = [prefs for prefs in ALL_PREFS if not prefs & clear and prefs & opted == opted]
+    return Contact.comm_prefs.in_(allowed) if allowed else false()
+
+
+def segment_conditions(segment: ContactSegment) -> List[Any]:
+    """WHERE conditions over Contact joined to Company; 400 on an unknown channel."""
+    conditions = [Contact.is_deleted == False, Company.is_deleted == False]
+    if not segment.include_inactive:
+        conditions.append(Contact.is_active == True)
+    prefs = _prefs_condition(segment.reachable_by, segment.opted_out_of)
+    if prefs is not None:
+        conditions.append(prefs)
+    conditions.extend(company_facet_service.filter_conditions(segment.company))
+
+    address = aliased(ContactAddress)
+    address_conditions = [
+        getattr(address, field).in_(getattr(segment, field))
+        for field in ("country_id", "state_id", "city_id") if getattr(segment, field)
+    ]
+    if address_conditions:
+        conditions.append(exists().where(
+            address.contact_id == Contact.id, address.is_deleted == False, *address_conditions
+        ))
+    return conditions
+
+
+def _segment_select(columns, segment: ContactSegment):
+    return (
+        select(*columns)
+        .select_from(Contact)
+        .join(Company, Company.id == Contact.company_id)
+        .where(*segment_conditions(segment))
+    )
+
+
+# ---------------- Counts ----------------
+def count_segment(db: Session, segment: ContactSegment) -> Dict[str, Any]:
+    """
+    Exact size of the segment and how many of it each channel reaches, from one
+    GROUP BY comm_prefs (at most 32 groups); the per-channel split is summed here.
+    """
+    groups = db.execute(
+        _segment_select([Contact.comm_prefs, func.count()], segment).group_by(Contact.comm_prefs)
+    ).all()
+    return {
+        "total": sum(count for _, count in groups),
+        "reachable_by": {
+            channel: sum(count for prefs, count in groups if not (prefs or 0) & bit)
+            for channel, bit in COMM_PREF_BITS.items()
+        },
+    }
+
+
+# ---------------- Export ----------------
+def export_statement(segment: ContactSegment):
+    """The campaign list query; built (and validated) before a streamed response starts."""
+    return _segment_select(EXPORT_COLUMNS, segment).order_by(Contact.id)
+
+
+def iter_segment(db: Session, statement, batch_size: int = SEGMENT_EXPORT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """Batches of export rows read through a server-side cursor, so memory stays at one batch."""
+    result = db.execute(statement.execution_options(yield_per=batch_size))
+    for rows in result.partitions():
+        yield [dict(zip(EXPORT_FIELDS, row)) for row in rows]
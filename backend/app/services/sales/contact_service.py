@@ -1,16 +1,38 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import Optional, List
+from sqlalchemy import or_, select, insert
+from typing import Optional, List, Dict, Any, Iterator
+from datetime import datetime
+from app.models.sales.company import Company
 from app.models.sales.contact import Contact, ContactAddress
 from app.schemas.sales.contact import (
-    ContactCreate, ContactUpdate, ContactResponse, ContactListResponse
+    ContactCreate, ContactUpdate, ContactResponse, ContactListResponse,
+    ContactBulkItemResult, ContactBulkCreateResponse
 )
 from fastapi import HTTPException, status
+from app.utils.projection import project_rows, attach_children, resolve_columns
+from app.utils.child_sync import sync_children
+from app.utils import etag as ETag
+from app.services.sales import company_scoring_service, geo_rollup_service, contact_identifier_service
 
+# Child collections that can be requested with `include=` on list endpoints
+CONTACT_CHILDREN = {
+    "addresses": (ContactAddress, "contact_id"),
+}
+# Rows pulled per server-side cursor fetch (and per address query) when streaming
+CONTACT_FEED_BATCH_SIZE = 500
 
-def create_contact(db: Session, contact_data: ContactCreate, created_by: int) -> ContactResponse:
-    """Create a new contact with related data"""
+
+def create_contact(
+    db: Session,
+    contact_data: ContactCreate,
+    created_by: int,
+    allow_duplicates: bool = False
+) -> ContactResponse:
+    """Create a new contact with related data; 400 if its email or a phone is already taken unless `allow_duplicates`"""
     try:
+        if not allow_duplicates:
+            contact_identifier_service.ensure_unique(db, contact_data)
+
         # Create main contact record
         contact = Contact(
             title_id=contact_data.title_id,
@@ -50,11 +72,19 @@ def create_contact(db: Session, contact_data: ContactCreate, created_by: int) ->
             )
             db.add(address)
         
+        # Contact coverage feeds the account score
+        company_scoring_service.mark_stale(db, [contact.company_id])
+        db.flush()
+        geo_rollup_service.add_entities(db, "contact", [contact.id])
+        contact_identifier_service.index_contacts(db, [contact.id])
         db.commit()
         db.refresh(contact)
         
         return ContactResponse.from_orm(contact)
     
+    except HTTPException:
+        db.rollback()
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -63,14 +93,90 @@ def create_contact(db: Session, contact_data: ContactCreate, created_by: int) ->
         )
 
 
+def bulk_create_contacts(
+    db: Session,
+    contacts: List[ContactCreate],
+    created_by: int,
+    allow_duplicates: bool = False
+) -> ContactBulkCreateResponse:
+    """
+    Import many contacts in one transaction: one multi-row INSERT ... RETURNING for the
+    contacts and one executemany for their addresses. Items with an unknown company or,
+    unless `allow_duplicates`, an email / phone already held by a live contact or an earlier
+    item are reported per index and skipped; a database error rolls back the whole batch.
+    """
+    company_ids = {c.company_id for c in contacts}
+    existing_company_ids = set(db.scalars(
+        select(Company.id).where(Company.id.in_(company_ids), Company.is_deleted == False)
+    ))
+    duplicates = {} if allow_duplicates else contact_identifier_service.find_batch_duplicates(db, contacts)
+
+    results: List[Optional[ContactBulkItemResult]] = [None] * len(contacts)
+    accepted: List[int] = []
+    for index, contact_data in enumerate(contacts):
+        if contact_data.company_id not in existing_company_ids:
+            error = f"Company {contact_data.company_id} not found"
+        else:
+            error = duplicates.get(index)
+        if error:
+            results[index] = ContactBulkItemResult(index=index, status="failed", error=error)
+        else:
+            accepted.append(index)
+
+    try:
+        if accepted:
+            contact_rows = [
+                {**contacts[i].dict(exclude={"addresses"}), "created_by": created_by}
+                for i in accepted
+            ]
+            new_ids = db.scalars(
+                insert(Contact).returning(Contact.id, sort_by_parameter_order=True),
+                contact_rows,
+                execution_options={"render_nulls": True}
+            ).all()
+
+            address_rows: List[Dict[str, Any]] = []
+            for index, contact_id in zip(accepted, new_ids):
+                address_rows.extend(
+                    {**item.dict(), "contact_id": contact_id, "created_by": created_by}
+                    for item in contacts[index].addresses or []
+                )
+                results[index] = ContactBulkItemResult(index=index, status="created", id=contact_id)
+            if address_rows:
+                db.execute(insert(ContactAddress), address_rows, execution_options={"render_nulls": True})
+
+            company_scoring_service.mark_stale(db, {contacts[i].company_id for i in accepted})
+            geo_rollup_service.add_entities(db, "contact", new_ids)
+            contact_identifier_service.index_contacts(db, new_ids)
+
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Error creating contacts: {str(e)}"
+        )
+
+    return ContactBulkCreateResponse(
+        created=len(accepted),
+        failed=len(contacts) - len(accepted),
+        results=results
+    )
+
+
 def get_contacts(
     db: Session, 
     skip: int = 0, 
     limit: int = 10, 
     search: Optional[str] = None,
-    company_id: Optional[int] = None
+    company_id: Optional[int] = None,
+    fields: Optional[str] = None,
+    include: Optional[str] = None
 ) -> ContactListResponse:
-    """Get list of contacts with pagination and search"""
+    """
+    Get list of contacts with pagination and search.
+    `fields` / `include` switch the page to a column-projected SELECT returning dicts.
+    """
     query = db.query(Contact).filter(Contact.is_deleted == False)
     
     if company_id:
@@ -87,7 +193,18 @@ def get_contacts(
         )
     
     total = query.count()
-    contacts = query.offset(skip).limit(limit).all()
+    page_query = query.order_by(Contact.id.asc()).offset(skip).limit(limit)
+
+    if fields or include:
+        rows = project_rows(page_query, Contact, fields)
+        return {
+            "contacts": attach_children(db, rows, CONTACT_CHILDREN, include),
+            "total": total,
+            "page": (skip // limit) + 1,
+            "limit": limit
+        }
+
+    contacts = page_query.all()
     
     return ContactListResponse(
         contacts=[ContactResponse.from_orm(contact) for contact in contacts],
@@ -97,6 +214,19 @@ def get_contacts(
     )
 
 
+def contact_etag(contact_id: int, updated_at: Optional[datetime]) -> str:
+    # update_contact always touches updated_at, so it versions the addresses too
+    return ETag.version_etag("contact", contact_id, updated_at)
+
+
+def get_contact_etag(db: Session, contact_id: int) -> Optional[str]:
+    """Current ETag from a single-column read; None when the contact does not exist."""
+    row = db.execute(
+        select(Contact.updated_at).where(Contact.id == contact_id, Contact.is_deleted == False)
+    ).first()
+    return contact_etag(contact_id, row.updated_at) if row else None
+
+
 def get_contact_by_id(db: Session, contact_id: int) -> Optional[ContactResponse]:
     """Get contact by ID"""
     contact = db.query(Contact).filter(
@@ -113,47 +243,51 @@ def update_contact(
     db: Session, 
     contact_id: int, 
     contact_data: ContactUpdate, 
-    updated_by: int
+    updated_by: int,
+    if_match: Optional[str] = None
 ) -> Optional[ContactResponse]:
-    """Update contact and related data"""
+    """Update contact and related data. `if_match` (an ETag) makes the update conditional: 412 if stale."""
     try:
-        contact = db.query(Contact).filter(
+        query = db.query(Contact).filter(
             Contact.id == contact_id,
             Contact.is_deleted == False
-        ).first()
+        )
+        if if_match is not None:
+            # Hold the row until commit so nobody can slip in between the check and the write
+            query = query.with_for_update().populate_existing()
+        contact = query.first()
         
         if not contact:
             return None
+        ETag.require_match(if_match, contact_etag(contact.id, contact.updated_at), "Contact")
         
+        previous_company_id = contact.company_id
+        territories_before = geo_rollup_service.snapshot(db, "contact", [contact.id])
+
         # Update main contact fields
         for field, value in contact_data.dict(exclude_unset=True, exclude={'addresses'}).items():
             setattr(contact, field, value)
         contact.updated_by = updated_by
+        contact.updated_at = datetime.utcnow()  # also when only addresses change
+        # Checked on the merged row: a partial update keeps the stored email / phones
+        contact_identifier_service.ensure_unique(db, contact, exclude_id=contact.id)
         
-        # Update addresses (simple approach: delete and recreate)
-        if contact_data.addresses is not None:
-            # Delete existing addresses
-            db.query(ContactAddress).filter(ContactAddress.contact_id == contact_id).delete()
-            
-            # Add new addresses
-            for addr_data in contact_data.addresses:
-                address = ContactAddress(
-                    contact_id=contact.id,
-                    address_type_id=addr_data.address_type_id,
-                    address=addr_data.address,
-                    country_id=addr_data.country_id,
-                    state_id=addr_data.state_id,
-                    city_id=addr_data.city_id,
-                    zip_code=addr_data.zip_code,
-                    created_by=updated_by
-                )
-                db.add(address)
+        # Reconcile addresses by id (omitted list is left untouched)
+        sync_children(db, ContactAddress, "contact_id", contact.id, contact_data.addresses, updated_by)
         
+        if contact.company_id != previous_company_id:
+            company_scoring_service.mark_stale(db, [previous_company_id, contact.company_id])
+        db.flush()
+        geo_rollup_service.apply_change(db, "contact", territories_before)
+        contact_identifier_service.index_contacts(db, [contact.id])
         db.commit()
         db.refresh(contact)
         
         return ContactResponse.from_orm(contact)
     
+    except HTTPException:
+        db.rollback()
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -162,17 +296,25 @@ def update_contact(
         )
 
 
-def delete_contact(db: Session, contact_id: int) -> bool:
-    """Soft delete contact"""
-    contact = db.query(Contact).filter(
+def delete_contact(db: Session, contact_id: int, if_match: Optional[str] = None) -> bool:
+    """Soft delete contact; with `if_match` only if it is unchanged since that ETag (412 otherwise)"""
+    query = db.query(Contact).filter(
         Contact.id == contact_id,
         Contact.is_deleted == False
-    ).first()
+    )
+    if if_match is not None:
+        query = query.with_for_update().populate_existing()
+    contact = query.first()
     
     if not contact:
         return False
+    ETag.require_match(if_match, contact_etag(contact.id, contact.updated_at), "Contact")
     
     contact.is_deleted = True
+    company_scoring_service.mark_stale(db, [contact.company_id])
+    db.flush()
+    geo_rollup_service.remove_entities(db, "contact", [contact.id])
+    contact_identifier_service.remove_contacts(db, [contact.id])
     db.commit()
     return True
 
@@ -184,4 +326,52 @@ def get_contacts_by_company(db: Session, company_id: int) -> List[ContactRespons
         Contact.is_deleted == False
     ).all()
     
-    return [ContactResponse.from_orm(contact) for contact in contacts]
\ No newline at end of file
+    return [ContactResponse.from_orm(contact) for contact in contacts]
+
+
+# ---------------- Contacts By Company Feed ----------------
+def _company_feed_query(company_id: int, cursor: Optional[int] = None):
+    """Live contacts of a company in id order, as plain columns (no entity hydration)."""
+    query = (
+        select(*resolve_columns(Contact))
+        .where(Contact.company_id == company_id, Contact.is_deleted == False)
+        .order_by(Contact.id)
+    )
+    if cursor is not None:
+        query = query.where(Contact.id > cursor)
+    return query
+
+
+def _with_addresses(db: Session, rows) -> List[ContactResponse]:
+    """Contacts from projected rows, with the addresses of all of them loaded in one SELECT."""
+    items = attach_children(db, [dict(row._mapping) for row in rows], CONTACT_CHILDREN, "addresses")
+    return [ContactResponse.model_validate(item) for item in items]
+
+
+def get_contacts_by_company_page(
+    db: Session, company_id: int, limit: int = 100, cursor: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    One keyset page of a company's contacts: ids after `cursor` (the `next_cursor` of
+    the previous page), two SELECTs whatever the page. `next_cursor` is None on the last page.
+    """
+    rows = db.execute(_company_feed_query(company_id, cursor).limit(limit + 1)).all()
+    has_more = len(rows) > limit
+    contacts = _with_addresses(db, rows[:limit])
+    return {
+        "contacts": contacts,
+        "next_cursor": contacts[-1].id if has_more else None,
+        "limit": limit
+    }
+
+
+def iter_contacts_by_company(
+    db: Session, company_id: int, cursor: Optional[int] = None, batch_size: int = CONTACT_FEED_BATCH_SIZE
+) -> Iterator[ContactResponse]:
+    """
+    Every contact of a company after `cursor`, read through a server-side cursor
+    (`yield_per`) with one address SELECT per batch, so memory is bounded by `batch_size`.
+    """
+    result = db.execute(_company_feed_query(company_id, cursor).execution_options(yield_per=batch_size))
+    for rows in result.partitions():
+        yield from _with_addresses(db, rows)
@@ -0,0 +1,196 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import select, delete, bindparam, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.sales.company import Company, CompanyAddress
+from app.models.sales.contact import Contact, ContactAddress
+from app.models.sales.geo_rollup import GeoRollup
+from app.services.sales.company_360_service import resolve_master_names
+
+# kind -> (entity model, address model, address foreign key, counter column)
+SOURCES = {
+    "company": (Company, CompanyAddress, CompanyAddress.company_id, "company_count"),
+    "contact": (Contact, ContactAddress, ContactAddress.contact_id, "contact_count"),
+}
+LEVELS = {"country": 1, "state": 2, "city": 3}
+ANY_ADDRESS_TYPE = 0
+REBUILD_BATCH_SIZE = 5000
+UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+Key = Tuple[int, int, int, int, int]  # (level, address_type_id, country_id, state_id, city_id)
+Snapshot = Dict[int, Set[Key]]
+KEY_COLUMNS = (GeoRollup.level, GeoRollup.address_type_id, GeoRollup.country_id, GeoRollup.state_id, GeoRollup.city_id)
+
+
+def _key_values(key: Key, prefix: str = "") -> Dict[str, int]:
+    return {f"{prefix}{column.key}": value for column, value in zip(KEY_COLUMNS, key)}
+
+
+def _address_keys(address_type_id, country_id, state_id, city_id) -> List[Key]:
+    country, state, city = country_id or 0, state_id or 0, city_id or 0
+    keys = []
+    # an untyped address only counts towards "any type"
+    for type_id in {ANY_ADDRESS_TYPE, address_type_id or ANY_ADDRESS_TYPE}:
+        keys.append((1, type_id, country, 0, 0))
+        keys.append((2, type_id, country, state, 0))
+        keys.append((3, type_id, country, state, city))
+    return keys
+
+
+def snapshot(db: Session, kind: str, entity_ids: Iterable[int], live_only: bool = True) -> Snapshot:
+    """Territory keys of each entity from its live addresses, in one SELECT."""
+    ids = list(set(entity_ids))
+    keys: Snapshot = {entity_id: set() for entity_id in ids}
+    if not ids:
+        return keys
+    model, address, fk, _ = SOURCES[kind]
+    query = (
+        select(fk, address.address_type_id, address.country_id, address.state_id, address.city_id)
+        .where(fk.in_(ids), address.is_deleted == False)
+    )
+    if live_only:
+        query = query.join(model, model.id == fk).where(model.is_deleted == False)
+    for entity_id, *columns in db.execute(query):
+        keys[entity_id].update(_address_keys(*columns))
+    return keys
+
+
+def _apply_deltas(db: Session, column: str, deltas: Counter) -> None:
+    """
+    Add signed deltas to the counters with relative updates (count = count + delta), so
+    concurrent writers never overwrite each other, then drop rows that reached zero.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    table = GeoRollup.__table__
+    touched = tuple_(*KEY_COLUMNS).in_(list(deltas))
+    upsert = UPSERT_DIALECTS.get(db.get_bind().dialect.name)
+
+    if upsert is not None:
+        # one executemany INSERT .. ON CONFLICT DO UPDATE
+        statement = upsert(table)
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[col.key for col in KEY_COLUMNS],
+                set_={column: table.c[column] + statement.excluded[column]}
+            ),
+            [{**_key_values(key), "company_count": 0, "contact_count": 0, column: delta} for key, delta in deltas.items()]
+        )
+    else:
+        existing = set(db.execute(select(*KEY_COLUMNS).where(touched)).all())
+        updates = [{**_key_values(key, "key_"), "delta": delta} for key, delta in deltas.items() if key in existing]
+        if updates:
+            db.execute(
+                table.update()
+                .where(*(col == bindparam(f"key_{col.key}") for col in KEY_COLUMNS))
+                .values({column: table.c[column] + bindparam("delta")}),
+                updates
+            )
+        inserts = [
+            {**_key_values(key), "company_count": 0, "contact_count": 0, column: delta}
+            for key, delta in deltas.items() if key not in existing
+        ]
+        if inserts:
+            db.execute(table.insert(), inserts)
+    db.execute(
+        delete(GeoRollup)
+        .where(touched, GeoRollup.company_count <= 0, GeoRollup.contact_count <= 0)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def apply_change(db: Session, kind: str, before: Snapshot, entity_ids: Optional[Iterable[int]] = None) -> None:
+    """
+    Diff the entities' keys now against `before` (taken with snapshot() ahead of the write)
+    and move the counters by the difference. Deleted entities end up with no keys.
+    """
+    ids = set(before) | set(entity_ids or ())
+    after = snapshot(db, kind, ids)
+    deltas: Counter = Counter()
+    for entity_id in ids:
+        old, new = before.get(entity_id, set()), after.get(entity_id, set())
+        deltas.update(new - old)
+        deltas.subtract(old - new)
+    _apply_deltas(db, SOURCES[kind][3], deltas)
+
+
+def add_entities(db: Session, kind: str, entity_ids: Iterable[int]) -> None:
+    """Count newly created or restored entities."""
+    apply_change(db, kind, {}, entity_ids)
+
+
+def remove_entities(db: Session, kind: str, entity_ids: Iterable[int]) -> None:
+    """Uncount entities that were just soft-deleted (their addresses are still in place)."""
+    ids = list(entity_ids)
+    apply_change(db, kind, snapshot(db, kind, ids, live_only=False), ids)
+
+
+def rebuild(db: Session) -> int:
+    """Recount everything from the address tables (initial backfill / repair); returns rows written."""
+    db.execute(delete(GeoRollup))
+    counts: Dict[str, Counter] = {column: Counter() for *_, column in SOURCES.values()}
+    for kind, (model, _, _, column) in SOURCES.items():
+        last_id = 0
+        while True:
+            ids = list(db.scalars(
+                select(model.id).where(model.id > last_id, model.is_deleted == False)
+                .order_by(model.id).limit(REBUILD_BATCH_SIZE)
+            ))
+            if not ids:
+                break
+            for keys in snapshot(db, kind, ids).values():
+                counts[column].update(keys)
+            last_id = ids[-1]
+
+    all_keys = set(counts["company_count"]) | set(counts["contact_count"])
+    rows = [
+        {**_key_values(key), "company_count": counts["company_count"][key], "contact_count": counts["contact_count"][key]}
+        for key in all_keys
+    ]
+    for start in range(0, len(rows), REBUILD_BATCH_SIZE):
+        db.execute(GeoRollup.__table__.insert(), rows[start:start + REBUILD_BATCH_SIZE])
+    return len(rows)
+
+
+# ---------------- Read ----------------
+def get_territories(
+    db: Session,
+    level: str = "country",
+    address_type_id: Optional[int] = None,
+    country_id: Optional[int] = None,
+    state_id: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Company and contact counts for every country, or the states of a country, or the
+    cities of a state: a primary key range read on the rollup table.
+    """
+    if level not in LEVELS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"level must be one of: {', '.join(LEVELS)}")
+    if level in ("state", "city") and country_id is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"country_id is required for level '{level}'")
+    if level == "city" and state_id is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="state_id is required for level 'city'")
+
+    conditions = [GeoRollup.level == LEVELS[level], GeoRollup.address_type_id == (address_type_id or ANY_ADDRESS_TYPE)]
+    if country_id is not None:
+        conditions.append(GeoRollup.country_id == country_id)
+    if level == "city":
+        conditions.append(GeoRollup.state_id == state_id)
+    rows = db.execute(
+        select(GeoRollup).where(*conditions).order_by(GeoRollup.company_count.desc(), GeoRollup.contact_count.desc())
+    ).scalars().all()
+
+    fields = ("country_id", "state_id", "city_id")[:LEVELS[level]]
+    result = [
+        {
+            **{field: getattr(row, field) or None for field in fields},  # 0 = not set on the address
+            "company_count": row.company_count,
+            "contact_count": row.contact_count,
+        }
+        for row in rows
+    ]
+    resolve_master_names(db, {"territories": result})
+    return result
@@ -3,9 +3,9 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import or_
 from fastapi import HTTPException
 from typing import Optional, Dict, Any
-from sqlalchemy import func
-from fastapi import FastAPI,status
 from app.models.user_management.department import Department
+from app.services.user_management.dropdown_service import DropdownType, invalidate as invalidate_dropdown
+from app.utils.unique import insert_unique, live_index, violates
 from app.schemas.user_management.department import (
     DepartmentCreate,
     DepartmentUpdate,
@@ -34,19 +34,8 @@ def serialize_department(dept: Department) -> Optional[Dict[str, Any]]:
 # -------- Create Department --------
 def create_department(db: Session, dept_data: DepartmentCreate, login_id: int):
     try:
-        # Duplicate check (case-insensitive by name, only non-deleted)
-        existing_dept = db.query(Department).filter(
-            func.lower(Department.name) == dept_data.name.lower()
-        ).first()
-
-        if existing_dept:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Department '{dept_data.name}' already exists."
-            )
-
-        # Save exactly as entered
-        db_dept = Department(
+        # Save exactly as entered; the live-name unique index (case-insensitive) rejects duplicates
+        dept_id = insert_unique(db, live_index(Department.name), dict(
             name=dept_data.name.strip(),
             code=dept_data.code.strip() if dept_data.code else None,
             description=dept_data.description,
@@ -54,13 +43,18 @@ def create_department(db: Session, dept_data: DepartmentCreate, login_id: int):
             is_deleted=dept_data.is_deleted if dept_data.is_deleted is not None else False,
             created_by=login_id,
             updated_by=login_id
-        )
+        ))
+
+        if dept_id is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Department '{dept_data.name}' already exists."
+            )
 
-        db.add(db_dept)
         db.commit()
-        db.refresh(db_dept)
+        invalidate_dropdown(DropdownType.departments)
 
-        return serialize_department(db_dept)
+        return serialize_department(db.get(Department, dept_id))
 
     except HTTPException:
         raise
@@ -144,15 +138,23 @@ def update_department(
             return None
 
         update_data = dept_data.dict(exclude_unset=True)
+        name = update_data.get("name", db_dept.name)
         for field, value in update_data.items():
             setattr(db_dept, field, value)
 
         db_dept.updated_by = login_id
         db.commit()
+        invalidate_dropdown(DropdownType.departments)
         db.refresh(db_dept)
         return serialize_department(db_dept)
+    except HTTPException:
+        db.rollback()
+        raise
     except SQLAlchemyError as e:
         db.rollback()
+        if violates(e, live_index(Department.name)):
+            # Renamed onto another live department's name (the unique index rejects it)
+            raise HTTPException(status_code=400, detail=f"Department '{name}' already exists.")
         print(f"DB Error (Update Department): {str(e)}")
         raise HTTPException(status_code=500, detail="Database error while updating department")
     except Exception as e:
@@ -174,6 +176,7 @@ def delete_department(db: Session, dept_id: int, login_id: int) -> Optional[Dict
         db_dept.is_deleted = True
         db_dept.updated_by = login_id
         db.commit()
+        invalidate_dropdown(DropdownType.departments)
         db.refresh(db_dept)
         return serialize_department(db_dept)
     except SQLAlchemyError as e:
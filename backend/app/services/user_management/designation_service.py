@@ -2,8 +2,10 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
 from typing import Optional, Dict, Any
-from sqlalchemy import or_, func
+from sqlalchemy import or_
 from app.models.user_management.designation import Designation
+from app.services.user_management.dropdown_service import DropdownType, invalidate as invalidate_dropdown
+from app.utils.unique import insert_unique, live_index, violates
 from app.schemas.user_management.designation import DesignationCreate, DesignationUpdate
 
 # ---------------- Utility ----------------
@@ -28,33 +30,26 @@ def map_designation_with_names(designation: Designation) -> Optional[Dict[str, A
 # ---------------- Create ----------------
 def create_designation(db: Session, designation_data: DesignationCreate, login_id: int):
     try:
-        # Duplicate check (case-insensitive, only non-deleted)
-        existing_designation = db.query(Designation).filter(
-            func.lower(Designation.name) == designation_data.name.lower(),
-            Designation.is_deleted == False
-        ).first()
-
-        if existing_designation:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Designation '{designation_data.name}' already exists."
-            )
-
-        # Save new designation
-        new_designation = Designation(
+        # Save new designation; the live-name unique index (case-insensitive) rejects duplicates
+        designation_id = insert_unique(db, live_index(Designation.name), dict(
             name=designation_data.name.strip(),   # 👈 updated
             description=designation_data.description,
             is_active=designation_data.is_active,
             is_deleted=designation_data.is_deleted or False,
             created_by=login_id,
             updated_by=login_id
-        )
+        ))
+
+        if designation_id is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Designation '{designation_data.name}' already exists."
+            )
 
-        db.add(new_designation)
         db.commit()
-        db.refresh(new_designation)
+        invalidate_dropdown(DropdownType.designations)
 
-        return map_designation_with_names(new_designation)
+        return map_designation_with_names(db.get(Designation, designation_id))
 
     except HTTPException:
         raise
@@ -128,16 +123,24 @@ def update_designation(db: Session, designation_id: int, designation_data: Desig
             return None
 
         update_data = designation_data.dict(exclude_unset=True)
+        name = update_data.get("name", db_designation.name)
         for field, value in update_data.items():
             setattr(db_designation, field, value)
 
         db_designation.updated_by = login_id
         db.commit()
+        invalidate_dropdown(DropdownType.designations)
         db.refresh(db_designation)
         return map_designation_with_names(db_designation)
 
+    except HTTPException:
+        db.rollback()
+        raise
     except SQLAlchemyError as e:
         db.rollback()
+        if violates(e, live_index(Designation.name)):
+            # Renamed onto another live designation's name (the unique index rejects it)
+            raise HTTPException(status_code=400, detail=f"Designation '{name}' already exists.")
         print("DB Error (Update Designation):", str(e))
         raise HTTPException(status_code=500, detail="Database error occurred while updating designation")
     except Exception as e:
@@ -158,6 +161,7 @@ def delete_designation(db: Session, designation_id: int, login_id: int) -> Optio
         db_designation.is_deleted = True
         db_designation.updated_by = login_id
         db.commit()
+        invalidate_dropdown(DropdownType.designations)
         db.refresh(db_designation)
         return map_designation_with_names(db_designation)
 
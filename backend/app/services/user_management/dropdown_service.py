@@ -0,0 +1,172 @@
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.user_management import (Role, Department,
+    SubDepartment,
+    Designation,
+    RolePermission,
+    Permission,
+    Module,
+    User,
+    Menu
+)
+from app.models.masters.master_titles import Title
+from app.models.masters.master_account_sub_types import AccountSubType
+from app.services.masters import master_service as MasterService
+from app.services.masters.master_registry import MASTERS
+from app.utils import etag as ETag
+from app.utils.env import env_get
+
+# Tables written outside master_service are re-read at most this often
+DROPDOWN_CACHE_TTL = int(env_get("DROPDOWN_CACHE_TTL") or 60)
+
+
+# Enum for allowed dropdown types
+class DropdownType(str, Enum):
+    roles = "roles"
+    departments = "departments"
+    sub_departments = "sub_departments"
+    designations = "designations"
+    role_permissions = "role_permissions"
+    permissions = "permissions"
+    module = "module"
+    user = "user"
+    menu = "menu"
+    titles = "titles"
+    account_sub_types = "account_sub_types"
+    # Master tables (served from master_service snapshots)
+    business_verticals = "business_verticals"
+    regions = "regions"
+    company_types = "company_types"
+    head_companies = "head_companies"
+    job_functions = "job_functions"
+    partner_types = "partner_types"
+    product_service_interests = "product_service_interests"
+    account_types = "account_types"
+    business_types = "business_types"
+    industry_segments = "industry_segments"
+    sub_industry_segments = "sub_industry_segments"
+    address_types = "address_types"
+    countries = "countries"
+    states = "states"
+    cities = "cities"
+    document_types = "document_types"
+    currencies = "currencies"
+
+
+# Entities outside the master registry: model, value field, label field (+ optional extra field)
+ENTITY_MODELS: Dict[DropdownType, Tuple[type, str, str, Optional[str]]] = {
+    DropdownType.roles: (Role, "id", "name", None),
+    DropdownType.departments: (Department, "id", "name", None),
+    DropdownType.sub_departments: (SubDepartment, "id", "name", "department_id"),
+    DropdownType.designations: (Designation, "id", "name", None),
+    DropdownType.role_permissions: (RolePermission, "id", "role_id", None),
+    DropdownType.permissions: (Permission, "id", "name", None),
+    DropdownType.module: (Module, "id", "name", None),
+    DropdownType.user: (User, "id", "full_name", None),
+    DropdownType.menu: (Menu, "id", "name", "module_id"),
+    DropdownType.titles: (Title, "id", "name", None),
+    DropdownType.account_sub_types: (AccountSubType, "id", "name", None),
+}
+
+# entity -> (expiry or master snapshot, etag, options)
+_cache: Dict[DropdownType, Tuple[Any, str, List[Dict[str, Any]]]] = {}
+_lock = threading.Lock()
+
+
+def _project(db: Session, entity: DropdownType) -> List[Dict[str, Any]]:
+    """Active, non-deleted rows as `{"id", "name"[, extra]}` from one column-projected SELECT."""
+    model, value_field, label_field, extra_field = ENTITY_MODELS[entity]
+    columns = [getattr(model, value_field).label("id"), getattr(model, label_field).label("name")]
+    if extra_field:
+        columns.append(getattr(model, extra_field))
+    query = select(*columns)
+    if hasattr(model, "is_active"):
+        query = query.where(model.is_active == True)
+    if hasattr(model, "is_deleted"):
+        query = query.where(model.is_deleted == False)
+    rows = db.execute(query.order_by(getattr(model, label_field)))
+    return [dict(row._mapping) for row in rows]
+
+
+def get_dropdown(db: Session, entity: DropdownType) -> Tuple[str, List[Dict[str, Any]]]:
+    """`(etag, options)` for one dropdown, cached per entity."""
+    spec = MASTERS.get(entity.value)
+    if spec is not None:
+        # Valid for exactly as long as the master's snapshot is
+        snap = MasterService.snapshot(db, spec)
+        hit = _cache.get(entity)
+        if hit and hit[0] is snap:
+            return hit[1], hit[2]
+        options = MasterService.dropdown(db, spec)
+        key = snap
+    else:
+        hit = _cache.get(entity)
+        if hit and hit[0] > time.monotonic():
+            return hit[1], hit[2]
+        options = _project(db, entity)
+        key = time.monotonic() + DROPDOWN_CACHE_TTL
+    etag = ETag.payload_etag(options)
+    with _lock:
+        _cache[entity] = (key, etag, options)
+    return etag, options
+
+
+def invalidate(entity: DropdownType) -> None:
+    """
+    Forget a cached list after a write. User-management services call this on create,
+    update and delete; other processes catch up within DROPDOWN_CACHE_TTL.
+    """
+    with _lock:
+        _cache.pop(entity, None)
+
+
+# ---------------- Bundle ----------------
+def _parse_types(types: str) -> List[DropdownType]:
+    names = list(dict.fromkeys(name.strip() for name in (types or "").split(",") if name.strip()))
+    if not names:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Provide at least one dropdown type")
+    allowed = {entity.value for entity in DropdownType}
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown dropdown type(s): {', '.join(unknown)}")
+    return [DropdownType(name) for name in names]
+
+
+def _parse_versions(versions: Optional[str]) -> Dict[str, str]:
+    """`countries:ab12,states:cd34` -> {"countries": "ab12", "states": "cd34"}; malformed pairs are ignored."""
+    known = {}
+    for pair in (versions or "").split(","):
+        name, _, token = pair.partition(":")
+        if name.strip() and token.strip():
+            known[name.strip()] = token.strip()
+    return known
+
+
+def get_bundle(db: Session, types: str, versions: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+    """
+    `(etag, body)` for several dropdowns at once. `body["versions"]` holds every requested
+    list's version token; `body["lists"]` only the lists whose token differs from the one
+    the client sent in `versions`. The ETag covers the tokens of all requested lists and
+    the versions sent for them, since those decide which lists the body leaves out.
+    """
+    known = _parse_versions(versions)
+    tokens, lists = {}, {}
+    for entity in _parse_types(types):
+        etag, options = get_dropdown(db, entity)
+        tokens[entity.value] = etag.strip('"')
+        if known.get(entity.value) != tokens[entity.value]:
+            lists[entity.value] = options
+    sent = sorted((name, token) for name, token in known.items() if name in tokens)
+    combined = ETag.version_etag(
+        "dropdowns",
+        *(f"{name}={token}" for name, token in sorted(tokens.items())),
+        *(f"sent:{name}={token}" for name, token in sent)
+    )
+    return combined, {"versions": tokens, "lists": lists}
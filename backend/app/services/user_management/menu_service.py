@@ -5,6 +5,8 @@ from fastapi import HTTPException, status
 from typing import Optional, Dict, Any
 
 from app.models.user_management.menu import Menu
+from app.services.user_management.dropdown_service import DropdownType, invalidate as invalidate_dropdown
+from app.utils.unique import insert_unique, live_index, violates
 from app.schemas.user_management.menu import MenuCreate, MenuUpdate
 
 
@@ -37,14 +39,6 @@ def map_menu_with_names(menu: Menu) -> Optional[Dict[str, Any]]:
 # ---------------- Create Menu ----------------
 def create_menu(db: Session, menu_data: MenuCreate, login_id: int) -> Dict[str, Any]:
     try:
-        # Duplicate Name
-        existing_name = db.query(Menu).filter(
-            func.lower(Menu.name) == menu_data.name.lower(),
-            Menu.is_deleted == False
-        ).first()
-        if existing_name:
-            raise HTTPException(status_code=400, detail=f"Menu name '{menu_data.name}' already exists.")
-
         # Duplicate Path
         if menu_data.path:
             existing_path = db.query(Menu).filter(
@@ -54,8 +48,8 @@ def create_menu(db: Session, menu_data: MenuCreate, login_id: int) -> Dict[str,
             if existing_path:
                 raise HTTPException(status_code=400, detail=f"Menu path '{menu_data.path}' already exists.")
 
-        # Create Menu
-        db_menu = Menu(
+        # Create Menu (the live-name unique index rejects a duplicate name)
+        menu_id = insert_unique(db, live_index(Menu.name), dict(
             name=menu_data.name,
             path=menu_data.path,
             parent_id=menu_data.parent_id,
@@ -66,11 +60,12 @@ def create_menu(db: Session, menu_data: MenuCreate, login_id: int) -> Dict[str,
             is_active=menu_data.is_active if menu_data.is_active is not None else True,
             is_deleted=False,
             created_by=login_id
-        )
-        db.add(db_menu)
+        ))
+        if menu_id is None:
+            raise HTTPException(status_code=400, detail=f"Menu name '{menu_data.name}' already exists.")
         db.commit()
-        db.refresh(db_menu)
-        return map_menu_with_names(db_menu)
+        invalidate_dropdown(DropdownType.menu)
+        return map_menu_with_names(db.get(Menu, menu_id))
 
     except HTTPException:
         raise
@@ -171,16 +166,7 @@ def update_menu(db: Session, menu_id: int, menu_data: MenuUpdate, login_id: int)
             return None
 
         update_data = menu_data.dict(exclude_unset=True)
-
-        # Duplicate name check
-        if "name" in update_data:
-            existing_name = db.query(Menu).filter(
-                func.lower(Menu.name) == update_data["name"].lower(),
-                Menu.id != menu_id,
-                Menu.is_deleted == False
-            ).first()
-            if existing_name:
-                raise HTTPException(status_code=400, detail=f"Menu name '{update_data['name']}' already exists.")
+        name = update_data.get("name", db_menu.name)
 
         # Duplicate path check
         if "path" in update_data and update_data["path"]:
@@ -196,11 +182,18 @@ def update_menu(db: Session, menu_id: int, menu_data: MenuUpdate, login_id: int)
             setattr(db_menu, field, value)
         db_menu.updated_by = login_id
         db.commit()
+        invalidate_dropdown(DropdownType.menu)
         db.refresh(db_menu)
         return map_menu_with_names(db_menu)
 
-    except SQLAlchemyError:
+    except HTTPException:
+        db.rollback()
+        raise
+    except SQLAlchemyError as e:
         db.rollback()
+        if violates(e, live_index(Menu.name)):
+            # Renamed onto another live menu's name (the unique index rejects it)
+            raise HTTPException(status_code=400, detail=f"Menu name '{name}' already exists.")
         raise HTTPException(status_code=500, detail="Database error while updating menu")
     except Exception as e:
         db.rollback()
@@ -216,6 +209,7 @@ def delete_menu(db: Session, menu_id: int, login_id: int) -> Optional[Dict[str,
         db_menu.is_deleted = True
         db_menu.updated_by = login_id
         db.commit()
+        invalidate_dropdown(DropdownType.menu)
         db.refresh(db_menu)
         return map_menu_with_names(db_menu)
 
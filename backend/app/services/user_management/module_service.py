@@ -2,9 +2,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import or_
 from fastapi import HTTPException
-from sqlalchemy import func
-from fastapi import FastAPI,status
 from app.models.user_management.module import Module
+from app.services.user_management.dropdown_service import DropdownType, invalidate as invalidate_dropdown
+from app.utils.unique import insert_unique, live_index, violates
 from app.schemas.user_management.module import ModuleCreate, ModuleOut
 
 # ---------------- Serializer ----------------
@@ -24,33 +24,26 @@ def serialize_module(module: Module) -> dict:
 # ---------------- Create ----------------
 def create_module(db: Session, module_data: ModuleCreate, login_id: int):
     try:
-        # Duplicate check (case-insensitive, only non-deleted)
-        existing_module = db.query(Module).filter(
-            func.lower(Module.name) == module_data.name.lower(),
-            Module.is_deleted == False
-        ).first()
-
-        if existing_module:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Module '{module_data.name}' already exists."
-            )
-
-        # Save exactly as entered
-        db_module = Module(
+        # Save exactly as entered; the live-name unique index (case-insensitive) rejects duplicates
+        module_id = insert_unique(db, live_index(Module.name), dict(
             name=module_data.name.strip(),
             description=module_data.description,
             is_active=module_data.is_active if hasattr(module_data, "is_active") else True,
             is_deleted=False,
             created_by=login_id,
             updated_by=login_id
-        )
+        ))
+
+        if module_id is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Module '{module_data.name}' already exists."
+            )
 
-        db.add(db_module)
         db.commit()
-        db.refresh(db_module)
+        invalidate_dropdown(DropdownType.module)
 
-        return serialize_module(db_module)
+        return serialize_module(db.get(Module, module_id))
 
     except HTTPException:
         raise
@@ -117,6 +110,7 @@ def update_module(db: Session, module_id: int, module_data: ModuleOut, login_id:
             return None
 
         update_data = module_data.dict(exclude_unset=True)
+        name = update_data.get("name", db_module.name)
         for field, value in update_data.items():
             setattr(db_module, field, value)
 
@@ -124,10 +118,17 @@ def update_module(db: Session, module_id: int, module_data: ModuleOut, login_id:
             db_module.updated_by = login_id
 
         db.commit()
+        invalidate_dropdown(DropdownType.module)
         db.refresh(db_module)
         return serialize_module(db_module)
-    except SQLAlchemyError:
+    except HTTPException:
+        db.rollback()
+        raise
+    except SQLAlchemyError as e:
         db.rollback()
+        if violates(e, live_index(Module.name)):
+            # Renamed onto another live module's name (the unique index rejects it)
+            raise HTTPException(status_code=400, detail=f"Module '{name}' already exists.")
         raise HTTPException(status_code=500, detail="Database error while updating module")
     except Exception:
         db.rollback()
@@ -148,6 +149,7 @@ def delete_module(db: Session, module_id: int, login_id: int = None):
             db_module.updated_by = login_id
 
         db.commit()
+        invalidate_dropdown(DropdownType.module)
         db.refresh(db_module)
         return serialize_module(db_module)
     except SQLAlchemyError:
@@ -3,9 +3,9 @@ from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, status
 from sqlalchemy import or_
 from typing import Optional, List, Dict, Any
-from sqlalchemy import func
-from fastapi import FastAPI,status
 from app.models.user_management.permission import Permission
+from app.services.user_management.dropdown_service import DropdownType, invalidate as invalidate_dropdown
+from app.utils.unique import insert_unique, live_index, violates
 from app.schemas.user_management.permission import PermissionCreate, PermissionUpdate
 
 # ---------------- Serializer ----------------
@@ -27,33 +27,26 @@ def serialize_permission(permission: Permission) -> Dict[str, Any]:
 # ---------------- Create ----------------
 def create_permission(db: Session, data: PermissionCreate, login_id: int) -> Dict[str, Any]:
     try:
-        # Duplicate check (case-insensitive, only non-deleted)
-        existing_permission = db.query(Permission).filter(
-            func.lower(Permission.name) == data.name.lower(),
-            Permission.is_deleted == False
-        ).first()
-
-        if existing_permission:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Permission '{data.name}' already exists."
-            )
-
-        # Save exactly as entered
-        db_permission = Permission(
+        # Save exactly as entered; the live-name unique index (case-insensitive) rejects duplicates
+        permission_id = insert_unique(db, live_index(Permission.name), dict(
             name=data.name.strip(),
             description=data.description,
             is_active=data.is_active,
             is_deleted=False,
             created_by=login_id,
             updated_by=login_id
-        )
+        ))
+
+        if permission_id is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Permission '{data.name}' already exists."
+            )
 
-        db.add(db_permission)
         db.commit()
-        db.refresh(db_permission)
+        invalidate_dropdown(DropdownType.permissions)
 
-        return serialize_permission(db_permission)
+        return serialize_permission(db.get(Permission, permission_id))
 
     except HTTPException:
         raise
@@ -122,6 +115,7 @@ def update_permission(db: Session, permission_id: int, data: PermissionUpdate, l
             return None
 
         update_data = data.dict(exclude_unset=True)
+        name = update_data.get("name", db_permission.name)
         for field, value in update_data.items():
             setattr(db_permission, field, value)
 
@@ -129,11 +123,18 @@ def update_permission(db: Session, permission_id: int, data: PermissionUpdate, l
             db_permission.updated_by = login_id
 
         db.commit()
+        invalidate_dropdown(DropdownType.permissions)
         db.refresh(db_permission)
         return serialize_permission(db_permission)
 
+    except HTTPException:
+        db.rollback()
+        raise
     except SQLAlchemyError as e:
         db.rollback()
+        if violates(e, live_index(Permission.name)):
+            # Renamed onto another live permission's name (the unique index rejects it)
+            raise HTTPException(status_code=400, detail=f"Permission '{name}' already exists.")
         raise HTTPException(status_code=500, detail=f"Database error while updating permission: {str(e)}")
     except Exception as e:
         db.rollback()
@@ -155,6 +156,7 @@ def delete_permission(db: Session, permission_id: int, login_id: Optional[int] =
             db_permission.updated_by = login_id
 
         db.commit()
+        invalidate_dropdown(DropdownType.permissions)
         db.refresh(db_permission)
         return serialize_permission(db_permission)
 
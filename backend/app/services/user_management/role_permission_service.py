@@ -9,6 +9,7 @@ from app.models.user_management.role import Role
 from app.models.user_management.module import Module
 from app.models.user_management.menu import Menu
 from app.models.user_management.permission import Permission
+from app.services.user_management.dropdown_service import DropdownType, invalidate as invalidate_dropdown
 from app.schemas.user_management.role_permission import RolePermissionCreate, RolePermissionUpdate
 
 
@@ -90,6 +91,7 @@ def create_or_update_multiple_role_permissions(
             result_list.append(serialize_role_permission(db_rp, db))
 
         db.commit()
+        invalidate_dropdown(DropdownType.role_permissions)
         return result_list
 
     except SQLAlchemyError as e:
@@ -273,6 +275,7 @@ def update_role_permission(
             db_rp.updated_by = login_id
 
         db.commit()
+        invalidate_dropdown(DropdownType.role_permissions)
         db.refresh(db_rp)
         return serialize_role_permission(db_rp, db)
 
@@ -309,6 +312,7 @@ def delete_role_permission(db: Session, rp_id: int, login_id: Optional[int] = No
             db_rp.updated_by = login_id
 
         db.commit()
+        invalidate_dropdown(DropdownType.role_permissions)
         db.refresh(db_rp)
         return serialize_role_permission(db_rp, db)
 
@@ -2,9 +2,11 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, status
 from typing import Optional, Dict, Any
-from sqlalchemy import or_, func
+from sqlalchemy import or_
 
 from app.models.user_management.role import Role
+from app.services.user_management.dropdown_service import DropdownType, invalidate as invalidate_dropdown
+from app.utils.unique import insert_unique, live_index, violates
 from app.schemas.user_management.role import RoleCreate, RoleUpdate
 
 # ---------------- Map Role ----------------
@@ -28,29 +30,22 @@ def map_role_with_names(role: Role) -> Optional[Dict[str, Any]]:
 # ---------------- Create Role with Duplicate Check ----------------
 def create_role(db: Session, role_data: RoleCreate, login_id: int) -> Dict[str, Any]:
     try:
-        # ===== Duplicate Name Check =====
-        existing_role = db.query(Role).filter(
-            func.lower(Role.name) == role_data.name.lower(),
-            Role.is_deleted == False
-        ).first()
-        if existing_role:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Role name '{role_data.name}' already exists."
-            )
-
-        # ===== Create Role =====
-        db_role = Role(
+        # ===== Create Role (the live-name unique index rejects duplicates) =====
+        role_id = insert_unique(db, live_index(Role.name), dict(
             name=role_data.name,
             description=role_data.description,
             is_active=role_data.is_active if role_data.is_active is not None else True,
             is_deleted=False,
             created_by=login_id
-        )
-        db.add(db_role)
+        ))
+        if role_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Role name '{role_data.name}' already exists."
+            )
         db.commit()
-        db.refresh(db_role)
-        return map_role_with_names(db_role)
+        invalidate_dropdown(DropdownType.roles)
+        return map_role_with_names(db.get(Role, role_id))
 
     except HTTPException:
         raise
@@ -108,26 +103,23 @@ def update_role(db: Session, role_id: int, role_data: RoleUpdate, login_id: int)
             return None
 
         update_data = role_data.dict(exclude_unset=True)
-
-        # Duplicate name check
-        if "name" in update_data:
-            existing_role = db.query(Role).filter(
-                func.lower(Role.name) == update_data["name"].lower(),
-                Role.id != role_id,
-                Role.is_deleted == False
-            ).first()
-            if existing_role:
-                raise HTTPException(status_code=400, detail=f"Role name '{update_data['name']}' already exists.")
-
+        name = update_data.get("name", db_role.name)
         for field, value in update_data.items():
             setattr(db_role, field, value)
         db_role.updated_by = login_id
         db.commit()
+        invalidate_dropdown(DropdownType.roles)
         db.refresh(db_role)
         return map_role_with_names(db_role)
 
+    except HTTPException:
+        db.rollback()
+        raise
     except SQLAlchemyError as e:
         db.rollback()
+        if violates(e, live_index(Role.name)):
+            # Renamed onto another live role's name (the unique index rejects it)
+            raise HTTPException(status_code=400, detail=f"Role name '{name}' already exists.")
         raise HTTPException(status_code=500, detail="Database error while updating role")
     except Exception as e:
         db.rollback()
@@ -142,6 +134,7 @@ def delete_role(db: Session, role_id: int, login_id: int) -> Optional[Dict[str,
         db_role.is_deleted = True
         db_role.updated_by = login_id
         db.commit()
+        invalidate_dropdown(DropdownType.roles)
         db.refresh(db_role)
         return map_role_with_names(db_role)
 
@@ -1,10 +1,12 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import or_, func
+from sqlalchemy import or_
 from fastapi import HTTPException, status
 from typing import Optional, Dict, Any
 
 from app.models.user_management.sub_department import SubDepartment
+from app.services.user_management.dropdown_service import DropdownType, invalidate as invalidate_dropdown
+from app.utils.unique import insert_unique, live_index, violates
 from app.schemas.user_management.sub_department import SubDepartmentCreate, SubDepartmentUpdate
 
 # ---------------- Serializer ----------------
@@ -31,19 +33,8 @@ def serialize_sub_department(sub_dept: SubDepartment) -> Optional[Dict[str, Any]
 # ---------------- Create with Duplicate Check ----------------
 def create_sub_department(db: Session, sub_dept_data: SubDepartmentCreate, login_id: int) -> Dict[str, Any]:
     try:
-        # ===== Duplicate Name Check =====
-        existing_sub_dept = db.query(SubDepartment).filter(
-            func.lower(SubDepartment.name) == sub_dept_data.name.lower(),
-            SubDepartment.department_id == sub_dept_data.department_id,
-            SubDepartment.is_deleted == False
-        ).first()
-        if existing_sub_dept:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"SubDepartment '{sub_dept_data.name}' already exists in this department."
-            )
-
-        db_sub_dept = SubDepartment(
+        # ===== Create (the live name-per-department unique index rejects duplicates) =====
+        sub_dept_id = insert_unique(db, live_index(SubDepartment.name), dict(
             name=sub_dept_data.name,
             code=sub_dept_data.code,
             department_id=sub_dept_data.department_id,
@@ -51,11 +42,15 @@ def create_sub_department(db: Session, sub_dept_data: SubDepartmentCreate, login
             is_active=sub_dept_data.is_active if sub_dept_data.is_active is not None else True,
             is_deleted=False,
             created_by=login_id
-        )
-        db.add(db_sub_dept)
+        ))
+        if sub_dept_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"SubDepartment '{sub_dept_data.name}' already exists in this department."
+            )
         db.commit()
-        db.refresh(db_sub_dept)
-        return serialize_sub_department(db_sub_dept)
+        invalidate_dropdown(DropdownType.sub_departments)
+        return serialize_sub_department(db.get(SubDepartment, sub_dept_id))
 
     except HTTPException:
         raise
@@ -118,28 +113,24 @@ def update_sub_department(db: Session, sub_dept_id: int, sub_dept_data: SubDepar
             return None
 
         update_data = sub_dept_data.dict(exclude_unset=True)
-
-        # Duplicate name check
-        if "name" in update_data:
-            existing_sub_dept = db.query(SubDepartment).filter(
-                func.lower(SubDepartment.name) == update_data["name"].lower(),
-                SubDepartment.department_id == (update_data.get("department_id", db_sub_dept.department_id)),
-                SubDepartment.id != sub_dept_id,
-                SubDepartment.is_deleted == False
-            ).first()
-            if existing_sub_dept:
-                raise HTTPException(status_code=400, detail=f"SubDepartment '{update_data['name']}' already exists in this department.")
-
+        name = update_data.get("name", db_sub_dept.name)
         for field, value in update_data.items():
             setattr(db_sub_dept, field, value)
 
         db_sub_dept.updated_by = login_id
         db.commit()
+        invalidate_dropdown(DropdownType.sub_departments)
         db.refresh(db_sub_dept)
         return serialize_sub_department(db_sub_dept)
 
+    except HTTPException:
+        db.rollback()
+        raise
     except SQLAlchemyError as e:
         db.rollback()
+        if violates(e, live_index(SubDepartment.name)):
+            # Renamed or moved onto a live name in the target department (the unique index rejects it)
+            raise HTTPException(status_code=400, detail=f"SubDepartment '{name}' already exists in this department.")
         raise HTTPException(status_code=500, detail="Database error while updating sub department")
     except Exception as e:
         db.rollback()
@@ -154,6 +145,7 @@ def delete_sub_department(db: Session, sub_dept_id: int, login_id: int) -> Optio
         db_sub_dept.is_deleted = True
         db_sub_dept.updated_by = login_id
         db.commit()
+        invalidate_dropdown(DropdownType.sub_departments)
         db.refresh(db_sub_dept)
         return serialize_sub_department(db_sub_dept)
     except SQLAlchemyError as e:
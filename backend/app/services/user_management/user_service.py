@@ -6,10 +6,15 @@ from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, status
 
 from app.models.user_management.user import User
+from app.services.user_management.dropdown_service import DropdownType, invalidate as invalidate_dropdown
 from app.schemas.user_management.user import UserCreate, UserUpdate
+from app.utils.projection import project_rows
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Columns that must never be exposed through `fields=` projections
+USER_PRIVATE_FIELDS = ("password_hash",)
+
 
 # ================= Helpers =================
 
@@ -101,6 +106,7 @@ def create_user(db: Session, user_data: UserCreate, login_id: int) -> User:
 
         db.add(db_user)
         db.commit()
+        invalidate_dropdown(DropdownType.user)
         db.refresh(db_user)
         return map_user_with_names(db_user)
 
@@ -114,7 +120,7 @@ def create_user(db: Session, user_data: UserCreate, login_id: int) -> User:
         raise HTTPException(status_code=500, detail="Something went wrong while creating user")
 
 
-def get_users(db: Session, skip: int = 0, limit: int = 10, search: str = None) -> dict:
+def get_users(db: Session, skip: int = 0, limit: int = 10, search: str = None, fields: Optional[str] = None) -> dict:
     try:
         query = db.query(User).filter(User.is_deleted == False)
 
@@ -129,8 +135,11 @@ def get_users(db: Session, skip: int = 0, limit: int = 10, search: str = None) -
             )
 
         total = query.count()
-        users = query.order_by(User.id.asc()).offset(skip).limit(limit).all()
-        users_data = [map_user_with_names(u) for u in users]
+        page_query = query.order_by(User.id.asc()).offset(skip).limit(limit)
+        if fields:
+            users_data = project_rows(page_query, User, fields, exclude=USER_PRIVATE_FIELDS)
+        else:
+            users_data = [map_user_with_names(u) for u in page_query.all()]
 
         return {
             "users": users_data,
@@ -138,6 +147,8 @@ def get_users(db: Session, skip: int = 0, limit: int = 10, search: str = None) -
             "limit": limit,
             "page": (skip // limit) + 1
         }
+    except HTTPException:
+        raise
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error occurred while fetching users")
     except Exception:
@@ -177,6 +188,7 @@ def update_user(db: Session, user_id: int, user_data: UserUpdate, login_id: int
             db_user.updated_by = login_id
 
         db.commit()
+        invalidate_dropdown(DropdownType.user)
         db.refresh(db_user)
         return map_user_with_names(db_user)
 
@@ -202,6 +214,7 @@ def delete_user(db: Session, user_id: int, login_id: int = None) -> Optional[Use
             db_user.updated_by = login_id
 
         db.commit()
+        invalidate_dropdown(DropdownType.user)
         db.refresh(db_user)
         return map_user_with_names(db_user)
 
@@ -0,0 +1,62 @@
+# app/utils/child_sync.py
+
+from typing import Dict, List, Optional
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+
+def sync_children(
+    db: Session,
+    model,
+    fk_attr: str,
+    parent_id: int,
+    items: Optional[List[BaseModel]],
+    login_id: int,
+) -> Dict[str, int]:
+    """
+    Reconcile a child collection against the payload by id instead of delete + recreate.
+
+    - items without `id` are inserted
+    - items with an `id` update only the columns whose value actually changed
+    - existing rows missing from the payload are deleted in one statement
+    - `items is None` (list omitted by the client) leaves the collection untouched
+    """
+    counts = {"inserted": 0, "updated": 0, "deleted": 0}
+    if items is None:
+        return counts
+
+    fk = getattr(model, fk_attr)
+    existing = {row.id: row for row in db.query(model).filter(fk == parent_id).all()}
+    seen = set()
+
+    for item in items:
+        child_id = getattr(item, "id", None)
+
+        if child_id is None:
+            db.add(model(**{fk_attr: parent_id, "created_by": login_id, **item.dict(exclude={"id"})}))
+            counts["inserted"] += 1
+            continue
+
+        row = existing.get(child_id)
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{model.__name__} id {child_id} does not belong to record {parent_id}"
+            )
+        seen.add(child_id)
+
+        changed = False
+        for field, value in item.dict(exclude={"id"}, exclude_unset=True).items():
+            if getattr(row, field) != value:
+                setattr(row, field, value)
+                changed = True
+        if changed:
+            row.updated_by = login_id
+            counts["updated"] += 1
+
+    stale_ids = [child_id for child_id in existing if child_id not in seen]
+    if stale_ids:
+        counts["deleted"] = db.query(model).filter(model.id.in_(stale_ids)).delete()
+
+    return counts
@@ -0,0 +1,51 @@
+# app/utils/etag.py
+
+import hashlib
+import json
+from typing import Any, Optional
+from fastapi import HTTPException, Response as HTTPResponse, status
+from fastapi.encoders import jsonable_encoder
+
+
+def payload_etag(payload: Any) -> str:
+    """Strong ETag over the JSON form of a response body (changes whenever any nested value does)."""
+    body = json.dumps(jsonable_encoder(payload), sort_keys=True, separators=(",", ":"), default=str)
+    return f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+
+
+def version_etag(*parts: Any) -> str:
+    """ETag from a record's identity and version (e.g. id + updated_at) without building its body."""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def _tags(header: str):
+    # "a", W/"b" -> {"a", "b"}; weak and strong tags compare equal (RFC 9110 weak comparison)
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+def matches(header: Optional[str], etag: str) -> bool:
+    """True when an If-None-Match / If-Match header lists `etag` (or is `*`)."""
+    if not header:
+        return False
+    tags = _tags(header)
+    return "*" in tags or etag in tags
+
+
+def not_modified(etag: str) -> HTTPResponse:
+    return HTTPResponse(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def require_match(header: Optional[str], etag: str, label: str = "Record") -> None:
+    """If-Match check for writes: no header means an unconditional write, a stale tag is a 412."""
+    if header is not None and not matches(header, etag):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"{label} was modified by someone else; reload it and retry"
+        )
+
+
+def mirror_precondition_failure(response: HTTPResponse, error: Exception) -> None:
+    """Conditional requests are answered at the HTTP level, so a 412 is sent as the real status too."""
+    if getattr(error, "status_code", None) == status.HTTP_412_PRECONDITION_FAILED:
+        response.status_code = status.HTTP_412_PRECONDITION_FAILED
@@ -0,0 +1,101 @@
+# app/utils/prefix_index.py
+
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Collection, Dict, Iterable, List, Optional, Set, Tuple
+
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def normalize(text: Optional[str]) -> str:
+    """Case-fold and collapse punctuation/whitespace so `Tata-Motors  Ltd.` == `tata motors ltd`."""
+    return " ".join(_WORD_RE.findall((text or "").casefold()))
+
+
+def word_spans(text: str) -> List[Tuple[int, int]]:
+    """`(start, end)` of every word `normalize` would keep."""
+    return [m.span() for m in _WORD_RE.finditer(text)]
+
+
+class PrefixIndex:
+    """
+    Sorted in-memory index for typeahead lookups.
+
+    Every label is stored under its full normalized form and under each word suffix
+    (`tata motors ltd`, `motors ltd`, `ltd`), so both "tat" and "mot" find the row.
+    A lookup is a bisect plus a scan that stops after `limit` hits: O(log n + limit).
+
+    The index is built lazily by `loader()` (an iterable of `(id, label)`), rebuilt
+    after `ttl` seconds, and dropped immediately by `invalidate()` on local writes.
+    """
+
+    def __init__(self, loader: Callable[[], Iterable[Tuple[int, str]]], ttl: int = 300):
+        self._loader = loader
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # (leading, inner, labels): sorted (key, id) arrays for whole labels and for the
+        # word suffixes after the first word, plus id -> label. Swapped as one tuple so
+        # concurrent readers never see a mix of two builds.
+        self._snapshot: Tuple[List[Tuple[str, int]], List[Tuple[str, int]], Dict[int, str]] = ([], [], {})
+        self._built_at: Optional[float] = None
+
+    def invalidate(self) -> None:
+        self._built_at = None
+
+    def _is_fresh(self) -> bool:
+        return self._built_at is not None and time.monotonic() - self._built_at < self._ttl
+
+    def _ensure_fresh(self) -> None:
+        if self._is_fresh():
+            return
+        with self._lock:
+            if self._is_fresh():
+                return
+            labels: Dict[int, str] = {}
+            leading, inner = [], []
+            for item_id, label in self._loader():
+                labels[item_id] = label
+                words = normalize(label).split(" ")
+                leading.append((" ".join(words), item_id))
+                inner.extend((" ".join(words[i:]), item_id) for i in range(1, len(words)))
+            leading.sort()
+            inner.sort()
+            self._snapshot = (leading, inner, labels)
+            self._built_at = time.monotonic()
+
+    @staticmethod
+    def _scan(postings: List[Tuple[str, int]], prefix: str, limit: int, seen: Set[int]) -> List[int]:
+        found = []
+        for i in range(bisect_left(postings, (prefix,)), len(postings)):
+            key, item_id = postings[i]
+            if len(found) >= limit or not key.startswith(prefix):
+                break
+            if item_id not in seen:
+                seen.add(item_id)
+                found.append(item_id)
+        return found
+
+    def search(self, query: str, limit: int = 10, exclude: Collection[int] = ()) -> List[Tuple[int, str]]:
+        """
+        Up to `limit` `(id, label)` pairs whose label, or one of its words, starts with
+        `query`. Whole-label matches rank ahead of word matches; each group is alphabetical.
+        """
+        self._ensure_fresh()
+        prefix = normalize(query)
+        if not prefix or limit <= 0:
+            return []
+
+        leading, inner, labels = self._snapshot
+        seen = set(exclude)
+        ids = self._scan(leading, prefix, limit, seen)
+        if len(ids) < limit:
+            ids += self._scan(inner, prefix, limit - len(ids), seen)
+        return [(item_id, labels[item_id]) for item_id in ids]
+
+    def all(self) -> List[Tuple[int, str]]:
+        """Every indexed `(id, label)`, ordered by label."""
+        self._ensure_fresh()
+        leading, _, labels = self._snapshot
+        return [(item_id, labels[item_id]) for _, item_id in leading]
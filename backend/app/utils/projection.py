@@ -0,0 +1,103 @@
+# app/utils/projection.py
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from fastapi import HTTPException
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import Session
+
+FieldList = Optional[Union[str, Sequence[str]]]
+
+
+def parse_fields(value: FieldList) -> List[str]:
+    """Turn `a,b,c` (or an already split list) into an ordered, de-duplicated list."""
+    if not value:
+        return []
+    parts = value.split(",") if isinstance(value, str) else value
+    return list(dict.fromkeys(p.strip() for p in parts if p and p.strip()))
+
+
+def primary_key_fields(model) -> List[str]:
+    mapper = inspect(model)
+    return [mapper.get_property_by_column(col).key for col in mapper.primary_key]
+
+
+def resolve_columns(model, fields: FieldList = None, exclude: Iterable[str] = (), always: Optional[Iterable[str]] = None):
+    """
+    Map requested field names to mapped column attributes of `model`.
+    No fields means every column (minus `exclude`). Unknown names raise a 400.
+    `always` (default: the primary key) is prepended to every explicit field list.
+    """
+    excluded = set(exclude)
+    allowed = {
+        attr.key: getattr(model, attr.key)
+        for attr in inspect(model).column_attrs
+        if attr.key not in excluded
+    }
+    if always is None:
+        always = primary_key_fields(model)
+
+    requested = parse_fields(fields)
+    if not requested:
+        return list(allowed.values())
+
+    unknown = [f for f in requested if f not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown field(s): {', '.join(unknown)}")
+
+    keys = list(dict.fromkeys([*always, *requested]))
+    return [allowed[k] for k in keys]
+
+
+def project_rows(query, model, fields: FieldList = None, exclude: Iterable[str] = (), always: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Re-run an ORM query as a column-projected SELECT (no entity hydration, no joined
+    eager loads) and return plain dicts keyed by attribute name.
+    """
+    columns = resolve_columns(model, fields, exclude, always)
+    return [dict(row._mapping) for row in query.with_entities(*columns).all()]
+
+
+def load_children(
+    db: Session,
+    model,
+    fk_attr: str,
+    parent_ids: Sequence[int],
+    fields: FieldList = None,
+) -> Dict[int, List[Dict[str, Any]]]:
+    """Fetch child rows for many parents in one SELECT, grouped by parent id."""
+    grouped: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    if not parent_ids:
+        return grouped
+
+    fk = getattr(model, fk_attr)
+    columns = resolve_columns(model, fields, always=("id", fk_attr))
+    stmt = select(*columns).where(fk.in_(parent_ids)).order_by(fk, model.id)
+    for row in db.execute(stmt):
+        item = dict(row._mapping)
+        grouped[item[fk_attr]].append(item)
+    return grouped
+
+
+def attach_children(
+    db: Session,
+    items: List[Dict[str, Any]],
+    children: Dict[str, tuple],
+    include: FieldList,
+) -> List[Dict[str, Any]]:
+    """
+    Attach the requested child collections to projected parent rows.
+    `children` maps an include name to `(ChildModel, fk_attr)`; one query per include.
+    """
+    names = parse_fields(include)
+    unknown = [n for n in names if n not in children]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown include(s): {', '.join(unknown)}")
+
+    parent_ids = [item["id"] for item in items]
+    for name in names:
+        child_model, fk_attr = children[name]
+        grouped = load_children(db, child_model, fk_attr, parent_ids)
+        for item in items:
+            item[name] = grouped.get(item["id"], [])
+    return items
@@ -0,0 +1,92 @@
+# app/utils/unique.py
+
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import Index, func, literal_column
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+
+def live_unique_index(column, *scope) -> Index:
+    """
+    Unique index on lower(column) (plus any `scope` columns) over rows with
+    is_deleted = false, so a soft-deleted name can be reused. Declared next to the model.
+    Scope columns are keyed as coalesce(column, 0): NULLs never conflict in a unique
+    index, so rows without a parent would otherwise escape the check.
+    """
+    table = column.table
+    live = table.c.is_deleted == False
+    return Index(
+        f"uq_{table.name}_{column.key}_live",
+        func.lower(column), *(func.coalesce(key, literal_column("0")) for key in scope),
+        unique=True,
+        postgresql_where=live,
+        sqlite_where=live,
+        info={"scope": [key.key for key in scope]},
+    )
+
+
+def index_key(index: Index, name: Optional[str], values: Dict[str, Any]) -> Tuple:
+    """The key `values` take in a live_unique_index, as computed by the database."""
+    return ((name or "").lower(), *(values.get(key) or 0 for key in index.info["scope"]))
+
+
+def live_index(column) -> Index:
+    """The index declared with live_unique_index for `column`."""
+    name = f"uq_{column.table.name}_{column.key}_live"
+    return next(index for index in column.table.indexes if index.name == name)
+
+
+def violates(error: Exception, index: Index) -> bool:
+    """
+    Whether `error` is a conflict on `index`; other integrity errors (e.g. a foreign key)
+    are not. PostgreSQL and SQLite both name the index in the message.
+    """
+    return isinstance(error, IntegrityError) and index.name in str(error.orig)
+
+
+def _insert(db: Session, index: Index):
+    """The dialect's INSERT (only those support ON CONFLICT) and the dialect name."""
+    name = db.get_bind().dialect.name
+    return (sqlite if name == "sqlite" else postgresql).insert(index.table), name
+
+
+def _target(index: Index, dialect_name: str) -> Dict[str, Any]:
+    return {
+        "index_elements": list(index.expressions),
+        "index_where": index.dialect_options[dialect_name]["where"],
+    }
+
+
+def _do_nothing(db: Session, index: Index):
+    statement, dialect_name = _insert(db, index)
+    return statement.on_conflict_do_nothing(**_target(index, dialect_name))
+
+
+def insert_unique(db: Session, index: Index, values: Dict[str, Any], returning=None) -> Optional[Any]:
+    """
+    INSERT ... ON CONFLICT (<index>) DO NOTHING RETURNING <primary key>: one round trip,
+    and None instead of a row when a live row already holds the key.
+    """
+    statement = _do_nothing(db, index).values(**values).returning(
+        returning if returning is not None else index.table.primary_key.columns[0]
+    )
+    return db.scalar(statement)
+
+
+def insert_many_unique(db: Session, index: Index, rows: List[Dict[str, Any]], *returning) -> List[Any]:
+    """executemany form of insert_unique; only the rows actually inserted come back."""
+    if not rows:
+        return []
+    return db.execute(_do_nothing(db, index).returning(*returning), rows).all()
+
+
+def upsert(db: Session, index: Index, values: Dict[str, Any], update_values: Dict[str, Any], *returning):
+    """INSERT ... ON CONFLICT (<index>) DO UPDATE SET `update_values` RETURNING `returning`."""
+    statement, dialect_name = _insert(db, index)
+    statement = (
+        statement.values(**values)
+        .on_conflict_do_update(**_target(index, dialect_name), set_=update_values)
+        .returning(*returning)
+    )
+    return db.execute(statement).first()
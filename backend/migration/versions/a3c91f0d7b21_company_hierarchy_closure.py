@@ -0,0 +1,51 @@
+"""Company hierarchy closure table
+
+Revision ID: a3c91f0d7b21
+Revises: 1517b6a3eca9
+Create Date: 2026-10-18 10:12:04.418211
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91f0d7b21'
+down_revision: Union[str, Sequence[str], None] = '1517b6a3eca9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tbl_company_hierarchy',
+    sa.Column('ancestor_id', sa.Integer(), nullable=False),
+    sa.Column('descendant_id', sa.Integer(), nullable=False),
+    sa.Column('depth', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['ancestor_id'], ['tbl_companies.id'], ),
+    sa.ForeignKeyConstraint(['descendant_id'], ['tbl_companies.id'], ),
+    sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id')
+    )
+    op.create_index('ix_company_hierarchy_descendant_depth', 'tbl_company_hierarchy', ['descendant_id', 'depth'], unique=False)
+
+    # Backfill from the existing parent pointers
+    op.execute("""
+        WITH RECURSIVE tree (ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM tbl_companies
+            UNION ALL
+            SELECT t.ancestor_id, c.id, t.depth + 1
+            FROM tbl_companies c
+            JOIN tree t ON c.parent_company_id = t.descendant_id
+            WHERE t.depth < 100
+        )
+        INSERT INTO tbl_company_hierarchy (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM tree
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_company_hierarchy_descendant_depth', table_name='tbl_company_hierarchy')
+    op.drop_table('tbl_company_hierarchy')
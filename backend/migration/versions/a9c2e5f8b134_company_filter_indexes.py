@@ -0,0 +1,46 @@
+"""Indexes for company list filters and facets
+
+Revision ID: a9c2e5f8b134
+Revises: f3b7d1e9a428
+Create Date: 2026-10-18 19:52:44.301876
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c2e5f8b134'
+down_revision: Union[str, Sequence[str], None] = 'f3b7d1e9a428'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_tbl_companies_industry_segment_id'), 'tbl_companies', ['industry_segment_id'], unique=False)
+    op.create_index(op.f('ix_tbl_companies_parent_company_id'), 'tbl_companies', ['parent_company_id'], unique=False)
+    op.create_index(op.f('ix_tbl_companies_account_type_id'), 'tbl_companies', ['account_type_id'], unique=False)
+    op.create_index(op.f('ix_tbl_companies_account_sub_type_id'), 'tbl_companies', ['account_sub_type_id'], unique=False)
+    op.create_index(op.f('ix_tbl_companies_business_type_id'), 'tbl_companies', ['business_type_id'], unique=False)
+    op.create_index(op.f('ix_tbl_companies_account_region_id'), 'tbl_companies', ['account_region_id'], unique=False)
+    op.create_index(op.f('ix_tbl_company_addresses_company_id'), 'tbl_company_addresses', ['company_id'], unique=False)
+    op.create_index(op.f('ix_tbl_company_addresses_country_id'), 'tbl_company_addresses', ['country_id'], unique=False)
+    op.create_index(op.f('ix_tbl_company_addresses_state_id'), 'tbl_company_addresses', ['state_id'], unique=False)
+    op.create_index(op.f('ix_tbl_company_addresses_city_id'), 'tbl_company_addresses', ['city_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_tbl_company_addresses_city_id'), table_name='tbl_company_addresses')
+    op.drop_index(op.f('ix_tbl_company_addresses_state_id'), table_name='tbl_company_addresses')
+    op.drop_index(op.f('ix_tbl_company_addresses_country_id'), table_name='tbl_company_addresses')
+    op.drop_index(op.f('ix_tbl_company_addresses_company_id'), table_name='tbl_company_addresses')
+    op.drop_index(op.f('ix_tbl_companies_account_region_id'), table_name='tbl_companies')
+    op.drop_index(op.f('ix_tbl_companies_business_type_id'), table_name='tbl_companies')
+    op.drop_index(op.f('ix_tbl_companies_account_sub_type_id'), table_name='tbl_companies')
+    op.drop_index(op.f('ix_tbl_companies_account_type_id'), table_name='tbl_companies')
+    op.drop_index(op.f('ix_tbl_companies_parent_company_id'), table_name='tbl_companies')
+    op.drop_index(op.f('ix_tbl_companies_industry_segment_id'), table_name='tbl_companies')
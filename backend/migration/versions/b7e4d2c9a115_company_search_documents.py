@@ -0,0 +1,95 @@
+"""Company search documents
+
+Revision ID: b7e4d2c9a115
+Revises: a3c91f0d7b21
+Create Date: 2026-10-18 13:40:51.207334
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.services.sales import company_search_service
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4d2c9a115'
+down_revision: Union[str, Sequence[str], None] = 'a3c91f0d7b21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(search_title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(search_body, '')), 'B')"
+)
+FTS_TABLE = "tbl_company_search_fts"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tbl_company_search_documents',
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('search_title', sa.String(length=255), nullable=False),
+    sa.Column('search_body', sa.Text(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['tbl_companies.id'], ),
+    sa.PrimaryKeyConstraint('company_id')
+    )
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute(
+            "CREATE INDEX ix_company_search_documents_tsv ON tbl_company_search_documents "
+            f"USING gin (({SEARCH_VECTOR}))"
+        )
+        # Same normalisation as app.utils.prefix_index.normalize: lower-case, punctuation to spaces
+        op.execute("""
+            INSERT INTO tbl_company_search_documents (company_id, search_title, search_body, updated_at)
+            SELECT c.id,
+                   trim(regexp_replace(lower(c.company_name), '[^[:alnum:]]+', ' ', 'g')),
+                   trim(regexp_replace(lower(concat_ws(' ', c.gst_no, c.pan_no, c.website,
+                        (SELECT string_agg(DISTINCT mc.name, ' ')
+                         FROM tbl_company_addresses a JOIN master_cities mc ON mc.id = a.city_id
+                         WHERE a.company_id = c.id AND a.is_deleted = false),
+                        c.company_profile)), '[^[:alnum:]]+', ' ', 'g')),
+                   now()
+            FROM tbl_companies c
+        """)
+    elif dialect == 'sqlite':
+        op.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            "search_title, search_body, content='tbl_company_search_documents', content_rowid='company_id')"
+        )
+        op.execute(
+            "CREATE TRIGGER tbl_company_search_documents_ai AFTER INSERT ON tbl_company_search_documents BEGIN "
+            f"INSERT INTO {FTS_TABLE}(rowid, search_title, search_body) VALUES (new.company_id, new.search_title, new.search_body); END"
+        )
+        op.execute(
+            "CREATE TRIGGER tbl_company_search_documents_ad AFTER DELETE ON tbl_company_search_documents BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_title, search_body) VALUES ('delete', old.company_id, old.search_title, old.search_body); END"
+        )
+        op.execute(
+            "CREATE TRIGGER tbl_company_search_documents_au AFTER UPDATE ON tbl_company_search_documents BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_title, search_body) VALUES ('delete', old.company_id, old.search_title, old.search_body); "
+            f"INSERT INTO {FTS_TABLE}(rowid, search_title, search_body) VALUES (new.company_id, new.search_title, new.search_body); END"
+        )
+    if dialect != 'postgresql':
+        # Normalised in Python here; on SQLite the triggers above fill the FTS table
+        session = Session(bind=op.get_bind())
+        company_search_service.reindex_all(session)
+        session.close()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_company_search_documents_tsv', table_name='tbl_company_search_documents')
+    elif dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS tbl_company_search_documents_au")
+        op.execute("DROP TRIGGER IF EXISTS tbl_company_search_documents_ad")
+        op.execute("DROP TRIGGER IF EXISTS tbl_company_search_documents_ai")
+        op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    op.drop_table('tbl_company_search_documents')
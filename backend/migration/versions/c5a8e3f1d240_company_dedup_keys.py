@@ -0,0 +1,44 @@
+"""Company dedup keys
+
+Revision ID: c5a8e3f1d240
+Revises: b7e4d2c9a115
+Create Date: 2026-10-18 15:02:37.661893
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.services.sales import company_dedup_service
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a8e3f1d240'
+down_revision: Union[str, Sequence[str], None] = 'b7e4d2c9a115'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tbl_company_dedup_keys',
+    sa.Column('key_type', sa.String(length=20), nullable=False),
+    sa.Column('key_value', sa.String(length=255), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['company_id'], ['tbl_companies.id'], ),
+    sa.PrimaryKeyConstraint('key_type', 'key_value', 'company_id')
+    )
+    op.create_index('ix_company_dedup_keys_company', 'tbl_company_dedup_keys', ['company_id'], unique=False)
+    # Keys are computed in Python (name tokens, normalised tax ids), so backfill through
+    # the service; duplicate checks would otherwise pass for every existing company
+    session = Session(bind=op.get_bind())
+    company_dedup_service.reindex_all(session)
+    session.close()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_company_dedup_keys_company', table_name='tbl_company_dedup_keys')
+    op.drop_table('tbl_company_dedup_keys')
@@ -0,0 +1,44 @@
+"""Normalised contact phone / email identifiers
+
+Revision ID: c7e3a1f5b826
+Revises: b4d8f2a6c019
+Create Date: 2026-10-18 21:48:09.270316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.services.sales import contact_identifier_service
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e3a1f5b826'
+down_revision: Union[str, Sequence[str], None] = 'b4d8f2a6c019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tbl_contact_identifiers',
+    sa.Column('kind', sa.String(length=10), nullable=False),
+    sa.Column('value', sa.String(length=150), nullable=False),
+    sa.Column('contact_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['contact_id'], ['tbl_contacts.id'], ),
+    sa.PrimaryKeyConstraint('kind', 'value', 'contact_id')
+    )
+    op.create_index('ix_contact_identifiers_contact', 'tbl_contact_identifiers', ['contact_id'], unique=False)
+    # Identifiers are normalised in Python, so backfill through the service; lookups and
+    # duplicate checks would otherwise miss every existing contact
+    session = Session(bind=op.get_bind())
+    contact_identifier_service.reindex_all(session)
+    session.close()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contact_identifiers_contact', table_name='tbl_contact_identifiers')
+    op.drop_table('tbl_contact_identifiers')
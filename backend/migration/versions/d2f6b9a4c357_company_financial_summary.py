@@ -0,0 +1,65 @@
+"""Company financial summary and currency exchange rates
+
+Revision ID: d2f6b9a4c357
+Revises: c5a8e3f1d240
+Create Date: 2026-10-18 17:26:12.084519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.services.sales import company_financials_service
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f6b9a4c357'
+down_revision: Union[str, Sequence[str], None] = 'c5a8e3f1d240'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('master_currencies', sa.Column('exchange_rate', sa.Numeric(precision=18, scale=6), nullable=True))
+
+    op.create_table('tbl_company_financial_summary',
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('industry_segment_id', sa.Integer(), nullable=True),
+    sa.Column('account_region_id', sa.Integer(), nullable=True),
+    sa.Column('latest_year', sa.Integer(), nullable=True),
+    sa.Column('latest_turnover', sa.Numeric(precision=20, scale=2), nullable=True),
+    sa.Column('previous_year', sa.Integer(), nullable=True),
+    sa.Column('previous_turnover', sa.Numeric(precision=20, scale=2), nullable=True),
+    sa.Column('yoy_growth', sa.Numeric(precision=12, scale=4), nullable=True),
+    sa.Column('latest_profit', sa.Numeric(precision=20, scale=2), nullable=True),
+    sa.Column('profit_margin', sa.Numeric(precision=12, scale=4), nullable=True),
+    sa.Column('revenue_band', sa.String(length=20), nullable=True),
+    sa.Column('has_unconverted', sa.Boolean(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['tbl_companies.id'], ),
+    sa.PrimaryKeyConstraint('company_id')
+    )
+    op.create_index('ix_company_financial_summary_turnover', 'tbl_company_financial_summary', ['latest_turnover'], unique=False)
+    op.create_index('ix_company_financial_summary_growth', 'tbl_company_financial_summary', ['yoy_growth'], unique=False)
+    op.create_index('ix_company_financial_summary_band', 'tbl_company_financial_summary', ['revenue_band'], unique=False)
+    op.create_index('ix_company_financial_summary_segment', 'tbl_company_financial_summary', ['industry_segment_id'], unique=False)
+    op.create_index('ix_company_financial_summary_region', 'tbl_company_financial_summary', ['account_region_id'], unique=False)
+    # Backfill through the service so analytics cover existing companies; rerun
+    # POST /sales/analytics/refresh once exchange rates are set
+    session = Session(bind=op.get_bind())
+    company_financials_service.refresh_all(session)
+    session.close()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_company_financial_summary_region', table_name='tbl_company_financial_summary')
+    op.drop_index('ix_company_financial_summary_segment', table_name='tbl_company_financial_summary')
+    op.drop_index('ix_company_financial_summary_band', table_name='tbl_company_financial_summary')
+    op.drop_index('ix_company_financial_summary_growth', table_name='tbl_company_financial_summary')
+    op.drop_index('ix_company_financial_summary_turnover', table_name='tbl_company_financial_summary')
+    op.drop_table('tbl_company_financial_summary')
+    op.drop_column('master_currencies', 'exchange_rate')
@@ -0,0 +1,36 @@
+"""Packed contact communication preferences
+
+Revision ID: d5f9b3c7e214
+Revises: c7e3a1f5b826
+Create Date: 2026-10-18 22:31:44.806152
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f9b3c7e214'
+down_revision: Union[str, Sequence[str], None] = 'c7e3a1f5b826'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Generated from the dont_* flags, so existing rows are filled in by the ALTER itself
+    op.add_column('tbl_contacts', sa.Column('comm_prefs', sa.SmallInteger(), sa.Computed(
+        '(CASE WHEN dont_solicit THEN 1 ELSE 0 END) + (CASE WHEN dont_mail THEN 2 ELSE 0 END) + '
+        '(CASE WHEN dont_fax THEN 4 ELSE 0 END) + (CASE WHEN dont_email THEN 8 ELSE 0 END) + '
+        '(CASE WHEN dont_call THEN 16 ELSE 0 END)',
+        persisted=True
+    ), nullable=True))
+    op.create_index('ix_contacts_comm_prefs_company', 'tbl_contacts', ['comm_prefs', 'company_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_comm_prefs_company', table_name='tbl_contacts')
+    op.drop_column('tbl_contacts', 'comm_prefs')
@@ -0,0 +1,37 @@
+"""Company account score
+
+Revision ID: e8a1c4b7f062
+Revises: d2f6b9a4c357
+Create Date: 2026-10-18 18:04:37.216904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a1c4b7f062'
+down_revision: Union[str, Sequence[str], None] = 'd2f6b9a4c357'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tbl_companies', sa.Column('account_score', sa.Numeric(precision=5, scale=2), nullable=True))
+    op.add_column('tbl_companies', sa.Column('score_stale', sa.Boolean(), server_default=sa.text('true'), nullable=True))
+    op.add_column('tbl_companies', sa.Column('scored_at', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_tbl_companies_account_score'), 'tbl_companies', ['account_score'], unique=False)
+    op.create_index(op.f('ix_tbl_companies_score_stale'), 'tbl_companies', ['score_stale'], unique=False)
+    # Every existing company starts stale; score them with POST /sales/companies/scores/recompute
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_tbl_companies_score_stale'), table_name='tbl_companies')
+    op.drop_index(op.f('ix_tbl_companies_account_score'), table_name='tbl_companies')
+    op.drop_column('tbl_companies', 'scored_at')
+    op.drop_column('tbl_companies', 'score_stale')
+    op.drop_column('tbl_companies', 'account_score')
@@ -0,0 +1,56 @@
+"""Geo hierarchy: state -> country and city -> state links, zip code ranges
+
+Revision ID: e8a4c2f6d913
+Revises: d5f9b3c7e214
+Create Date: 2026-10-19 00:12:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a4c2f6d913'
+down_revision: Union[str, Sequence[str], None] = 'd5f9b3c7e214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('master_states', sa.Column('country_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_master_states_country_id'), 'master_states', ['country_id'], unique=False)
+    op.create_foreign_key('fk_master_states_country_id', 'master_states', 'master_countries', ['country_id'], ['id'], ondelete='SET NULL')
+    op.add_column('master_cities', sa.Column('state_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_master_cities_state_id'), 'master_cities', ['state_id'], unique=False)
+    op.create_foreign_key('fk_master_cities_state_id', 'master_cities', 'master_states', ['state_id'], ['id'], ondelete='SET NULL')
+    op.create_table('master_zip_ranges',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('city_id', sa.Integer(), nullable=False),
+    sa.Column('zip_from', sa.BigInteger(), nullable=False),
+    sa.Column('zip_to', sa.BigInteger(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.CheckConstraint('zip_from <= zip_to', name='ck_zip_ranges_order'),
+    sa.ForeignKeyConstraint(['city_id'], ['master_cities.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['created_by'], ['tbl_users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_zip_ranges_from', 'master_zip_ranges', ['zip_from'], unique=False)
+    op.create_index(op.f('ix_master_zip_ranges_city_id'), 'master_zip_ranges', ['city_id'], unique=False)
+    # Existing states / cities keep a NULL parent until they are edited
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_master_zip_ranges_city_id'), table_name='master_zip_ranges')
+    op.drop_index('ix_zip_ranges_from', table_name='master_zip_ranges')
+    op.drop_table('master_zip_ranges')
+    op.drop_constraint('fk_master_cities_state_id', 'master_cities', type_='foreignkey')
+    op.drop_index(op.f('ix_master_cities_state_id'), table_name='master_cities')
+    op.drop_column('master_cities', 'state_id')
+    op.drop_constraint('fk_master_states_country_id', 'master_states', type_='foreignkey')
+    op.drop_index(op.f('ix_master_states_country_id'), table_name='master_states')
+    op.drop_column('master_states', 'country_id')
@@ -0,0 +1,66 @@
+"""Partial unique indexes on lower(name) for live master / user-management rows
+
+Revision ID: f2b6d8a4c157
+Revises: e8a4c2f6d913
+Create Date: 2026-10-19 00:58:21.904417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b6d8a4c157'
+down_revision: Union[str, Sequence[str], None] = 'e8a4c2f6d913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, name column, extra key columns)
+LIVE_NAMES = (
+    ('mst_business_verticals', 'name', ()),
+    ('mst_regions', 'name', ()),
+    ('mst_company_type', 'name', ()),
+    ('mst_head_of_company', 'name', ()),
+    ('mst_job_function', 'name', ()),
+    ('master_partner_types', 'name', ()),
+    ('mst_product_service_interest', 'name', ()),
+    ('master_account_types', 'name', ()),
+    ('master_business_types', 'name', ()),
+    ('master_industry_segments', 'name', ()),
+    ('master_sub_industry_segments', 'name', ()),
+    ('master_address_types', 'name', ()),
+    ('master_countries', 'name', ()),
+    ('master_states', 'name', ('country_id',)),
+    ('master_cities', 'name', ('state_id',)),
+    ('document_types', 'document_type_name', ()),
+    ('master_currencies', 'currency_code', ()),
+    ('mst_roles', 'name', ()),
+    ('mst_departments', 'name', ()),
+    ('mst_sub_departments', 'name', ('department_id',)),
+    ('mst_designations', 'name', ()),
+    ('mst_permissions', 'name', ()),
+    ('mst_modules', 'name', ()),
+    ('mst_menus', 'name', ()),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fails if a table already holds live names differing only in case; clean those up first.
+    # Parent ids are coalesced so rows without a parent still collide (NULLs never do).
+    for table, column, scope in LIVE_NAMES:
+        op.create_index(
+            f'uq_{table}_{column}_live', table,
+            [sa.text(f'lower({column})'), *(sa.text(f'coalesce({key}, 0)') for key in scope)],
+            unique=True,
+            postgresql_where=sa.text('is_deleted = false'),
+            sqlite_where=sa.text('is_deleted = 0')
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, _ in reversed(LIVE_NAMES):
+        op.drop_index(f'uq_{table}_{column}_live', table_name=table)
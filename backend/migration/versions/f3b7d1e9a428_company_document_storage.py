@@ -0,0 +1,53 @@
+"""Content-addressed company documents and resumable uploads
+
+Revision ID: f3b7d1e9a428
+Revises: e8a1c4b7f062
+Create Date: 2026-10-18 18:41:09.553127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b7d1e9a428'
+down_revision: Union[str, Sequence[str], None] = 'e8a1c4b7f062'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tbl_company_documents', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('tbl_company_documents', sa.Column('content_type', sa.String(length=100), nullable=True))
+    op.create_index(op.f('ix_tbl_company_documents_content_hash'), 'tbl_company_documents', ['content_hash'], unique=False)
+
+    op.create_table('tbl_company_document_uploads',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('document_type_id', sa.Integer(), nullable=True),
+    sa.Column('file_name', sa.String(length=255), nullable=False),
+    sa.Column('content_type', sa.String(length=100), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('total_size', sa.BigInteger(), nullable=False),
+    sa.Column('received_size', sa.BigInteger(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['tbl_companies.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_tbl_company_document_uploads_company_id'), 'tbl_company_document_uploads', ['company_id'], unique=False)
+    op.create_index(op.f('ix_tbl_company_document_uploads_updated_at'), 'tbl_company_document_uploads', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_tbl_company_document_uploads_updated_at'), table_name='tbl_company_document_uploads')
+    op.drop_index(op.f('ix_tbl_company_document_uploads_company_id'), table_name='tbl_company_document_uploads')
+    op.drop_table('tbl_company_document_uploads')
+    op.drop_index(op.f('ix_tbl_company_documents_content_hash'), table_name='tbl_company_documents')
+    op.drop_column('tbl_company_documents', 'content_type')
+    op.drop_column('tbl_company_documents', 'content_hash')
@@ -0,0 +1,66 @@
+import os
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+# The app reads its settings at import time: point it at a throwaway SQLite database first
+_WORK_DIR = tempfile.mkdtemp(prefix="crm-tests-")
+os.environ["DB_URL"] = f"sqlite:///{os.path.join(_WORK_DIR, 'test.db')}"
+os.environ["DOCUMENT_STORAGE_DIR"] = os.path.join(_WORK_DIR, "documents")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from app.main import app  # noqa: E402
+from app.core import auth_service  # noqa: E402
+from app.database.db import SessionLocal  # noqa: E402
+
+
+class _User:
+    id = 1
+    assign_modules = "1,2"
+    role_id = 1
+
+
+@pytest.fixture(scope="session")
+def client():
+    app.dependency_overrides[auth_service.get_current_user] = lambda: _User()
+    for route in app.routes:
+        for dependency in getattr(getattr(route, "dependant", None), "dependencies", []):
+            if dependency.call and dependency.call.__qualname__.startswith("check_permission"):
+                app.dependency_overrides[dependency.call] = lambda: None
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def unique():
+    """Collision-free names: every test shares the one database."""
+    return lambda prefix: f"{prefix} {uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def make_company(client, unique):
+    def create(**fields):
+        body = {"company_name": unique("Company"), **fields}
+        result = client.post("/api/v1/sales/companies/", json=body).json()
+        assert result["status_code"] == 201, result
+        return result["data"]
+    return create
+
+
+@pytest.fixture
+def make_contact(client, make_company):
+    def create(company_id=None, **fields):
+        body = {"first_name": "Test", "company_id": company_id or make_company()["id"], **fields}
+        return client.post("/api/v1/sales/contacts/", json=body).json()
+    return create
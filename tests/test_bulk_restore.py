@@ -0,0 +1,51 @@
+import uuid
+
+
+def _pan():
+    return uuid.uuid4().hex[:10].upper()
+
+
+def _bulk(client, action, ids):
+    result = client.post(f"/api/v1/sales/companies/bulk/{action}", json={"ids": ids}).json()
+    assert result["status_code"] == 200, result
+    return result["data"]
+
+
+def test_restore_skips_company_whose_pan_is_taken(client, make_company):
+    pan = _pan()
+    deleted = make_company(pan_no=pan)
+    _bulk(client, "delete", [deleted["id"]])
+    holder = make_company(pan_no=pan)
+    free = make_company()
+    _bulk(client, "delete", [free["id"]])
+
+    summary = _bulk(client, "restore", [deleted["id"], free["id"]])
+
+    assert summary["affected_ids"] == [free["id"]]
+    assert summary["conflicts"] == [{"id": deleted["id"], "error": f"PAN '{pan}' already exists on company {holder['id']}"}]
+    assert client.get(f"/api/v1/sales/companies/{deleted['id']}").json()["status_code"] == 404
+
+
+def test_restore_of_two_clashing_companies_keeps_the_lower_id(client, make_company):
+    pan = _pan()
+    first = make_company(pan_no=pan)
+    _bulk(client, "delete", [first["id"]])
+    second = make_company(pan_no=pan)
+    _bulk(client, "delete", [second["id"]])
+
+    summary = _bulk(client, "restore", [first["id"], second["id"]])
+
+    assert summary["affected_ids"] == [first["id"]]
+    assert [conflict["id"] for conflict in summary["conflicts"]] == [second["id"]]
+
+
+def test_restore_brings_company_back(client, make_company, unique):
+    name = unique("Restorable")
+    company = make_company(company_name=name)
+    _bulk(client, "delete", [company["id"]])
+
+    _bulk(client, "restore", [company["id"]])
+
+    fetched = client.get(f"/api/v1/sales/companies/{company['id']}").json()
+    assert fetched["status_code"] == 200
+    assert fetched["data"]["company_name"] == name
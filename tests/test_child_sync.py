@@ -0,0 +1,34 @@
+def _update(client, company, **fields):
+    body = {"company_name": company["company_name"], **fields}
+    return client.put(f"/api/v1/sales/companies/{company['id']}", json=body).json()
+
+
+def test_addresses_are_reconciled_by_id(client, make_company):
+    company = make_company(addresses=[{"address": "Old street"}, {"address": "Gone street"}])
+    kept = next(a for a in company["addresses"] if a["address"] == "Old street")
+
+    result = _update(client, company, addresses=[{"id": kept["id"], "address": "New street"}, {"address": "Added street"}])
+
+    assert result["status_code"] == 200, result
+    addresses = {a["address"]: a["id"] for a in result["data"]["addresses"]}
+    assert set(addresses) == {"New street", "Added street"}
+    assert addresses["New street"] == kept["id"]
+
+
+def test_omitted_collection_is_left_untouched(client, make_company):
+    company = make_company(addresses=[{"address": "Main street"}])
+
+    result = _update(client, company, website="https://example.com")
+
+    assert result["status_code"] == 200, result
+    assert [a["id"] for a in result["data"]["addresses"]] == [company["addresses"][0]["id"]]
+
+
+def test_foreign_child_id_is_rejected(client, make_company):
+    other = make_company(addresses=[{"address": "Elsewhere"}])
+    company = make_company()
+
+    result = _update(client, company, addresses=[{"id": other["addresses"][0]["id"], "address": "Hijacked"}])
+
+    assert result["status_code"] == 400
+    assert "does not belong" in result["message"]
@@ -0,0 +1,40 @@
+def _reparent(client, company, parent_id):
+    body = {"company_name": company["company_name"], "is_child": parent_id is not None, "parent_company_id": parent_id}
+    return client.put(f"/api/v1/sales/companies/{company['id']}", json=body).json()
+
+
+def _ancestor_ids(client, company_id):
+    result = client.get(f"/api/v1/sales/companies/{company_id}/ancestors").json()
+    assert result["status_code"] == 200, result
+    return [a["id"] for a in result["data"]]
+
+
+def test_reparent_under_own_descendant_is_rejected(client, make_company):
+    root = make_company()
+    child = make_company(is_child=True, parent_company_id=root["id"])
+    grandchild = make_company(is_child=True, parent_company_id=child["id"])
+
+    result = _reparent(client, root, grandchild["id"])
+
+    assert result["status_code"] == 400
+    assert "cycle" in result["message"]
+    assert _ancestor_ids(client, grandchild["id"]) == [child["id"], root["id"]]
+
+
+def test_company_cannot_be_its_own_parent(client, make_company):
+    company = make_company()
+
+    result = _reparent(client, company, company["id"])
+
+    assert result["status_code"] == 400
+    assert "cycle" in result["message"]
+
+
+def test_reparent_moves_the_whole_subtree(client, make_company):
+    old_root, new_root = make_company(), make_company()
+    child = make_company(is_child=True, parent_company_id=old_root["id"])
+    grandchild = make_company(is_child=True, parent_company_id=child["id"])
+
+    assert _reparent(client, child, new_root["id"])["status_code"] == 200
+
+    assert _ancestor_ids(client, grandchild["id"]) == [child["id"], new_root["id"]]
@@ -0,0 +1,47 @@
+def _merge(client, target_id, source_ids):
+    return client.post(f"/api/v1/sales/companies/{target_id}/merge", json={"source_ids": source_ids}).json()
+
+
+def _company(client, company_id):
+    return client.get(f"/api/v1/sales/companies/{company_id}").json()
+
+
+def test_merge_moves_children_and_drops_duplicate_years(client, make_company, make_contact):
+    target = make_company(turnover_records=[{"year": 2023, "revenue": "100"}])
+    source = make_company(turnover_records=[{"year": 2023, "revenue": "90"}, {"year": 2024, "revenue": "120"}])
+    contact = make_contact(source["id"])
+    subsidiary = make_company(is_child=True, parent_company_id=source["id"])
+
+    result = _merge(client, target["id"], [source["id"]])
+
+    assert result["status_code"] == 200, result
+    summary = result["data"]
+    assert summary["contacts_moved"] == 1
+    assert summary["turnover_records_moved"] == 1
+    assert summary["turnover_records_duplicates_removed"] == 1
+    assert summary["child_companies_moved"] == 1
+
+    merged = _company(client, target["id"])["data"]
+    assert sorted((r["year"], float(r["revenue"])) for r in merged["turnover_records"]) == [(2023, 100.0), (2024, 120.0)]
+    assert client.get(f"/api/v1/sales/contacts/{contact['data']['id']}").json()["data"]["company_id"] == target["id"]
+    assert _company(client, subsidiary["id"])["data"]["parent_company_id"] == target["id"]
+    assert _company(client, source["id"])["status_code"] == 404
+
+
+def test_merge_into_itself_is_rejected(client, make_company):
+    company = make_company()
+
+    result = _merge(client, company["id"], [company["id"]])
+
+    assert result["status_code"] == 400
+    assert "into itself" in result["message"]
+
+
+def test_merge_ancestor_into_descendant_is_rejected(client, make_company):
+    parent = make_company()
+    child = make_company(is_child=True, parent_company_id=parent["id"])
+
+    result = _merge(client, child["id"], [parent["id"]])
+
+    assert result["status_code"] == 400
+    assert "descendant" in result["message"]
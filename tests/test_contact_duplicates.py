@@ -0,0 +1,69 @@
+import random
+import uuid
+
+
+def _email():
+    return f"{uuid.uuid4().hex[:10]}@example.com"
+
+
+def _phone():
+    return f"9{random.randrange(10 ** 9):09d}"
+
+
+def test_create_rejects_email_of_live_contact_case_insensitively(make_contact):
+    email = _email()
+    first = make_contact(email=email)
+
+    result = make_contact(email=email.upper())
+
+    assert result["status_code"] == 400
+    assert f"already exists on contact {first['data']['id']}" in result["message"]
+
+
+def test_create_rejects_same_phone_in_another_format(make_contact):
+    phone = _phone()
+    assert make_contact(primary_no=phone)["status_code"] == 201
+
+    result = make_contact(secondary_no=f"+91 {phone[:5]}-{phone[5:]}")
+
+    assert result["status_code"] == 400
+    assert "Phone" in result["message"]
+
+
+def test_update_rejects_identifier_of_another_contact(client, make_contact):
+    taken = _email()
+    holder = make_contact(email=taken)["data"]
+    contact = make_contact(email=_email())["data"]
+    url = f"/api/v1/sales/contacts/{contact['id']}"
+
+    result = client.put(url, json={"first_name": "Test", "company_id": contact["company_id"], "email": taken}).json()
+
+    assert result["status_code"] == 400
+    assert f"already exists on contact {holder['id']}" in result["message"]
+    assert client.get(url).json()["data"]["email"] == contact["email"]
+
+
+def test_update_keeping_own_identifiers_is_allowed(client, make_contact):
+    contact = make_contact(email=_email(), primary_no=_phone())["data"]
+
+    result = client.put(
+        f"/api/v1/sales/contacts/{contact['id']}",
+        json={"first_name": "Renamed", "company_id": contact["company_id"], "email": contact["email"]}
+    ).json()
+
+    assert result["status_code"] == 200, result
+
+
+def test_bulk_restore_skips_contact_whose_email_is_taken(client, make_contact):
+    email = _email()
+    deleted = make_contact(email=email)["data"]
+    assert client.delete(f"/api/v1/sales/contacts/{deleted['id']}").json()["status_code"] == 200
+    holder = make_contact(email=email)["data"]
+
+    result = client.post("/api/v1/sales/contacts/bulk/restore", json={"ids": [deleted["id"]]}).json()
+
+    assert result["status_code"] == 200, result
+    assert result["data"]["affected_ids"] == []
+    assert result["data"]["conflicts"] == [
+        {"id": deleted["id"], "error": f"Email '{email}' already exists on contact {holder['id']}"}
+    ]
@@ -0,0 +1,48 @@
+def _url(company):
+    return f"/api/v1/sales/companies/{company['id']}"
+
+
+def test_unchanged_company_revalidates_with_304(client, make_company):
+    company = make_company()
+    etag = client.get(_url(company)).headers["ETag"]
+
+    response = client.get(_url(company), headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_changed_company_is_resent(client, make_company):
+    company = make_company()
+    etag = client.get(_url(company)).headers["ETag"]
+    client.put(_url(company), json={"company_name": company["company_name"], "website": "https://example.com"})
+
+    response = client.get(_url(company), headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["data"]["website"] == "https://example.com"
+
+
+def test_stale_if_match_is_refused_with_412(client, make_company):
+    company = make_company()
+    stale = client.get(_url(company)).headers["ETag"]
+    first = client.put(_url(company), json={"company_name": company["company_name"], "website": "https://a.example"}, headers={"If-Match": stale})
+    assert first.status_code == 200
+
+    second = client.put(_url(company), json={"company_name": company["company_name"], "website": "https://b.example"}, headers={"If-Match": stale})
+
+    assert second.status_code == 412
+    assert client.get(_url(company)).json()["data"]["website"] == "https://a.example"
+
+
+def test_stale_if_match_blocks_contact_update(client, make_contact):
+    contact = make_contact()["data"]
+    url = f"/api/v1/sales/contacts/{contact['id']}"
+    stale = client.get(url).headers["ETag"]
+    body = {"first_name": "Renamed", "company_id": contact["company_id"]}
+    assert client.put(url, json=body, headers={"If-Match": stale}).status_code == 200
+
+    response = client.put(url, json={**body, "first_name": "Again"}, headers={"If-Match": stale})
+
+    assert response.status_code == 412
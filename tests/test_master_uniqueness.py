@@ -0,0 +1,79 @@
+import pytest
+
+
+@pytest.fixture
+def make_country(client, unique):
+    def create():
+        result = client.post("/api/v1/countries/", json={"name": unique("Country")}).json()
+        assert result["status_code"] == 201, result
+        return result["data"]
+    return create
+
+
+def _create_state(client, name, country_id=None):
+    return client.post("/api/v1/states/", json={"name": name, "country_id": country_id}).json()
+
+
+@pytest.mark.parametrize("with_parent", [True, False], ids=["in-country", "no-country"])
+def test_create_rejects_duplicate_name_ignoring_case(client, make_country, unique, with_parent):
+    country_id = make_country()["id"] if with_parent else None
+    name = unique("State")
+    assert _create_state(client, name, country_id)["status_code"] == 201
+
+    result = _create_state(client, name.upper(), country_id)
+
+    assert result["status_code"] == 400
+    assert "already exists" in result["message"]
+
+
+def test_same_name_is_allowed_under_another_parent(client, make_country, unique):
+    name = unique("State")
+    assert _create_state(client, name, make_country()["id"])["status_code"] == 201
+
+    assert _create_state(client, name, make_country()["id"])["status_code"] == 201
+    assert _create_state(client, name)["status_code"] == 201
+
+
+def test_name_is_free_again_after_delete(client, unique):
+    name = unique("State")
+    state = _create_state(client, name)["data"]
+    assert client.delete(f"/api/v1/states/{state['id']}").json()["status_code"] == 200
+
+    assert _create_state(client, name)["status_code"] == 201
+
+
+def test_rename_onto_live_name_is_rejected(client, make_country, unique):
+    country_id = make_country()["id"]
+    taken = unique("State")
+    _create_state(client, taken, country_id)
+    state = _create_state(client, unique("State"), country_id)["data"]
+
+    result = client.put(f"/api/v1/states/{state['id']}", json={"name": taken, "country_id": country_id}).json()
+
+    assert result["status_code"] == 400
+    assert "already exists" in result["message"]
+
+
+@pytest.mark.parametrize("with_parent", [True, False], ids=["in-country", "no-country"])
+def test_upsert_updates_the_existing_record(client, make_country, unique, with_parent):
+    country_id = make_country()["id"] if with_parent else None
+    name = unique("State")
+
+    created = client.post("/api/v1/states/upsert", json={"name": name, "country_id": country_id})
+    updated = client.post("/api/v1/states/upsert", json={"name": name.lower(), "country_id": country_id, "description": "Second"})
+
+    assert created.status_code == 201
+    assert updated.status_code == 200
+    assert updated.json()["data"]["id"] == created.json()["data"]["id"]
+    assert updated.json()["data"]["description"] == "Second"
+
+
+def test_role_rename_onto_live_name_is_rejected(client, unique):
+    taken = unique("Role")
+    assert client.post("/api/v1/roles/", json={"name": taken}).json()["status_code"] == 201
+    role = client.post("/api/v1/roles/", json={"name": unique("Role")}).json()["data"]
+
+    result = client.put(f"/api/v1/roles/{role['id']}", json={"name": taken}).json()
+
+    assert result["status_code"] == 400
+    assert f"Role name '{taken}' already exists" in result["message"]